@@ -0,0 +1,428 @@
+#!/usr/bin/env python3
+"""
+Governance Gate Benchmark Suite
+
+Purpose: Time the locked section validator and the inventory generator end to end
+         and per phase on a synthetic governance tree, and catch regressions
+         against a saved JSON baseline
+Authority: governance/canon/AGENT_CONTRACT_PROTECTION_PROTOCOL.md
+Version: 1.0.0
+
+The synthetic tree is a git repository with N canons and a matching central
+CANON_INVENTORY.json, M agent contracts with K locked sections each, a
+protection registry registering (and fingerprinting) every lock, and a head
+commit that edits D contracts so the diff-based modes have work to do.
+
+Usage:
+    python .github/scripts/benchmark_governance_gates.py [--canons N] [--contracts M]
+        [--sections K] [--lines L] [--diff-files D] [--registry-padding R] [--repeat N]
+        [--save-baseline PATH] [--baseline PATH] [--threshold 0.25] [--json PATH]
+
+Exit Codes:
+  0 = benchmarks ran (and no regression against --baseline)
+  1 = at least one timing regressed beyond --threshold
+  2 = invalid usage (e.g. baseline recorded with different tree parameters)
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / 'scripts'))
+
+from benchmark_locked_sections import PROSE, synthetic_contract  # noqa: E402
+from check_locked_sections import LockedSectionValidator  # noqa: E402
+import sync_repo_inventory  # noqa: E402
+
+BASELINE_VERSION = 1
+LAYER_DOWN_STATUSES = ['PUBLIC_API', 'INTERNAL', 'OPTIONAL']
+CONTRACTS_DIR = '.github/agents'
+REGISTRY_FILE = 'governance/contracts/protection-registry.md'
+
+# Synthetic files are backdated so stat-keyed caches treat them as settled
+# rather than racy, as in a real checkout
+BACKDATE_SECONDS = 3600
+
+
+def _git(tree: Path, *args: str):
+    subprocess.run(
+        ['git', '-c', 'user.name=benchmark', '-c', 'user.email=benchmark@example.invalid', *args],
+        cwd=tree, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+
+
+def _backdate(paths: List[Path]):
+    past = time.time() - BACKDATE_SECONDS
+    for path in paths:
+        os.utime(path, (past, past))
+
+
+def synthetic_canon(rng: random.Random, index: int, lines: int) -> str:
+    out = [
+        f"# SYNTHETIC CANON {index:05d}",
+        "",
+        "**Version**: 1.0.0",
+        "**Date**: 2026-01-01",
+        "**Authority**: Supreme - Canonical",
+        "",
+        "## Purpose",
+        "",
+        f"Synthetic canon {index} used to benchmark the governance gates.",
+        "",
+    ]
+    out.extend(rng.choice(PROSE) for _ in range(lines))
+    return "\n".join(out) + "\n"
+
+
+def build_tree(tree: Path, args: argparse.Namespace) -> Tuple[str, str]:
+    """
+    Write the synthetic governance tree and commit it twice (base, then head
+    with --diff-files contracts edited). Returns the (base, head) commit ids.
+    """
+    rng = random.Random(args.seed)
+    written: List[Path] = []
+    
+    canon_dir = tree / 'governance' / 'canon'
+    canon_dir.mkdir(parents=True)
+    canons = []
+    for i in range(args.canons):
+        data = synthetic_canon(rng, i, args.canon_lines).encode('utf-8')
+        digest = hashlib.sha256(data).hexdigest()[:sync_repo_inventory.SHA256_TRUNCATE_LENGTH]
+        filename = f"SYNTHETIC_CANON_{i:05d}.md"
+        # About 5% of central canons are missing locally and 5% have drifted
+        if i % 20 != 19:
+            (canon_dir / filename).write_bytes(data)
+            written.append(canon_dir / filename)
+        canons.append({
+            'filename': filename,
+            'version': '1.0.0',
+            'file_hash': digest if i % 20 != 18 else '000000000000',
+            'type': 'canon',
+            'path': f'governance/canon/{filename}',
+            'layer_down_status': LAYER_DOWN_STATUSES[i % len(LAYER_DOWN_STATUSES)],
+        })
+    inventory_path = tree / 'governance' / 'CANON_INVENTORY.json'
+    inventory_path.write_text(json.dumps({'version': '1.0.0', 'canons': canons}, indent=2))
+    written.append(inventory_path)
+    
+    contracts_dir = tree / CONTRACTS_DIR
+    contracts_dir.mkdir(parents=True)
+    contract_files = []
+    for i in range(args.contracts):
+        contract_file = contracts_dir / f"agent-{i:04d}.agent.md"
+        contract_file.write_text(synthetic_contract(rng, args.lines, args.sections, i, oddities=False))
+        contract_files.append(contract_file)
+    written.extend(contract_files)
+    
+    # Fingerprints come from the validator itself so verify-integrity passes
+    cwd = os.getcwd()
+    os.chdir(tree)
+    try:
+        validator = LockedSectionValidator(CONTRACTS_DIR, jobs=args.jobs)
+        validator.scan_contracts()
+    finally:
+        os.chdir(cwd)
+    by_file: Dict[str, List] = {}
+    for section in validator.locked_sections:
+        by_file.setdefault(section.file_path, []).append(section)
+    
+    registry = ["# Protection Registry (synthetic)", ""]
+    for file_path, sections in by_file.items():
+        registry.extend([
+            f"## {Path(file_path).stem}", "",
+            f"**Contract File**: `{file_path}`", "",
+            "| Lock ID | Lock Reason | Authority | Fingerprint |",
+            "|---------|-------------|-----------|-------------|",
+        ])
+        for section in sections:
+            registry.append(f"| `{section.lock_id}` | {section.metadata.get('reason', '')} | "
+                            f"{section.metadata.get('authority', '')} | `{section.fingerprint}` |")
+        registry.append("")
+    registry.extend(["## Audit Trail", "", "| Date | Lock ID | Event |", "|------|---------|-------|"])
+    registry.extend(f"| 2026-01-01 | `LOCK-AUDIT-{i:05d}` | reviewed |" for i in range(args.registry_padding))
+    registry_path = tree / REGISTRY_FILE
+    registry_path.parent.mkdir(parents=True)
+    registry_path.write_text("\n".join(registry) + "\n")
+    written.append(registry_path)
+    
+    _git(tree, 'init', '-q')
+    _git(tree, 'add', '-A')
+    _git(tree, 'commit', '-q', '-m', 'base')
+    base = subprocess.check_output(['git', 'rev-parse', 'HEAD'], cwd=tree, text=True).strip()
+    
+    # Edit one line inside a locked section and one outside it in each changed contract
+    for contract_file in contract_files[:args.diff_files]:
+        lines = contract_file.read_text().split('\n')
+        locked = [n for n, line in enumerate(lines) if line.startswith('## 🔒')]
+        if locked:
+            lines[rng.choice(locked) + 1] += " (amended)"
+        lines[0] += " (edited)"
+        contract_file.write_text('\n'.join(lines))
+    _git(tree, 'commit', '-q', '-a', '-m', 'head')
+    head = subprocess.check_output(['git', 'rev-parse', 'HEAD'], cwd=tree, text=True).strip()
+    
+    _backdate(written)
+    # Let git re-stat the backdated files now rather than inside a timed run
+    subprocess.run(['git', 'update-index', '-q', '--refresh'], cwd=tree, stdout=subprocess.DEVNULL)
+    return base, head
+
+
+def best_time(func: Callable[[], object], repeat: int) -> float:
+    """Best-of-N wall time of func()"""
+    best = float('inf')
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def run_benchmarks(tree: Path, base: str, head: str, args: argparse.Namespace) -> Dict[str, float]:
+    """Time every scenario inside the synthetic tree; keys are 'area.scenario[.phase]'"""
+    results: Dict[str, float] = {}
+    repeat = args.repeat
+    cache_dir = tree / '.cache'
+    
+    def fresh_validator(cache_file: str = None) -> LockedSectionValidator:
+        return LockedSectionValidator(CONTRACTS_DIR, jobs=args.jobs, cache_file=cache_file)
+    
+    def scanned_view() -> LockedSectionValidator:
+        view = fresh_validator()
+        view.locked_sections = scanned.locked_sections
+        return view
+    
+    # --- Locked section validator ---
+    results['locked.scan.cold'] = best_time(lambda: fresh_validator().scan_contracts(), repeat)
+    scan_cache = str(cache_dir / 'check_locked_sections.json')
+    fresh_validator(scan_cache).scan_contracts()
+    results['locked.scan.warm-cache'] = best_time(lambda: fresh_validator(scan_cache).scan_contracts(), repeat)
+    
+    scanned = fresh_validator()
+    scanned.scan_contracts()
+    registry = scanned.load_registry(REGISTRY_FILE)
+    
+    results['locked.registry.parse'] = best_time(lambda: scanned_view().load_registry(REGISTRY_FILE), repeat)
+    results['locked.validate-metadata.check'] = best_time(
+        lambda: (lambda v: v.validate_metadata() and v.check_duplicate_lock_ids())(scanned_view()), repeat)
+    results['locked.verify-registry.check'] = best_time(
+        lambda: scanned_view().verify_registry_sync(REGISTRY_FILE, registry), repeat)
+    results['locked.verify-integrity.check'] = best_time(
+        lambda: scanned_view().verify_integrity(REGISTRY_FILE, registry), repeat)
+    results['locked.detect-modifications.diff'] = best_time(
+        lambda: scanned_view().detect_modifications(base, head), repeat)
+    
+    def end_to_end(mode: str):
+        validator = fresh_validator()
+        if mode != 'compare-refs':
+            validator.scan_contracts()
+        if mode == 'validate-metadata':
+            validator.validate_metadata() and validator.check_duplicate_lock_ids()
+        elif mode == 'verify-registry':
+            validator.verify_registry_sync(REGISTRY_FILE)
+        elif mode == 'verify-integrity':
+            validator.verify_integrity(REGISTRY_FILE)
+        elif mode == 'detect-modifications':
+            validator.detect_modifications(base, head)
+        elif mode == 'compare-refs':
+            validator.compare_refs(base, head)
+    
+    for mode in ('validate-metadata', 'verify-registry', 'verify-integrity',
+                 'detect-modifications', 'compare-refs'):
+        results[f'locked.{mode}.total'] = best_time(lambda: end_to_end(mode), repeat)
+    
+    # --- Inventory generator ---
+    central = sync_repo_inventory.load_central_inventory(tree)
+    hash_cache_path = cache_dir / 'sync_repo_inventory.json'
+    
+    def warm_cache() -> 'sync_repo_inventory.HashCache':
+        return sync_repo_inventory.HashCache(hash_cache_path)
+    
+    results['inventory.load-central'] = best_time(
+        lambda: sync_repo_inventory.load_central_inventory(tree), repeat)
+    results['inventory.scan-local.cold'] = best_time(
+        lambda: sync_repo_inventory.scan_local_canons(tree, args.jobs), repeat)
+    sync_repo_inventory.scan_local_canons(tree, args.jobs, warm_cache())
+    results['inventory.scan-local.warm-cache'] = best_time(
+        lambda: sync_repo_inventory.scan_local_canons(tree, args.jobs, warm_cache()), repeat)
+    results['inventory.scan-local.git-metadata'] = best_time(
+        lambda: sync_repo_inventory.scan_local_canons(tree, args.jobs, git_metadata=True), repeat)
+    results['inventory.generate.preloaded-central'] = best_time(
+        lambda: sync_repo_inventory.generate_inventory(tree, tree, 'bench/tree', args.jobs,
+                                                       warm_cache(), central_index=central), repeat)
+    
+    def generate(cache: bool):
+        inventory = sync_repo_inventory.generate_inventory(tree, tree, 'bench/tree', args.jobs,
+                                                           warm_cache() if cache else None)
+        with open(os.devnull, 'w') as devnull:
+            json.dump(inventory, devnull, indent=2)
+    
+    inventory_sample = sync_repo_inventory.generate_inventory(tree, tree, 'bench/tree', args.jobs,
+                                                              central_index=central)
+    results['inventory.serialize'] = best_time(
+        lambda: json.dumps(inventory_sample, indent=2), repeat)
+    results['inventory.total.cold'] = best_time(lambda: generate(False), repeat)
+    results['inventory.total.warm-cache'] = best_time(lambda: generate(True), repeat)
+    
+    return results
+
+
+def calibrate(repeat: int) -> float:
+    """
+    Best-of-N time of a fixed workload (hashing, regex and dict churn) that
+    does not depend on the code under test, used to factor out machine speed.
+    """
+    data = ("\n".join(PROSE) * 2000).encode('utf-8')
+    text = data.decode('utf-8')
+    
+    def workload():
+        hashlib.sha256(data).hexdigest()
+        LockedSectionValidator.MARKER_PATTERN.findall(text)
+        counts: Dict[str, int] = {}
+        for word in text.split():
+            counts[word] = counts.get(word, 0) + 1
+    
+    return best_time(workload, max(repeat, 3))
+
+
+def compare_with_baseline(results: Dict[str, float], baseline: Dict[str, float],
+                          threshold: float, min_delta: float, scale: float = 1.0) -> List[str]:
+    """
+    Print a comparison table and return the names of regressed timings.
+    
+    Baseline timings are multiplied by scale (current / baseline calibration
+    time) first, so a uniformly slower machine is not reported as a regression.
+    """
+    regressions = []
+    print(f"{'Benchmark':42} {'Baseline':>10} {'Current':>10} {'Change':>8}")
+    for name, current in results.items():
+        previous = baseline.get(name)
+        if previous is not None:
+            previous *= scale
+        if previous is None:
+            print(f"{name:42} {'-':>10} {current * 1000:8.2f}ms {'new':>8}")
+            continue
+        change = (current - previous) / previous if previous else 0.0
+        regressed = current > previous * (1 + threshold) and current - previous > min_delta
+        marker = '  ❌' if regressed else ''
+        print(f"{name:42} {previous * 1000:8.2f}ms {current * 1000:8.2f}ms {change:+7.1%}{marker}")
+        if regressed:
+            regressions.append(name)
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the governance gates on a synthetic tree')
+    parser.add_argument('--canons', type=int, default=500, help='Canons in governance/canon/')
+    parser.add_argument('--canon-lines', type=int, default=400, help='Lines per canon')
+    parser.add_argument('--contracts', type=int, default=100, help='Agent contracts')
+    parser.add_argument('--sections', type=int, default=10, help='Locked sections per contract')
+    parser.add_argument('--lines', type=int, default=2000, help='Lines per contract')
+    parser.add_argument('--diff-files', type=int, default=20, help='Contracts edited between base and head')
+    parser.add_argument('--registry-padding', type=int, default=5000,
+                        help='Extra non-registration rows in the protection registry')
+    parser.add_argument('--repeat', type=int, default=5, help='Timing repetitions (best is reported)')
+    parser.add_argument('--seed', type=int, default=1, help='Random seed for synthetic content')
+    parser.add_argument('--jobs', type=int, default=None,
+                        help='Workers passed to the validator and inventory hashing (default: their defaults)')
+    parser.add_argument('--json', metavar='PATH', help='Write this run (parameters and timings) as JSON')
+    parser.add_argument('--save-baseline', metavar='PATH', help='Write this run as the new baseline')
+    parser.add_argument('--baseline', metavar='PATH', help='Compare against a saved baseline')
+    parser.add_argument('--threshold', type=float, default=0.25,
+                        help='Relative slowdown that counts as a regression (default: 0.25 = 25%%)')
+    parser.add_argument('--min-delta', type=float, default=0.005,
+                        help='Ignore slowdowns smaller than this many seconds (default: 0.005)')
+    parser.add_argument('--no-normalize', dest='normalize', action='store_false',
+                        help='Compare raw timings instead of scaling the baseline by the calibration workload')
+    args = parser.parse_args()
+    
+    params = {key: getattr(args, key) for key in
+              ('canons', 'canon_lines', 'contracts', 'sections', 'lines', 'diff_files',
+               'registry_padding', 'seed', 'jobs')}
+    
+    baseline = None
+    if args.baseline:
+        try:
+            with open(args.baseline, 'r') as f:
+                baseline = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"❌ Cannot read baseline {args.baseline}: {e}")
+            sys.exit(2)
+        if baseline.get('version') != BASELINE_VERSION or baseline.get('params') != params:
+            print(f"❌ Baseline {args.baseline} was recorded with different parameters:")
+            print(f"   baseline: {baseline.get('params')}")
+            print(f"   current:  {params}")
+            sys.exit(2)
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        tree = Path(tmp)
+        started = time.perf_counter()
+        base, head = build_tree(tree, args)
+        print(f"Synthetic tree: {args.canons} canons, {args.contracts} contracts x {args.sections} "
+              f"locked sections, {args.diff_files} changed contracts "
+              f"(built in {time.perf_counter() - started:.1f}s)")
+        print()
+        
+        cwd = os.getcwd()
+        os.chdir(tree)
+        try:
+            calibration = calibrate(args.repeat)
+            results = run_benchmarks(tree, base, head, args)
+            # Measured on both sides of the run; the faster one is the least disturbed
+            calibration = min(calibration, calibrate(args.repeat))
+        finally:
+            os.chdir(cwd)
+    
+    run = {
+        'version': BASELINE_VERSION,
+        'recorded': datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'params': params,
+        'calibration': round(calibration, 6),
+        'results': {name: round(seconds, 6) for name, seconds in results.items()},
+    }
+    
+    regressions = []
+    if baseline is not None:
+        scale = 1.0
+        if args.normalize and baseline.get('calibration'):
+            scale = calibration / baseline['calibration']
+            print(f"Machine speed vs baseline: {1 / scale:.2f}x (baseline timings scaled by {scale:.2f})")
+            print()
+        regressions = compare_with_baseline(results, baseline['results'], args.threshold,
+                                            args.min_delta, scale)
+    else:
+        for name, seconds in results.items():
+            print(f"{name:42} {seconds * 1000:8.2f}ms")
+    print()
+    
+    for path in (args.json, args.save_baseline):
+        if path:
+            with open(path, 'w') as f:
+                json.dump(run, f, indent=2)
+                f.write('\n')
+    if args.save_baseline:
+        print(f"✓ Baseline saved to {args.save_baseline}")
+    
+    if regressions:
+        print(f"❌ {len(regressions)} benchmark(s) regressed by more than {args.threshold:.0%}:")
+        for name in regressions:
+            print(f"  - {name}")
+        sys.exit(1)
+    if baseline is not None:
+        print(f"✅ No regressions beyond {args.threshold:.0%}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""
+Locked Section Scanner Micro-Benchmark
+
+Purpose: Compare the fast-path contract scanner in check_locked_sections.py
+         against the original line-by-line scanner on synthetic contracts
+Authority: governance/canon/AGENT_CONTRACT_PROTECTION_PROTOCOL.md
+Version: 1.0.0
+
+Usage:
+    python .github/scripts/benchmark_locked_sections.py [--files N] [--lines N]
+        [--sections N] [--repeat N] [--min-speedup X]
+
+Exits 1 if the two scanners disagree on any synthetic contract, or if the
+fast path is not at least --min-speedup times faster.
+"""
+
+import argparse
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import List, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from check_locked_sections import LockedSection, LockedSectionValidator, parse_contract  # noqa: E402
+
+
+def legacy_parse_contract(file_path: Path) -> Tuple[List[LockedSection], List[str]]:
+    """The original per-line scanner (three regexes + two substring checks per line)"""
+    sections: List[LockedSection] = []
+    errors: List[str] = []
+    patterns = LockedSectionValidator
+    
+    try:
+        with open(file_path, 'r', encoding='utf-8') as f:
+            lines = f.readlines()
+    except Exception as e:
+        errors.append(f"Error reading {file_path}: {e}")
+        return sections, errors
+    
+    in_locked_section = False
+    current_section = None
+    
+    for i, line in enumerate(lines, start=1):
+        if patterns.LOCKED_START_PATTERN.search(line):
+            if in_locked_section:
+                errors.append(
+                    f"{file_path}:{i} - Nested locked section detected (missing END marker?)"
+                )
+            in_locked_section = True
+            current_section = LockedSection('UNKNOWN', str(file_path), i, -1)
+        elif patterns.LOCKED_END_PATTERN.search(line):
+            if not in_locked_section:
+                errors.append(f"{file_path}:{i} - Locked section END without START")
+            else:
+                current_section.end_line = i
+                sections.append(current_section)
+                in_locked_section = False
+                current_section = None
+        elif in_locked_section and current_section:
+            lock_id_match = patterns.LOCK_ID_PATTERN.search(line)
+            if lock_id_match:
+                current_section.lock_id = lock_id_match.group(1)
+            if 'Lock Reason:' in line:
+                current_section.metadata['reason'] = line.split(':', 1)[1].strip()
+            elif 'Lock Authority:' in line:
+                current_section.metadata['authority'] = line.split(':', 1)[1].strip()
+    
+    if in_locked_section:
+        errors.append(
+            f"{file_path}:{current_section.start_line} - Locked section START without END"
+        )
+    
+    return sections, errors
+
+
+# Roughly the mix seen in real contracts: about 3% of lines carry an HTML
+# comment outside locked sections
+PROSE = [
+    "The agent MUST execute all gates locally before handover.",
+    "See governance/canon/EXECUTION_BOOTSTRAP_PROTOCOL.md for details.",
+    "- ✅ ALL validation commands exit 0",
+    "- ❌ Handing over with uncommitted changes",
+    "1. **Commit ALL Changes**: Ensure working directory is clean",
+    "**Authority**: `governance/canon/BUILD_PHILOSOPHY.md` — Warnings = Errors principle",
+    "",
+    "",
+    "## Heading",
+    "| Gate | Command | Exit Code |",
+    "|------|---------|-----------|",
+    "| Scope-to-diff | `./.github/scripts/validate-scope-to-diff.sh main` | 0 |",
+    "Escalate to CS2 when authority is unclear; never proceed on assumption.",
+    "```bash",
+    "python .github/scripts/check_locked_sections.py --mode=validate-metadata",
+    "```",
+    "Lock Reason: appears in prose outside a locked section",
+    "Evidence MUST be recorded in PREHANDOVER_PROOF with timestamps and exit codes.",
+    "- Builders implement; Foreman supervises; governance defines.",
+    "Zero test debt: no skipped, stubbed or disabled tests are permitted.",
+    "Contracts are modified only through the Agent Contract Administrator.",
+    "### Constitutional Bindings",
+    "- `governance/canon/GOVERNANCE_PURPOSE_AND_SCOPE.md`",
+    "Every handover must include the complete gate evidence bundle.",
+    "> Note: CI is confirmatory, not diagnostic.",
+    "Review frequency is set by the lock metadata and tracked in the registry.",
+    "All warnings are treated as errors (BL-028).",
+    "Scope declarations must match the diff exactly (BL-027).",
+    "No partial handovers; completion means 100% of the declared scope.",
+    "<!-- ordinary HTML comment -->",
+]
+
+# Deliberately awkward lines mixed in to exercise edge cases of the fast path
+ODDITIES = [
+    "<!-- lock id: lower-case-ID -->",
+    "<!--LOCKED SECTION END-->",
+    "text <!-- Lock ID: LOCK-X-001 --> <!-- LOCKED SECTION START -->",
+    "<!-- Lock ID: A-->B-->",
+    "<!--\tLOCKED\tSECTION\tSTART\t-->",
+    "<!-- LOCKED SECTION",
+    "START -->",
+    "Lock Authority: inline authority: with colons",
+    "<!-- Lock Reason: x --> <!-- Lock Authority: y -->",
+    "\r",
+]
+
+
+def synthetic_contract(rng: random.Random, lines: int, sections: int, agent: int, oddities: bool) -> str:
+    """Build one synthetic contract with the given number of lines and locked sections"""
+    out = []
+    gap = max(1, lines // (sections + 1))
+    for k in range(sections):
+        out.extend(rng.choice(PROSE) for _ in range(gap))
+        if oddities and rng.random() < 0.3:
+            out.append(rng.choice(ODDITIES))
+        out.extend([
+            "<!-- LOCKED SECTION START -->",
+            f"<!-- Lock ID: LOCK-AGENT{agent}-{k:03d} -->",
+            "<!-- Lock Reason: Prevents governance bypass -->",
+            "<!-- Lock Authority: AGENT_CONTRACT_PROTECTION_PROTOCOL.md -->",
+            "<!-- Lock Date: 2026-01-26 -->",
+            "<!-- Last Reviewed: 2026-01-26 -->",
+            "<!-- Review Frequency: quarterly -->",
+            "<!-- END METADATA -->",
+            "",
+            "## 🔒 Protected Section (LOCKED)",
+        ])
+        out.extend(rng.choice(PROSE) for _ in range(8))
+        if oddities and rng.random() < 0.3:
+            out.append(rng.choice(ODDITIES))
+        out.append("<!-- LOCKED SECTION END -->")
+    out.extend(rng.choice(PROSE) for _ in range(gap))
+    return "\n".join(out) + "\n"
+
+
+def as_comparable(result: Tuple[List[LockedSection], List[str]]) -> Tuple:
+    sections, errors = result
+    return (
+        [(s.lock_id, s.file_path, s.start_line, s.end_line, sorted(s.metadata.items())) for s in sections],
+        errors,
+    )
+
+
+def time_scanner(scanner, files: List[Path], repeat: int) -> float:
+    """Best-of-N wall time to scan all files"""
+    best = float('inf')
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for file_path in files:
+            scanner(file_path)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the locked section contract scanner')
+    parser.add_argument('--files', type=int, default=50, help='Synthetic contracts to generate')
+    parser.add_argument('--lines', type=int, default=5000, help='Lines per contract')
+    parser.add_argument('--sections', type=int, default=20, help='Locked sections per contract')
+    parser.add_argument('--repeat', type=int, default=5, help='Timing repetitions (best is reported)')
+    parser.add_argument('--seed', type=int, default=1, help='Random seed for synthetic content')
+    parser.add_argument('--min-speedup', type=float, default=1.2,
+                        help='Fail unless the fast path is at least this many times faster')
+    args = parser.parse_args()
+    
+    rng = random.Random(args.seed)
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp_dir = Path(tmp)
+        files = []
+        for i in range(args.files):
+            file_path = tmp_dir / f"agent-{i:04d}.agent.md"
+            # Every other contract carries malformed/edge-case markers
+            content = synthetic_contract(rng, args.lines, args.sections, i, oddities=bool(i % 2))
+            file_path.write_bytes(content.encode('utf-8'))
+            files.append(file_path)
+        total_bytes = sum(f.stat().st_size for f in files)
+        
+        mismatches = [f for f in files if as_comparable(parse_contract(f)) != as_comparable(legacy_parse_contract(f))]
+        if mismatches:
+            print(f"❌ Fast-path scanner disagrees with the reference scanner on {len(mismatches)} file(s):")
+            for f in mismatches[:10]:
+                print(f"  - {f.name}")
+            sys.exit(1)
+        
+        legacy = time_scanner(legacy_parse_contract, files, args.repeat)
+        fast = time_scanner(parse_contract, files, args.repeat)
+    
+    speedup = legacy / fast if fast else float('inf')
+    mib = total_bytes / (1024 * 1024)
+    print(f"Contracts: {args.files} x {args.lines} lines, {args.sections} locked sections each ({mib:.1f} MiB)")
+    print(f"Reference scanner: {legacy * 1000:8.1f} ms  ({mib / legacy:7.1f} MiB/s)")
+    print(f"Fast-path scanner: {fast * 1000:8.1f} ms  ({mib / fast:7.1f} MiB/s)")
+    print(f"Speedup:           {speedup:8.2f}x")
+    print("✅ Outputs identical")
+    
+    if speedup < args.min_speedup:
+        print(f"❌ Speedup {speedup:.2f}x is below the required {args.min_speedup:.2f}x")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -5,15 +5,65 @@ Locked Section Protection Validation Script
 Purpose: Validate locked section integrity in agent contracts
 Authority: governance/canon/AGENT_CONTRACT_PROTECTION_PROTOCOL.md
 Version: 1.0.0
+
+With --watch, validate-metadata / verify-registry / verify-integrity keep
+running: parsed contracts and the registry index stay in memory, and each save
+re-parses only the changed files before the checks are re-run (see file_watch.py).
 """
 
 import argparse
+import hashlib
+import json
 import re
 import sys
 import os
+import time
+from bisect import bisect_right
 from pathlib import Path
-from typing import List, Dict, Set, Tuple
+from typing import Iterable, Iterator, List, Dict, Optional, Set, Tuple
 import subprocess
+from contextlib import nullcontext
+
+
+class _NoTrace:
+    """Stand-in for governance_trace.TRACE when it cannot be imported: every hook is a no-op"""
+    
+    def enable(self, tool: str, **kwargs):
+        print("Warning: --timings, --trace and --profile need scripts/governance_trace.py "
+              "(e.g. PYTHONPATH=scripts); continuing without them", file=sys.stderr)
+    
+    def span(self, name: str):
+        return nullcontext()
+    
+    def subprocess(self, label: str):
+        return nullcontext()
+    
+    def count(self, name: str, value: float = 1):
+        pass
+
+
+try:
+    # Phase tracer shared with scripts/sync_repo_inventory.py; found when scripts/ is on PYTHONPATH
+    from governance_trace import TRACE
+except ImportError:
+    TRACE = _NoTrace()
+
+
+# Bump whenever parsing rules change so cached parse results are discarded
+PARSER_VERSION = 2
+
+# Hex digits of SHA-256 kept in a locked section fingerprint ("sha256:<hex>")
+FINGERPRINT_LENGTH = 16
+
+# Parse caches are kept in the .cache/ of the repository holding this script,
+# one file per contracts directory, never in the tree being checked
+CACHE_DIR = Path(__file__).resolve().parents[2] / '.cache' / 'check_locked_sections'
+
+
+def default_cache_file(contracts_dir: str) -> Path:
+    """Parse cache location for a contracts directory: CACHE_DIR/<digest of its resolved path>.json"""
+    resolved = str(Path(contracts_dir).resolve())
+    return CACHE_DIR / f"{hashlib.sha256(resolved.encode('utf-8')).hexdigest()[:FINGERPRINT_LENGTH]}.json"
 
 
 class LockedSection:
@@ -25,9 +75,544 @@ class LockedSection:
         self.start_line = start_line
         self.end_line = end_line
         self.metadata = {}
+        # Protected body text, kept until the fingerprint is first needed
+        self.body: Optional[str] = None
+        self._fingerprint: Optional[str] = None
+    
+    @property
+    def fingerprint(self) -> Optional[str]:
+        """
+        Fingerprint of the protected body, computed on first use.
+        
+        Only verify-integrity, print-fingerprints and the caches read it, so
+        scans in the other modes never hash section bodies.
+        """
+        if self._fingerprint is None and self.body is not None:
+            self._fingerprint = section_fingerprint(self.body)
+            self.body = None
+        return self._fingerprint
+    
+    @fingerprint.setter
+    def fingerprint(self, value: Optional[str]):
+        self._fingerprint = value
+        self.body = None
     
     def __repr__(self):
         return f"LockedSection({self.lock_id} in {self.file_path}:{self.start_line}-{self.end_line})"
+    
+    def to_dict(self) -> Dict:
+        """Serialize for the parse cache"""
+        return {
+            'lock_id': self.lock_id,
+            'start_line': self.start_line,
+            'end_line': self.end_line,
+            'metadata': self.metadata,
+            'fingerprint': self.fingerprint,
+        }
+    
+    @classmethod
+    def from_dict(cls, file_path: str, data: Dict) -> 'LockedSection':
+        """Rebuild a section from its parse cache form"""
+        section = cls(data['lock_id'], file_path, data['start_line'], data['end_line'])
+        section.metadata = dict(data.get('metadata', {}))
+        section.fingerprint = data.get('fingerprint')
+        return section
+
+
+def section_fingerprint(body: str) -> str:
+    """
+    Fingerprint the protected body of a locked section.
+    
+    The body is everything between the metadata block (or the START marker
+    when there is no END METADATA line) and the END marker. Line endings,
+    trailing whitespace and leading/trailing blank lines are normalized away
+    so that only meaningful edits change the fingerprint.
+    """
+    lines = [line.rstrip() for line in body.split('\n')]
+    while lines and not lines[0]:
+        lines.pop(0)
+    while lines and not lines[-1]:
+        lines.pop()
+    digest = hashlib.sha256('\n'.join(lines).encode('utf-8')).hexdigest()
+    return f"sha256:{digest[:FINGERPRINT_LENGTH]}"
+
+
+class DiffHunk:
+    """
+    A changed line range from a zero-context (-U0) unified diff.
+    
+    path is the head-side path and old_path the base-side one; either is
+    None when the file does not exist on that side (added / deleted files).
+    """
+    
+    def __init__(self, path: Optional[str], old_start: int, old_count: int, new_start: int, new_count: int,
+                 old_path: Optional[str] = None):
+        self.path = path
+        self.old_path = old_path
+        self.old_start = old_start
+        self.old_count = old_count
+        self.new_start = new_start
+        self.new_count = new_count
+    
+    def head_range(self) -> Tuple[int, int]:
+        """
+        Return the head-side line range touched by this hunk.
+        
+        A pure deletion has no head-side lines; git reports the head line
+        *after which* the base lines were removed, so the change sits on the
+        boundary between new_start and new_start + 1.
+        """
+        if self.new_count == 0:
+            return self.new_start, self.new_start + 1
+        return self.new_start, self.new_start + self.new_count - 1
+    
+    def base_range(self) -> Tuple[int, int]:
+        """Return the base-side line range touched by this hunk (a pure insertion sits on a boundary)"""
+        if self.old_count == 0:
+            return self.old_start, self.old_start + 1
+        return self.old_start, self.old_start + self.old_count - 1
+    
+    def __repr__(self):
+        return (f"DiffHunk({self.old_path or self.path} -{self.old_start},{self.old_count} "
+                f"+{self.new_start},{self.new_count})")
+
+
+class SectionIntervalIndex:
+    """Interval index over the locked sections of a single contract file"""
+    
+    def __init__(self, sections: Iterable[LockedSection]):
+        self.sections = sorted(sections, key=lambda s: (s.start_line, s.end_line))
+        self.starts = [s.start_line for s in self.sections]
+        # Running maximum of end lines lets overlap queries stop early even
+        # when malformed (nested) sections overlap each other
+        self.max_ends = []
+        max_end = 0
+        for section in self.sections:
+            max_end = max(max_end, section.end_line)
+            self.max_ends.append(max_end)
+    
+    def overlapping(self, low: int, high: int) -> List[LockedSection]:
+        """Return sections whose [start_line, end_line] intersects [low, high]"""
+        found = []
+        i = bisect_right(self.starts, high) - 1
+        while i >= 0 and self.max_ends[i] >= low:
+            if self.sections[i].end_line >= low:
+                found.append(self.sections[i])
+            i -= 1
+        return found
+    
+    def touched_by(self, hunk: DiffHunk, base: bool = False) -> List[LockedSection]:
+        """Return sections changed by a hunk, matching its base-side range if base is set"""
+        low, high = hunk.base_range() if base else hunk.head_range()
+        if (hunk.old_count if base else hunk.new_count) == 0:
+            # A hunk with no lines on this side (deletion in head, insertion in
+            # base) only touches a section when both neighbouring lines are
+            # inside it (i.e. the change was interior)
+            return [s for s in self.overlapping(low, high)
+                    if s.start_line <= low and high <= s.end_line]
+        return self.overlapping(low, high)
+
+
+HUNK_HEADER_PATTERN = re.compile(r'^@@ -(\d+)(?:,(\d+))? \+(\d+)(?:,(\d+))? @@')
+
+_GIT_ESCAPES = {'a': '\a', 'b': '\b', 't': '\t', 'n': '\n', 'v': '\v', 'f': '\f', 'r': '\r',
+                '"': '"', '\\': '\\'}
+
+
+def _unquote_git_path(raw: str) -> str:
+    """Decode a path as printed by git (C-style quoted when it contains special characters)"""
+    if not (raw.startswith('"') and raw.endswith('"')):
+        return raw
+    body = raw[1:-1]
+    out = bytearray()
+    i = 0
+    while i < len(body):
+        ch = body[i]
+        if ch == '\\' and i + 1 < len(body):
+            nxt = body[i + 1]
+            if nxt in '01234567':
+                out.append(int(body[i + 1:i + 4], 8))
+                i += 4
+                continue
+            out.extend(_GIT_ESCAPES.get(nxt, nxt).encode('utf-8'))
+            i += 2
+            continue
+        out.extend(ch.encode('utf-8'))
+        i += 1
+    return out.decode('utf-8', errors='replace')
+
+
+def iter_diff_hunks(lines: Iterable[str]) -> Iterator[DiffHunk]:
+    """
+    Stream DiffHunk records out of `git diff -U0` output.
+    
+    Hunk bodies are skipped by counting the old/new lines announced in each
+    hunk header, so content lines that happen to look like diff headers
+    (e.g. an added line starting with "++ ") are never misparsed.
+    """
+    path = old_path = None
+    old_left = new_left = 0
+    
+    for line in lines:
+        if old_left > 0 or new_left > 0:
+            tag = line[:1]
+            if tag == '-':
+                old_left -= 1
+            elif tag == '+':
+                new_left -= 1
+            elif tag == ' ':
+                old_left -= 1
+                new_left -= 1
+            # "\ No newline at end of file" consumes no lines
+            continue
+        
+        if line.startswith('@@'):
+            match = HUNK_HEADER_PATTERN.match(line)
+            if not match or (path is None and old_path is None):
+                continue
+            old_start, old_count, new_start, new_count = match.groups()
+            hunk = DiffHunk(
+                path,
+                int(old_start), 1 if old_count is None else int(old_count),
+                int(new_start), 1 if new_count is None else int(new_count),
+                old_path=old_path,
+            )
+            old_left, new_left = hunk.old_count, hunk.new_count
+            yield hunk
+        elif line.startswith('--- '):
+            source = _unquote_git_path(line[4:].rstrip('\n'))
+            old_path = source[2:] if source.startswith('a/') else None
+        elif line.startswith('+++ '):
+            target = _unquote_git_path(line[4:].rstrip('\n'))
+            path = target[2:] if target.startswith('b/') else None
+        elif line.startswith('diff --git '):
+            path = old_path = None
+
+
+class ParseCache:
+    """
+    Persistent cache of per-contract parse results.
+    
+    Entries are keyed by path and trusted on a size + mtime_ns match. When
+    the stat data differs (e.g. after a fresh checkout) the file is re-hashed
+    and only re-parsed if its SHA-256 changed. Entries whose mtime is too
+    close to the moment they were hashed are "racy" (a same-size edit within
+    the filesystem timestamp granularity would be invisible) and are always
+    verified by hash.
+    """
+    
+    FORMAT_VERSION = 1
+    RACY_WINDOW_NS = 2_000_000_000
+    
+    def __init__(self, cache_file: str, contracts_dir: Path, rebuild: bool = False):
+        self.cache_file = Path(cache_file)
+        self.scope = {
+            'contracts_dir': str(contracts_dir),
+            'resolved': str(contracts_dir.resolve()),
+        }
+        self.entries: Dict[str, Dict] = {}
+        self.dirty = rebuild
+        self.hits = 0
+        self.misses = 0
+        if not rebuild:
+            self._load()
+    
+    def _load(self):
+        """Load the cache file, discarding it if it belongs to another parser or tree"""
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if (not isinstance(data, dict)
+                or data.get('version') != self.FORMAT_VERSION
+                or data.get('parser') != PARSER_VERSION
+                or data.get('scope') != self.scope):
+            self.dirty = True
+            return
+        self.entries = data.get('files', {})
+    
+    def lookup(self, file_path: Path) -> Tuple[Optional[Tuple[List[LockedSection], List[str]]], Optional[str]]:
+        """
+        Return (parse result, None) when the cached entry can be trusted as-is,
+        otherwise (None, digest) where digest is the cached content hash (if
+        any) the caller should compare against before re-parsing.
+        """
+        entry = self.entries.get(str(file_path))
+        if entry is None:
+            return None, None
+        try:
+            st = os.stat(file_path)
+        except OSError:
+            return None, None
+        if (entry['size'] == st.st_size and entry['mtime_ns'] == st.st_mtime_ns
+                and entry['mtime_ns'] + self.RACY_WINDOW_NS < entry['checked_ns']):
+            self.hits += 1
+            return self._result(file_path), None
+        return None, entry['digest']
+    
+    def refresh(self, file_path: Path, stat_key: Tuple[int, int], checked_ns: int) -> Tuple[List[LockedSection], List[str]]:
+        """Record new stat data for a file whose content hash still matches"""
+        entry = self.entries[str(file_path)]
+        entry['size'], entry['mtime_ns'] = stat_key
+        entry['checked_ns'] = checked_ns
+        self.dirty = True
+        self.hits += 1
+        return self._result(file_path)
+    
+    def store(self, file_path: Path, stat_key: Tuple[int, int], checked_ns: int, digest: str,
+              result: Tuple[List[LockedSection], List[str]]):
+        """Record a freshly parsed file"""
+        sections, errors = result
+        self.entries[str(file_path)] = {
+            'size': stat_key[0],
+            'mtime_ns': stat_key[1],
+            'checked_ns': checked_ns,
+            'digest': digest,
+            'sections': [s.to_dict() for s in sections],
+            'errors': list(errors),
+        }
+        self.dirty = True
+        self.misses += 1
+    
+    def prune(self, live_files: Iterable[Path]):
+        """Drop entries for contracts that no longer exist"""
+        live = {str(p) for p in live_files}
+        stale = [path for path in self.entries if path not in live]
+        for path in stale:
+            del self.entries[path]
+        if stale:
+            self.dirty = True
+    
+    def save(self):
+        """Atomically write the cache file if anything changed"""
+        if not self.dirty:
+            return
+        data = {
+            'version': self.FORMAT_VERSION,
+            'parser': PARSER_VERSION,
+            'scope': self.scope,
+            'files': self.entries,
+        }
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = self.cache_file.with_name(self.cache_file.name + f'.{os.getpid()}.tmp')
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump(data, f, separators=(',', ':'))
+            os.replace(tmp_file, self.cache_file)
+        except OSError as e:
+            # A cache that cannot be written must never fail the gate
+            print(f"Warning: could not write parse cache {self.cache_file}: {e}", file=sys.stderr)
+            return
+        self.dirty = False
+    
+    def _result(self, file_path: Path) -> Tuple[List[LockedSection], List[str]]:
+        entry = self.entries[str(file_path)]
+        sections = [LockedSection.from_dict(str(file_path), d) for d in entry['sections']]
+        return sections, list(entry['errors'])
+
+
+class RegistryEntry:
+    """A Lock ID registration row from the protection registry"""
+    
+    def __init__(self, lock_id: str, line: int, contract_file: str = None,
+                 reason: str = None, authority: str = None, fingerprint: str = None):
+        self.lock_id = lock_id
+        self.line = line
+        self.contract_file = contract_file
+        self.reason = reason
+        self.authority = authority
+        self.fingerprint = fingerprint
+    
+    def __repr__(self):
+        return f"RegistryEntry({self.lock_id} -> {self.contract_file} @ line {self.line})"
+
+
+class ProtectionRegistry:
+    """
+    Lock ID index over a protection registry markdown file.
+    
+    Registrations are the rows of any table whose header has both a
+    "Lock ID" and an "Authority" column (the per-agent inventory tables of
+    PROTECTION_REGISTRY_TEMPLATE.md). Audit-trail and gate-activity tables
+    mention Lock IDs too but are not registrations. The contract file comes
+    from a "Contract File" column if the table has one, otherwise from the
+    nearest preceding "**Contract File**:" line.
+    """
+    
+    CONTRACT_FILE_PATTERN = re.compile(r'^\*\*Contract File\*\*:\s*`?\[?([^`\]]+?)\]?`?\s*$')
+    CELL_SPLIT_PATTERN = re.compile(r'(?<!\\)\|')
+    SEPARATOR_PATTERN = re.compile(r'^\|?\s*:?-{3,}:?\s*(\|\s*:?-{3,}:?\s*)*\|?\s*$')
+    
+    def __init__(self):
+        self.entries: Dict[str, RegistryEntry] = {}
+        self.duplicates: List[Tuple[RegistryEntry, RegistryEntry]] = []
+    
+    def __contains__(self, lock_id: str) -> bool:
+        return lock_id in self.entries
+    
+    def __len__(self) -> int:
+        return len(self.entries)
+    
+    def get(self, lock_id: str) -> Optional[RegistryEntry]:
+        """Exact Lock ID lookup"""
+        return self.entries.get(lock_id)
+    
+    @classmethod
+    def _cells(cls, line: str) -> List[str]:
+        row = line.strip()
+        if row.startswith('|'):
+            row = row[1:]
+        if row.endswith('|') and not row.endswith('\\|'):
+            row = row[:-1]
+        return [cell.strip() for cell in cls.CELL_SPLIT_PATTERN.split(row)]
+    
+    @staticmethod
+    def _plain(cell: str) -> str:
+        return cell.replace('\\|', '|').strip().strip('`').strip()
+    
+    @classmethod
+    def parse_text(cls, text: str) -> 'ProtectionRegistry':
+        """Build the index from registry markdown in a single pass"""
+        registry = cls()
+        lines = text.split('\n')
+        contract_file = None
+        columns = None
+        in_separator = False
+        
+        for i, line in enumerate(lines, start=1):
+            stripped = line.strip()
+            
+            if in_separator:
+                in_separator = False
+                continue
+            
+            if columns is not None:
+                if stripped.startswith('|'):
+                    registry._add_row(i, cls._cells(stripped), columns, contract_file)
+                    continue
+                columns = None
+            
+            if stripped.startswith('|'):
+                # A table starts where a header row is followed by a separator row
+                if i < len(lines) and cls.SEPARATOR_PATTERN.match(lines[i].strip()):
+                    header = [cls._plain(c).lower() for c in cls._cells(stripped)]
+                    if 'lock id' in header and ('authority' in header or 'lock authority' in header):
+                        columns = {name: idx for idx, name in enumerate(header)}
+                        in_separator = True
+                continue
+            
+            match = cls.CONTRACT_FILE_PATTERN.match(stripped)
+            if match:
+                contract_file = match.group(1).strip()
+            elif stripped.startswith('## '):
+                # A new top-level registry section ends the current agent block
+                contract_file = None
+        
+        return registry
+    
+    def _add_row(self, line: int, cells: List[str], columns: Dict[str, int], contract_file: Optional[str]):
+        def column(*names):
+            for name in names:
+                idx = columns.get(name)
+                if idx is not None and idx < len(cells):
+                    return self._plain(cells[idx]) or None
+            return None
+        
+        lock_id = column('lock id')
+        if not lock_id:
+            return
+        entry = RegistryEntry(
+            lock_id,
+            line,
+            contract_file=column('contract file', 'contract') or contract_file,
+            reason=column('lock reason', 'reason'),
+            authority=column('authority', 'lock authority'),
+            fingerprint=column('fingerprint'),
+        )
+        if lock_id in self.entries:
+            self.duplicates.append((self.entries[lock_id], entry))
+        else:
+            self.entries[lock_id] = entry
+
+
+def _metadata_value(value: Optional[str]) -> str:
+    """Normalize a metadata value from a lock comment or registry cell for comparison"""
+    if not value:
+        return ''
+    value = value.strip()
+    if value.endswith('-->'):
+        value = value[:-3]
+    return ' '.join(value.replace('`', '').split()).lower()
+
+
+def _authority_set(value: Optional[str]) -> Set[str]:
+    return {part.strip() for part in _metadata_value(value).split(',') if part.strip()}
+
+
+class GitObjectReader:
+    """
+    Reads git objects through one long-lived `git cat-file --batch` process.
+    
+    Lets a whole run read trees and blobs for any number of refs straight
+    from the object database, without checkouts or a process per object.
+    """
+    
+    def __init__(self, cwd: str = None):
+        self.proc = subprocess.Popen(
+            ['git', 'cat-file', '--batch'],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, cwd=cwd
+        )
+    
+    def __enter__(self) -> 'GitObjectReader':
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+    
+    def close(self):
+        if self.proc.poll() is None:
+            self.proc.stdin.close()
+            self.proc.wait()
+    
+    def read(self, spec: str) -> Optional[Tuple[str, str, bytes]]:
+        """Return (oid, type, content) for an object spec, or None if it does not exist"""
+        self.proc.stdin.write(spec.encode('utf-8') + b'\n')
+        self.proc.stdin.flush()
+        header = self.proc.stdout.readline()
+        if not header:
+            raise subprocess.CalledProcessError(self.proc.wait(), ['git', 'cat-file', '--batch'])
+        # "<spec> missing" / "<spec> ambiguous"; the spec itself may contain spaces
+        if header.endswith((b' missing\n', b' ambiguous\n')):
+            return None
+        fields = header.split()
+        if len(fields) != 3 or not fields[2].isdigit():
+            raise OSError(f"Unexpected git cat-file --batch header: {header!r}")
+        oid, obj_type, size = fields[0].decode(), fields[1].decode(), int(fields[2])
+        content = self.proc.stdout.read(size)
+        self.proc.stdout.read(1)  # trailing LF
+        return oid, obj_type, content
+    
+    def iter_tree(self, tree_oid: str, prefix: str = '') -> Iterator[Tuple[str, str]]:
+        """Recursively yield (path, blob oid) for every blob below a tree"""
+        obj = self.read(tree_oid)
+        if obj is None or obj[1] != 'tree':
+            return
+        raw_len = len(tree_oid) // 2  # 20 bytes for SHA-1, 32 for SHA-256 repositories
+        data = obj[2]
+        pos = 0
+        while pos < len(data):
+            space = data.index(b' ', pos)
+            nul = data.index(b'\0', space)
+            mode = data[pos:space]
+            name = data[space + 1:nul].decode('utf-8', errors='surrogateescape')
+            oid = data[nul + 1:nul + 1 + raw_len].hex()
+            pos = nul + 1 + raw_len
+            path = f"{prefix}{name}"
+            if mode == b'40000':
+                yield from self.iter_tree(oid, path + '/')
+            elif mode in (b'100644', b'100755'):
+                yield path, oid
 
 
 class LockedSectionValidator:
@@ -38,72 +623,164 @@ class LockedSectionValidator:
     LOCK_ID_PATTERN = re.compile(r'<!--\s*Lock\s+ID:\s*(\S+)\s*-->', re.IGNORECASE)
     METADATA_END_PATTERN = re.compile(r'<!--\s*END\s+METADATA\s*-->', re.IGNORECASE)
     
-    def __init__(self, contracts_dir: str):
+    # Every marker the scanner reacts to, as one pattern. Whitespace is
+    # restricted to [^\S\n] so a match can never span lines, which keeps
+    # results identical to applying the per-line patterns above.
+    MARKER_PATTERN = re.compile(
+        r'<!--[^\S\n]*(?:'
+        r'LOCKED[^\S\n]+SECTION[^\S\n]+(?:(?P<start>START)|(?P<end>END))[^\S\n]*-->'
+        r'|Lock[^\S\n]+ID:[^\S\n]*(?P<lock_id>\S+)[^\S\n]*-->'
+        r'|(?P<metadata_end>END[^\S\n]+METADATA)[^\S\n]*-->'
+        r')'
+        r'|(?-i:Lock (?P<metadata>Reason|Authority):)',
+        re.IGNORECASE
+    )
+    
+    # Below this many files a worker pool costs more than it saves
+    PARALLEL_MIN_FILES = 32
+    
+    def __init__(self, contracts_dir: str, jobs: int = None, cache_file: str = None,
+                 rebuild_cache: bool = False, manifest=None):
         self.contracts_dir = Path(contracts_dir)
+        self.jobs = jobs if jobs else (os.cpu_count() or 1)
+        self.cache = ParseCache(cache_file, self.contracts_dir, rebuild_cache) if cache_file else None
+        # Optional governance_index.GovernanceIndex; fresh entries replace reading the file
+        self.manifest = manifest
         self.locked_sections: List[LockedSection] = []
         self.errors: List[str] = []
         self.warnings: List[str] = []
+        # Parse result per contract from the last scan, kept for refresh_contracts()
+        self.contract_results: Dict[Path, Tuple[List[LockedSection], List[str]]] = {}
+    
+    def is_contract_file(self, file_path: Path) -> bool:
+        """Whether iter_contract_files() would yield file_path (existence aside)"""
+        return (file_path.suffix == '.md' and file_path.name != 'README.md'
+                and self.contracts_dir in file_path.parents)
+    
+    def iter_contract_files(self) -> Iterator[Path]:
+        """Walk the contracts directory once, yielding each contract in sorted order"""
+        found = []
+        for root, dirs, files in os.walk(self.contracts_dir):
+            dirs.sort()
+            for name in files:
+                if name.endswith('.md') and name != 'README.md':
+                    found.append(Path(root) / name)
+        found.sort()
+        return iter(found)
     
     def scan_contracts(self) -> List[LockedSection]:
         """Scan all agent contracts for locked sections"""
-        contract_files = list(self.contracts_dir.glob('**/*.agent.md')) + \
-                        list(self.contracts_dir.glob('**/*.md'))
+        with TRACE.span('walk'):
+            contract_files = list(self.iter_contract_files())
+        TRACE.count('files_scanned', len(contract_files))
+        results: Dict[Path, Tuple[List[LockedSection], List[str]]] = {}
+        jobs = []
+        
+        with TRACE.span('cache-lookup'):
+            for contract_file in contract_files:
+                indexed = self._manifest_result(contract_file)
+                if indexed is not None:
+                    results[contract_file] = indexed
+                    TRACE.count('manifest_hits')
+                    continue
+                if self.cache is None:
+                    jobs.append((contract_file, None, False))
+                    continue
+                cached, known_digest = self.cache.lookup(contract_file)
+                if cached is not None:
+                    results[contract_file] = cached
+                    TRACE.count('cache_hits')
+                else:
+                    jobs.append((contract_file, known_digest, True))
+        
+        with TRACE.span('read-parse'):
+            for contract_file, stat_key, checked_ns, digest, result in self._run_jobs(jobs):
+                if stat_key is not None:
+                    TRACE.count('bytes_read', stat_key[0])
+                if result is not None:
+                    TRACE.count('files_parsed')
+                if self.cache is not None and stat_key is not None:
+                    if result is None:
+                        result = self.cache.refresh(contract_file, stat_key, checked_ns)
+                    else:
+                        self.cache.store(contract_file, stat_key, checked_ns, digest, result)
+                results[contract_file] = result
+        
+        if self.cache is not None:
+            with TRACE.span('cache-save'):
+                self.cache.prune(contract_files)
+                self.cache.save()
         
         for contract_file in contract_files:
-            if contract_file.name == 'README.md':
-                continue
-            self._scan_file(contract_file)
+            sections, errors = results[contract_file]
+            self.locked_sections.extend(sections)
+            self.errors.extend(errors)
+        self.contract_results = results
         
         return self.locked_sections
     
-    def _scan_file(self, file_path: Path):
-        """Scan a single file for locked sections"""
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
-        except Exception as e:
-            self.errors.append(f"Error reading {file_path}: {e}")
-            return
+    def refresh_contracts(self, changed: Iterable[Path]) -> int:
+        """
+        Re-parse only the given contracts (dropping deleted ones) and reset the
+        findings to the parse results, ready for the checks to run again.
         
-        in_locked_section = False
-        current_section = None
+        Returns the number of contracts re-parsed or removed.
+        """
+        refreshed = 0
+        for contract_file in changed:
+            if not self.is_contract_file(contract_file) and contract_file not in self.contract_results:
+                continue
+            refreshed += 1
+            if not contract_file.is_file():
+                self.contract_results.pop(contract_file, None)
+                continue
+            _, stat_key, checked_ns, digest, result = load_contract((contract_file, None, self.cache is not None))
+            if self.cache is not None and stat_key is not None:
+                self.cache.store(contract_file, stat_key, checked_ns, digest, result)
+            self.contract_results[contract_file] = result
         
-        for i, line in enumerate(lines, start=1):
-            if self.LOCKED_START_PATTERN.search(line):
-                if in_locked_section:
-                    self.errors.append(
-                        f"{file_path}:{i} - Nested locked section detected (missing END marker?)"
-                    )
-                in_locked_section = True
-                current_section = LockedSection('UNKNOWN', str(file_path), i, -1)
-                
-            elif self.LOCKED_END_PATTERN.search(line):
-                if not in_locked_section:
-                    self.errors.append(
-                        f"{file_path}:{i} - Locked section END without START"
-                    )
-                else:
-                    current_section.end_line = i
-                    self.locked_sections.append(current_section)
-                    in_locked_section = False
-                    current_section = None
-            
-            elif in_locked_section and current_section:
-                # Extract Lock ID
-                lock_id_match = self.LOCK_ID_PATTERN.search(line)
-                if lock_id_match:
-                    current_section.lock_id = lock_id_match.group(1)
-                
-                # Extract other metadata (could be enhanced)
-                if 'Lock Reason:' in line:
-                    current_section.metadata['reason'] = line.split(':', 1)[1].strip()
-                elif 'Lock Authority:' in line:
-                    current_section.metadata['authority'] = line.split(':', 1)[1].strip()
+        self.locked_sections = []
+        self.errors = []
+        self.warnings = []
+        for contract_file in sorted(self.contract_results):
+            sections, errors = self.contract_results[contract_file]
+            self.locked_sections.extend(sections)
+            self.errors.extend(errors)
+        return refreshed
+    
+    def _manifest_result(self, contract_file: Path) -> Optional[Tuple[List[LockedSection], List[str]]]:
+        """Parse result for a contract from the governance index, or None if not indexed or stale"""
+        if self.manifest is None:
+            return None
+        entry = self.manifest.lookup(contract_file)
+        if entry is None:
+            return None
+        # The index parsed the file under its repo-relative key
+        key = self.manifest.key(contract_file)
+        sections = [LockedSection.from_dict(str(contract_file), d) for d in entry['locked_sections']]
+        errors = [error.replace(key, str(contract_file), 1) for error in entry['lock_errors']]
+        return sections, errors
+    
+    def _run_jobs(self, jobs: List[Tuple[Path, Optional[str], bool]]) -> Iterable[Tuple]:
+        """
+        Run load_contract jobs, in a process pool when there are enough of them.
         
-        if in_locked_section:
-            self.errors.append(
-                f"{file_path}:{current_section.start_line} - Locked section START without END"
-            )
+        Results are merged by path afterwards, so worker completion order
+        never affects the output.
+        """
+        if self.jobs <= 1 or len(jobs) < self.PARALLEL_MIN_FILES:
+            return map(load_contract, jobs)
+        
+        from concurrent.futures import ProcessPoolExecutor
+        chunksize = max(1, len(jobs) // (self.jobs * 4))
+        with ProcessPoolExecutor(max_workers=self.jobs) as pool:
+            return list(pool.map(load_contract, jobs, chunksize=chunksize))
+    
+    def _scan_file(self, file_path: Path):
+        """Scan a single file for locked sections"""
+        sections, errors = parse_contract(file_path)
+        self.locked_sections.extend(sections)
+        self.errors.extend(errors)
     
     def validate_metadata(self) -> bool:
         """Validate locked section metadata"""
@@ -143,57 +820,333 @@ class LockedSectionValidator:
         
         return success
     
-    def detect_modifications(self, base_ref: str, head_ref: str) -> Tuple[bool, List[str]]:
-        """Detect modifications to locked sections between two git refs"""
-        modified_locks = []
+    def detect_modifications(self, base_ref: str, head_ref: str,
+                             toplevel: Optional[Path] = None) -> Tuple[bool, List[str]]:
+        """
+        Detect modifications to locked sections between two git refs.
+        
+        Streams a zero-context diff of the contracts directory and matches
+        each hunk's head-side line range against the locked sections of the
+        changed file, so edits elsewhere in a contract do not flag its locks.
+        Section line numbers come from the scanned (head) tree. Hunks that
+        remove base lines are also matched against the sections of the base
+        version, read from the object database, so deleting a marker (or a
+        whole locked section or contract) is reported too. Pass toplevel
+        (the work tree root) when it is already known to skip a git call.
+        """
+        indexes = self._build_interval_indexes()
+        touched: Set[int] = set()
+        # Base-side path -> hunks that removed lines from it
+        base_hunks: Dict[str, List[DiffHunk]] = {}
         
         try:
-            # Get diff between base and head
-            diff_output = subprocess.check_output(
-                ['git', 'diff', f'{base_ref}..{head_ref}', '--', '.github/agents/'],
-                universal_newlines=True
-            )
+            if toplevel is None:
+                with TRACE.subprocess('git rev-parse'):
+                    toplevel = Path(subprocess.check_output(
+                        ['git', 'rev-parse', '--show-toplevel'],
+                        universal_newlines=True
+                    ).strip())
+            
+            cmd = [
+                'git', '-c', 'core.quotePath=false', 'diff', '-U0', '--no-color',
+                '--no-ext-diff', '--src-prefix=a/', '--dst-prefix=b/',
+                f'{base_ref}..{head_ref}', '--', str(self.contracts_dir)
+            ]
+            with TRACE.subprocess('git diff'), \
+                    subprocess.Popen(cmd, stdout=subprocess.PIPE, encoding='utf-8',
+                                     errors='replace') as proc:
+                for hunk in iter_diff_hunks(proc.stdout):
+                    if hunk.old_path is not None and hunk.old_count > 0:
+                        base_hunks.setdefault(hunk.old_path, []).append(hunk)
+                    if hunk.path is None:
+                        continue
+                    index = indexes.get(str((toplevel / hunk.path).resolve()))
+                    if index is None:
+                        continue
+                    for section in index.touched_by(hunk):
+                        touched.add(id(section))
+            if proc.returncode != 0:
+                raise subprocess.CalledProcessError(proc.returncode, cmd)
         except subprocess.CalledProcessError as e:
             self.errors.append(f"Error running git diff: {e}")
             return False, []
         
-        # Parse diff to find modifications within locked sections
-        # This is a simplified check - looks for changes to files with locked sections
+        modified_locks = [s.lock_id for s in self.locked_sections if id(s) in touched]
+        if base_hunks:
+            base_locks = self._base_locks_touched(base_ref, base_hunks, toplevel)
+            if base_locks is None:
+                return False, []
+            modified_locks.extend(lock_id for lock_id in base_locks if lock_id not in modified_locks)
+        return len(modified_locks) > 0, modified_locks
+    
+    def _base_locks_touched(self, base_ref: str, base_hunks: Dict[str, List[DiffHunk]],
+                            toplevel: Path) -> Optional[List[str]]:
+        """
+        Lock IDs of base-version sections whose lines the hunks removed or replaced.
+        
+        base_hunks maps toplevel-relative base paths to their hunks. Parse
+        errors in the base version are not reported; they are not the head's.
+        Returns None (with an error recorded) if the objects cannot be read.
+        """
+        locks: List[str] = []
+        try:
+            with TRACE.subprocess('git cat-file'), GitObjectReader(cwd=str(toplevel)) as reader:
+                for path, hunks in base_hunks.items():
+                    name = path.rsplit('/', 1)[-1]
+                    if not name.endswith('.md') or name == 'README.md':
+                        continue
+                    blob = reader.read(f"{base_ref}:{path}")
+                    if blob is None or blob[1] != 'blob':
+                        continue
+                    display_path = f"{base_ref}:{path}"
+                    try:
+                        text = _decode_contract(blob[2])
+                    except UnicodeDecodeError as e:
+                        self.errors.append(f"Error reading {display_path}: {e}")
+                        continue
+                    sections, _ = parse_contract_text(display_path, text)
+                    index = SectionIntervalIndex(sections)
+                    for hunk in hunks:
+                        for section in sorted(index.touched_by(hunk, base=True), key=lambda s: s.start_line):
+                            if section.lock_id not in locks:
+                                locks.append(section.lock_id)
+        except (OSError, subprocess.CalledProcessError) as e:
+            self.errors.append(f"Error reading base contracts at {base_ref}: {e}")
+            return None
+        return locks
+    
+    def _build_interval_indexes(self) -> Dict[str, SectionIntervalIndex]:
+        """Group scanned sections by resolved file path into interval indexes"""
+        by_file: Dict[str, List[LockedSection]] = {}
         for section in self.locked_sections:
-            if section.file_path in diff_output:
-                # Check if the diff touches the locked section line range
-                # (This is a simplified heuristic; production should be more sophisticated)
-                modified_locks.append(section.lock_id)
+            by_file.setdefault(str(Path(section.file_path).resolve()), []).append(section)
+        return {path: SectionIntervalIndex(sections) for path, sections in by_file.items()}
+    
+    def scan_ref(self, reader: GitObjectReader, ref: str) -> Optional[Dict[str, str]]:
+        """
+        List the contract blobs of the contracts directory at a git ref.
         
-        return len(modified_locks) > 0, modified_locks
+        Returns {display path: blob oid}, an empty dict if the directory does
+        not exist at that ref, or None (with an error recorded) if the ref
+        itself cannot be resolved.
+        """
+        if reader.read(f"{ref}^{{tree}}") is None:
+            self.errors.append(f"Git ref '{ref}' not found")
+            return None
+        
+        rel_dir = os.path.relpath(self.contracts_dir)
+        if rel_dir == '.':
+            spec = f"{ref}:./"
+        elif rel_dir.startswith('..'):
+            spec = f"{ref}:{Path(rel_dir).as_posix()}"
+        else:
+            spec = f"{ref}:./{Path(rel_dir).as_posix()}"
+        tree = reader.read(spec)
+        if tree is None or tree[1] != 'tree':
+            return {}
+        
+        blobs = {}
+        for path, oid in reader.iter_tree(tree[0]):
+            name = path.rsplit('/', 1)[-1]
+            if name.endswith('.md') and name != 'README.md':
+                blobs[str(self.contracts_dir / path)] = oid
+        return blobs
     
-    def verify_registry_sync(self, registry_file: str) -> bool:
-        """Verify protection registry is in sync with actual locked sections"""
+    def _parse_blob(self, reader: GitObjectReader, ref: str, path: str, oid: str) -> Dict[str, str]:
+        """Parse one contract blob, returning {lock_id: sha256 of the section text}"""
+        display_path = f"{ref}:{path}"
+        try:
+            text = _decode_contract(reader.read(oid)[2])
+        except Exception as e:
+            self.errors.append(f"Error reading {display_path}: {e}")
+            return {}
+        sections, errors = parse_contract_text(display_path, text)
+        self.errors.extend(errors)
+        lines = text.split('\n')
+        return {
+            section.lock_id: hashlib.sha256(
+                '\n'.join(lines[section.start_line - 1:section.end_line]).encode('utf-8')
+            ).hexdigest()
+            for section in sections
+        }
+    
+    def compare_refs(self, base_ref: str, head_ref: str) -> Optional[Dict[str, List[str]]]:
+        """
+        Compare locked sections between two refs straight from the object database.
+        
+        Only contracts whose blob differs between the refs are read and
+        parsed. Returns sorted Lock ID lists under 'added', 'removed' and
+        'changed' (section text differs), or None if either ref is invalid.
+        """
+        try:
+            with TRACE.subprocess('git cat-file'), GitObjectReader() as reader:
+                base_blobs = self.scan_ref(reader, base_ref)
+                head_blobs = self.scan_ref(reader, head_ref)
+                if base_blobs is None or head_blobs is None:
+                    return None
+                
+                base_locks: Dict[str, str] = {}
+                head_locks: Dict[str, str] = {}
+                for path in sorted(set(base_blobs) | set(head_blobs)):
+                    base_oid = base_blobs.get(path)
+                    head_oid = head_blobs.get(path)
+                    if base_oid == head_oid:
+                        continue
+                    if base_oid is not None:
+                        base_locks.update(self._parse_blob(reader, base_ref, path, base_oid))
+                    if head_oid is not None:
+                        head_locks.update(self._parse_blob(reader, head_ref, path, head_oid))
+        except (OSError, subprocess.CalledProcessError) as e:
+            self.errors.append(f"Error reading git objects: {e}")
+            return None
+        
+        return {
+            'added': sorted(set(head_locks) - set(base_locks)),
+            'removed': sorted(set(base_locks) - set(head_locks)),
+            'changed': sorted(lock_id for lock_id in set(base_locks) & set(head_locks)
+                              if base_locks[lock_id] != head_locks[lock_id]),
+        }
+    
+    def load_registry(self, registry_file: str) -> Optional[ProtectionRegistry]:
+        """Parse the protection registry into a Lock ID index"""
         registry_path = Path(registry_file)
         
         if not registry_path.exists():
             self.errors.append(f"Protection registry not found: {registry_file}")
-            return False
+            return None
         
         try:
             with open(registry_path, 'r', encoding='utf-8') as f:
                 registry_content = f.read()
         except Exception as e:
             self.errors.append(f"Error reading registry: {e}")
-            return False
+            return None
+        TRACE.count('bytes_read', len(registry_content.encode('utf-8')))
+        
+        with TRACE.span('registry-parse'):
+            return ProtectionRegistry.parse_text(registry_content)
+    
+    def verify_registry_sync(self, registry_file: str, registry: ProtectionRegistry = None) -> bool:
+        """
+        Verify protection registry is in sync with actual locked sections.
+        
+        Checks both directions with exact Lock ID lookups. Only a locked
+        section missing from the registry fails the check. Registry entries
+        with no locked section left, Lock IDs registered twice or against
+        another contract, and differences in the registered reason/authority
+        are reported as warnings.
+        """
+        if registry is None:
+            registry = self.load_registry(registry_file)
+            if registry is None:
+                return False
         
         success = True
         
+        for first, duplicate in registry.duplicates:
+            self.warnings.append(
+                f"Lock ID '{duplicate.lock_id}' registered more than once in protection registry "
+                f"(lines {first.line} and {duplicate.line})"
+            )
+        
         # Check that all locked sections are registered
+        found_ids: Set[str] = set()
+        for section in self.locked_sections:
+            found_ids.add(section.lock_id)
+            entry = registry.get(section.lock_id)
+            if entry is None:
+                self.errors.append(
+                    f"Lock ID '{section.lock_id}' in {section.file_path} not found in protection registry"
+                )
+                success = False
+                continue
+            
+            if entry.contract_file and not self._same_contract(entry.contract_file, section.file_path):
+                self.warnings.append(
+                    f"Lock ID '{section.lock_id}' is registered for {entry.contract_file} "
+                    f"but found in {section.file_path}"
+                )
+            
+            for field, registered, in_file, same in (
+                ('reason', entry.reason, section.metadata.get('reason'),
+                 lambda a, b: _metadata_value(a) == _metadata_value(b)),
+                ('authority', entry.authority, section.metadata.get('authority'),
+                 lambda a, b: _authority_set(a) == _authority_set(b)),
+            ):
+                if registered and in_file and not same(registered, in_file):
+                    self.warnings.append(
+                        f"{section.file_path}:{section.start_line} - Lock ID '{section.lock_id}' "
+                        f"{field} differs from protection registry "
+                        f"(registry: '{registered}', contract: '{_metadata_value(in_file)}')"
+                    )
+        
+        # Check that every registration still has a locked section
+        for lock_id, entry in registry.entries.items():
+            if lock_id not in found_ids:
+                self.warnings.append(
+                    f"Protection registry entry '{lock_id}' ({registry_file}:{entry.line}) "
+                    f"has no corresponding locked section in {self.contracts_dir}"
+                )
+        
+        return success
+    
+    def verify_integrity(self, registry_file: str, registry: ProtectionRegistry = None) -> bool:
+        """
+        Verify every locked section against the fingerprint in the protection registry.
+        
+        Needs only the scanned contracts and the registry (no git history),
+        so it works on shallow clones and in pre-commit hooks.
+        """
+        if registry is None:
+            registry = self.load_registry(registry_file)
+            if registry is None:
+                return False
+        
+        success = True
+        found_ids: Set[str] = set()
+        
         for section in self.locked_sections:
-            if section.lock_id not in registry_content:
+            found_ids.add(section.lock_id)
+            entry = registry.get(section.lock_id)
+            if entry is None:
                 self.errors.append(
                     f"Lock ID '{section.lock_id}' in {section.file_path} not found in protection registry"
                 )
                 success = False
+            elif not entry.fingerprint:
+                self.errors.append(
+                    f"{section.file_path}:{section.start_line} - No fingerprint registered for "
+                    f"Lock ID '{section.lock_id}' (current: {section.fingerprint})"
+                )
+                success = False
+            elif entry.fingerprint != section.fingerprint:
+                self.errors.append(
+                    f"{section.file_path}:{section.start_line} - Locked section '{section.lock_id}' "
+                    f"does not match its registered fingerprint "
+                    f"(registry: {entry.fingerprint}, contract: {section.fingerprint})"
+                )
+                success = False
+        
+        for lock_id, entry in registry.entries.items():
+            if entry.fingerprint and lock_id not in found_ids:
+                self.errors.append(
+                    f"Fingerprinted lock '{lock_id}' ({registry_file}:{entry.line}) "
+                    f"not found in {self.contracts_dir}"
+                )
+                success = False
         
         return success
     
+    @staticmethod
+    def _same_contract(registered: str, actual: str) -> bool:
+        """Registry paths are repo-relative; scanned paths may be relative to cwd or absolute"""
+        registered_path = Path(registered)
+        actual_path = Path(actual)
+        if registered_path.resolve() == actual_path.resolve():
+            return True
+        parts = [p for p in registered_path.parts if p not in ('.', '')]
+        return list(actual_path.resolve().parts[-len(parts):]) == parts if parts else False
+    
     def print_summary(self):
         """Print validation summary"""
         print("\n" + "="*80)
@@ -220,13 +1173,278 @@ class LockedSectionValidator:
         print("="*80 + "\n")
 
 
+def _decode_contract(data: bytes) -> str:
+    """Decode contract bytes exactly as open(path, 'r', encoding='utf-8') would"""
+    return data.decode('utf-8').replace('\r\n', '\n').replace('\r', '\n')
+
+
+def load_contract(job: Tuple[Path, Optional[str], bool]) -> Tuple:
+    """
+    Read and parse one contract for scan_contracts (runs in worker processes).
+    
+    job is (path, known_digest, want_digest). Returns
+    (path, (size, mtime_ns), checked_ns, digest, result); result is None when
+    the content hash equals known_digest, meaning the cached parse still
+    applies. stat data is None when the file could not be read, so read
+    failures are never cached.
+    """
+    file_path, known_digest, want_digest = job
+    try:
+        st = os.stat(file_path)
+        checked_ns = time.time_ns()
+        with open(file_path, 'rb') as f:
+            data = f.read()
+    except Exception as e:
+        return file_path, None, 0, None, ([], [f"Error reading {file_path}: {e}"])
+    
+    digest = hashlib.sha256(data).hexdigest() if want_digest else None
+    if digest is not None and digest == known_digest:
+        return file_path, (st.st_size, st.st_mtime_ns), checked_ns, digest, None
+    
+    try:
+        text = _decode_contract(data)
+    except Exception as e:
+        result = ([], [f"Error reading {file_path}: {e}"])
+    else:
+        result = parse_contract_text(file_path, text)
+    return file_path, (st.st_size, st.st_mtime_ns), checked_ns, digest, result
+
+
+def parse_contract(file_path: Path) -> Tuple[List[LockedSection], List[str]]:
+    """Read and parse a single contract file for locked sections"""
+    try:
+        with open(file_path, 'rb') as f:
+            text = _decode_contract(f.read())
+    except Exception as e:
+        return [], [f"Error reading {file_path}: {e}"]
+    return parse_contract_text(file_path, text)
+
+
+def parse_contract_text(file_path: Path, text: str) -> Tuple[List[LockedSection], List[str]]:
+    """
+    Parse contract text for locked sections, returning the sections found and any errors.
+    
+    Rather than testing every line, the scanner jumps straight to the next
+    line that can matter: outside a section only lines containing "<!--"
+    (a START or stray END marker), inside a section also lines containing
+    "Lock " (metadata). Each such line is classified once with
+    MARKER_PATTERN and handled exactly as a per-line scan would, so line
+    numbers and messages are unchanged.
+    """
+    sections: List[LockedSection] = []
+    errors: List[str] = []
+    marker_pattern = LockedSectionValidator.MARKER_PATTERN
+    
+    in_locked_section = False
+    current_section = None
+    # Line numbers are only needed for START/END lines, so newlines are
+    # counted lazily from the last such line rather than on every hit
+    line_no = 1
+    counted = 0
+    pos = 0
+    meta_hit = -1
+    body_start = 0
+    metadata_ended = False
+    
+    while True:
+        hit = text.find('<!--', pos)
+        if in_locked_section:
+            # Metadata lines need not be comments, so inside a section the
+            # next "Lock " may come first. Its position is remembered until
+            # passed to avoid rescanning long section bodies.
+            if meta_hit != -2 and meta_hit < pos:
+                meta_hit = text.find('Lock ', pos)
+                if meta_hit < 0:
+                    meta_hit = -2
+            if meta_hit >= 0 and (hit < 0 or meta_hit < hit):
+                hit = meta_hit
+        if hit < 0:
+            break
+        
+        line_start = text.rfind('\n', 0, hit) + 1
+        line_end = text.find('\n', hit)
+        if line_end < 0:
+            line_end = len(text)
+        pos = line_end + 1
+        line = text[line_start:line_end]
+        
+        has_start = has_end = has_metadata_end = False
+        lock_id = None
+        marker = marker_pattern.search(line)
+        while marker is not None:
+            kind = marker.lastgroup
+            if kind == 'start':
+                # START outranks everything else on the line
+                has_start = True
+                break
+            elif kind == 'end':
+                has_end = True
+            elif kind == 'lock_id' and lock_id is None:
+                lock_id = marker.group('lock_id')
+            elif kind == 'metadata_end':
+                has_metadata_end = True
+            # Only another comment later on the line can change the outcome
+            next_comment = line.find('<!--', marker.end())
+            if next_comment < 0:
+                break
+            marker = marker_pattern.search(line, next_comment)
+        
+        if has_start or has_end:
+            line_no += text.count('\n', counted, line_start)
+            counted = line_start
+        
+        if has_start:
+            if in_locked_section:
+                errors.append(
+                    f"{file_path}:{line_no} - Nested locked section detected (missing END marker?)"
+                )
+            in_locked_section = True
+            current_section = LockedSection('UNKNOWN', str(file_path), line_no, -1)
+            body_start = pos
+            metadata_ended = False
+            
+        elif has_end:
+            if not in_locked_section:
+                errors.append(
+                    f"{file_path}:{line_no} - Locked section END without START"
+                )
+            else:
+                current_section.end_line = line_no
+                current_section.body = text[body_start:line_start]
+                sections.append(current_section)
+                in_locked_section = False
+                current_section = None
+        
+        elif in_locked_section and current_section:
+            if lock_id is not None:
+                current_section.lock_id = lock_id
+            
+            if has_metadata_end and not metadata_ended:
+                body_start = pos
+                metadata_ended = True
+            
+            # Extract other metadata (could be enhanced)
+            if 'Lock Reason:' in line:
+                current_section.metadata['reason'] = line.split(':', 1)[1].strip()
+            elif 'Lock Authority:' in line:
+                current_section.metadata['authority'] = line.split(':', 1)[1].strip()
+    
+    if in_locked_section:
+        errors.append(
+            f"{file_path}:{current_section.start_line} - Locked section START without END"
+        )
+    
+    return sections, errors
+
+
+# Modes that only need the scanned contracts and the registry, so --watch can re-run them
+WATCH_MODES = ('validate-metadata', 'verify-registry', 'verify-integrity')
+
+
+def run_checks(validator: LockedSectionValidator, mode: str, registry_file: str,
+               registry: ProtectionRegistry = None) -> bool:
+    """Run the checks of one of WATCH_MODES over the validator's scanned contracts"""
+    if mode == 'validate-metadata':
+        return validator.validate_metadata() and validator.check_duplicate_lock_ids()
+    if mode == 'verify-registry':
+        return validator.verify_registry_sync(registry_file, registry)
+    return validator.verify_integrity(registry_file, registry)
+
+
+def watch_contracts(validator: LockedSectionValidator, mode: str, registry_file: str,
+                    polling: bool = False, poll_interval: float = None) -> bool:
+    """
+    Re-run the checks of mode whenever a contract or the registry changes, until interrupted.
+    
+    The validator must already have scanned the contracts. Only changed
+    contracts are re-parsed and the registry is re-read only when it changed;
+    the checks themselves then run over the in-memory state. Prints the
+    findings that appeared or were resolved by each change. Returns whether
+    the last run passed.
+    """
+    from file_watch import DEFAULT_POLL_INTERVAL, create_watcher
+    
+    registry_path = Path(registry_file)
+    registry = None
+    if mode != 'validate-metadata':
+        registry = validator.load_registry(registry_file)
+    success = registry is not None or mode == 'validate-metadata'
+    if success:
+        success = run_checks(validator, mode, registry_file, registry)
+    validator.print_summary()
+    
+    watcher, mechanism = create_watcher(
+        [validator.contracts_dir],
+        [registry_path] if mode != 'validate-metadata' and registry_path.parent.is_dir() else [],
+        polling=polling,
+        interval=poll_interval or DEFAULT_POLL_INTERVAL
+    )
+    print(f"👀 Watching {validator.contracts_dir}"
+          f"{'' if mode == 'validate-metadata' else ' and ' + registry_file} ({mechanism}); Ctrl-C to stop")
+    sys.stdout.flush()
+    
+    findings = set(validator.errors) | set(validator.warnings)
+    try:
+        while True:
+            changed = watcher.wait()
+            start = time.perf_counter()
+            if changed is None:
+                # Events were lost: re-parse every contract, known or new
+                changed = set(validator.iter_contract_files()) | set(validator.contract_results)
+                changed.add(registry_path)
+            contracts = set()
+            for path in changed:
+                if validator.is_contract_file(path) or path in validator.contract_results:
+                    contracts.add(path)
+                elif path != registry_path:
+                    # A directory moved or deleted as a whole takes its contracts with it
+                    contracts.update(known for known in validator.contract_results if path in known.parents)
+            registry_changed = registry_path in changed and mode != 'validate-metadata'
+            if not contracts and not registry_changed:
+                continue
+            
+            with TRACE.span('watch-refresh'):
+                validator.refresh_contracts(contracts)
+                if registry_changed:
+                    registry = validator.load_registry(registry_file)
+                success = registry is not None or mode == 'validate-metadata'
+                if success:
+                    success = run_checks(validator, mode, registry_file, registry)
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            
+            current = set(validator.errors) | set(validator.warnings)
+            names = sorted(str(path) for path in contracts)
+            if registry_changed:
+                names.append(registry_file)
+            label = names[0] if len(names) == 1 else f"{len(names)} files"
+            print(f"[{time.strftime('%H:%M:%S')}] {label} changed: "
+                  f"{'✅' if success and not validator.errors else '❌'} "
+                  f"{len(validator.errors)} errors, {len(validator.warnings)} warnings ({elapsed_ms:.1f} ms)")
+            for finding in validator.errors + validator.warnings:
+                if finding not in findings:
+                    print(f"  + {finding}")
+            for finding in sorted(findings - current):
+                print(f"  - {finding} (resolved)")
+            sys.stdout.flush()
+            findings = current
+    except KeyboardInterrupt:
+        print("\nStopped watching")
+    finally:
+        watcher.close()
+        if validator.cache is not None:
+            validator.cache.prune(validator.contract_results)
+            validator.cache.save()
+    return success and not validator.errors
+
+
 def main():
     parser = argparse.ArgumentParser(
         description='Validate locked section integrity in agent contracts'
     )
     parser.add_argument(
         '--mode',
-        choices=['detect-modifications', 'validate-metadata', 'verify-registry'],
+        choices=['detect-modifications', 'validate-metadata', 'verify-registry', 'compare-refs',
+                 'verify-integrity', 'print-fingerprints'],
         required=True,
         help='Validation mode'
     )
@@ -242,17 +1460,102 @@ def main():
     )
     parser.add_argument(
         '--base-ref',
-        help='Base git reference for modification detection'
+        help='Base git reference for modification detection / ref comparison'
     )
     parser.add_argument(
         '--head-ref',
-        help='Head git reference for modification detection'
+        help='Head git reference for modification detection / ref comparison'
+    )
+    parser.add_argument(
+        '--cache-file',
+        help='Parse cache location (default: a per-contracts-directory file in .cache/check_locked_sections/ '
+             'of the repository holding this script)'
+    )
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Bypass the parse cache entirely (neither read nor written)'
+    )
+    parser.add_argument(
+        '--rebuild-cache',
+        action='store_true',
+        help='Ignore any existing parse cache and rewrite it from a full scan'
+    )
+    parser.add_argument(
+        '--jobs',
+        type=int,
+        default=None,
+        help='Worker processes for parsing contracts (default: CPU count; 1 disables the pool)'
+    )
+    parser.add_argument(
+        '--manifest',
+        help='Governance index manifest (governance_index.py) to take contract parse results from'
+    )
+    parser.add_argument(
+        '--watch',
+        action='store_true',
+        help=f'Keep running and re-validate on every contract or registry change ({", ".join(WATCH_MODES)})'
+    )
+    parser.add_argument(
+        '--poll',
+        action='store_true',
+        help='With --watch, poll file stat data instead of using inotify'
+    )
+    parser.add_argument(
+        '--poll-interval',
+        type=float,
+        default=None,
+        help='Seconds between polls when polling (default: 0.25)'
+    )
+    parser.add_argument(
+        '--timings',
+        action='store_true',
+        help='Print per-phase timings and counters to stderr at exit'
+    )
+    parser.add_argument(
+        '--trace',
+        metavar='FILE',
+        help='Append a JSON trace record (phases, counters, spans) to FILE'
+    )
+    parser.add_argument(
+        '--profile',
+        metavar='FILE',
+        help='Write cProfile statistics of the run to FILE'
     )
     
     args = parser.parse_args()
     
-    validator = LockedSectionValidator(args.contracts_dir)
-    validator.scan_contracts()
+    if args.watch and args.mode not in WATCH_MODES:
+        parser.error(f"--watch supports --mode {', '.join(WATCH_MODES)}")
+    
+    if args.timings or args.trace or args.profile:
+        TRACE.enable('check_locked_sections', timings=args.timings,
+                     trace_file=args.trace, profile_file=args.profile)
+    
+    manifest = None
+    if args.manifest:
+        from governance_index import GovernanceIndex
+        manifest = GovernanceIndex.load(args.manifest)
+        if manifest is None:
+            print(f"Warning: governance index {args.manifest} is missing or outdated; reading contracts directly",
+                  file=sys.stderr)
+    
+    with TRACE.span('cache-load'):
+        validator = LockedSectionValidator(
+            args.contracts_dir,
+            jobs=args.jobs,
+            cache_file=None if args.no_cache else args.cache_file or default_cache_file(args.contracts_dir),
+            rebuild_cache=args.rebuild_cache,
+            manifest=manifest
+        )
+    if args.mode != 'compare-refs':
+        # compare-refs reads both sides from the object database instead
+        with TRACE.span('scan'):
+            validator.scan_contracts()
+    
+    if args.watch:
+        sys.exit(0 if watch_contracts(validator, args.mode, args.registry_file,
+                                      args.poll, args.poll_interval) else 1)
     
     success = True
     
@@ -261,7 +1564,8 @@ def main():
             print("Error: --base-ref and --head-ref required for modification detection")
             sys.exit(1)
         
-        modified, modified_locks = validator.detect_modifications(args.base_ref, args.head_ref)
+        with TRACE.span('detect-modifications'):
+            modified, modified_locks = validator.detect_modifications(args.base_ref, args.head_ref)
         
         if modified:
             print("locked_sections_modified=true")
@@ -287,13 +1591,46 @@ def main():
                 with open(os.environ['GITHUB_OUTPUT'], 'a') as f:
                     f.write(f"locked_sections_modified=false\n")
     
-    elif args.mode == 'validate-metadata':
-        success = validator.validate_metadata() and validator.check_duplicate_lock_ids()
+    elif args.mode in WATCH_MODES:
+        with TRACE.span(args.mode):
+            success = run_checks(validator, args.mode, args.registry_file)
         validator.print_summary()
     
-    elif args.mode == 'verify-registry':
-        success = validator.verify_registry_sync(args.registry_file)
-        validator.print_summary()
+    elif args.mode == 'print-fingerprints':
+        print("| Lock ID | Contract File | Fingerprint |")
+        print("|---------|---------------|-------------|")
+        for section in validator.locked_sections:
+            print(f"| `{section.lock_id}` | `{section.file_path}` | `{section.fingerprint}` |")
+        success = not validator.errors
+        if validator.errors:
+            validator.print_summary()
+    
+    elif args.mode == 'compare-refs':
+        if not args.base_ref or not args.head_ref:
+            print("Error: --base-ref and --head-ref required for ref comparison")
+            sys.exit(1)
+        
+        with TRACE.span('compare-refs'):
+            changes = validator.compare_refs(args.base_ref, args.head_ref)
+        if changes is None:
+            success = False
+        else:
+            any_changes = any(changes.values())
+            print(f"locked_sections_changed={'true' if any_changes else 'false'}")
+            print(f"\nLocked sections {args.base_ref} -> {args.head_ref}:")
+            for label, key in (('Added', 'added'), ('Removed', 'removed'), ('Changed', 'changed')):
+                print(f"\n{label} ({len(changes[key])}):")
+                for lock_id in changes[key]:
+                    print(f"  - {lock_id}")
+            
+            if 'GITHUB_OUTPUT' in os.environ:
+                with open(os.environ['GITHUB_OUTPUT'], 'a') as f:
+                    f.write(f"locked_sections_changed={'true' if any_changes else 'false'}\n")
+                    f.write(f"locks_added={', '.join(changes['added'])}\n")
+                    f.write(f"locks_removed={', '.join(changes['removed'])}\n")
+                    f.write(f"locks_changed={', '.join(changes['changed'])}\n")
+        if validator.errors:
+            validator.print_summary()
     
     sys.exit(0 if success else 1)
 
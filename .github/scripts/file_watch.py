@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+"""
+File Change Watching
+
+Purpose: Report which files changed under watched directories, for long-running
+         incremental validation (check_locked_sections.py --watch)
+Version: 1.0.0
+
+On Linux the kernel's inotify interface is used through ctypes, so a save is
+reported as soon as the editor closes or renames the file. Elsewhere, or when
+inotify is unavailable (e.g. the watch limit is exhausted), a polling watcher
+compares stat snapshots of the watched trees instead.
+
+Both watchers report paths as the watched directory joined with the path
+below it, so they compare equal to paths produced by os.walk on the same
+directory. wait() returns None when events were lost (inotify queue overflow);
+callers should then rescan everything they track.
+"""
+
+import ctypes
+import errno
+import os
+import select
+import struct
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+# inotify(7) constants
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+
+# Completed writes, renames and deletions; IN_MODIFY would fire mid-write
+WATCH_MASK = (IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+              | IN_DELETE_SELF | IN_MOVE_SELF | IN_ATTRIB | IN_ONLYDIR)
+
+EVENT_HEADER = struct.Struct('iIII')
+
+# Events arriving within this many seconds of each other form one change set,
+# so an editor's write-temp-then-rename save is validated once
+DEBOUNCE_SECONDS = 0.02
+
+DEFAULT_POLL_INTERVAL = 0.25
+
+
+class InotifyWatcher:
+    """Watches directory trees (and single files, via their directory) with inotify"""
+    
+    def __init__(self, directories: List[Path], files: List[Path] = ()):
+        # The running interpreter is linked against libc, so no library lookup is needed
+        self._libc = ctypes.CDLL(None, use_errno=True)
+        if not hasattr(self._libc, 'inotify_init1'):
+            raise OSError(errno.ENOSYS, 'inotify is not available')
+        self._fd = self._libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), 'inotify_init1 failed')
+        # wd -> (directory, recursive)
+        self._watches: Dict[int, Tuple[Path, bool]] = {}
+        # Files watched through a non-recursive directory watch: directory -> names
+        self._files: Dict[Path, Set[str]] = {}
+        try:
+            for directory in directories:
+                self._add_tree(Path(directory))
+            for file_path in files:
+                file_path = Path(file_path)
+                parent = file_path.parent
+                if parent not in self._files:
+                    self._add_watch(parent, recursive=False)
+                self._files.setdefault(parent, set()).add(file_path.name)
+        except OSError:
+            self.close()
+            raise
+    
+    def _add_watch(self, directory: Path, recursive: bool) -> int:
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(str(directory)), WATCH_MASK)
+        if wd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, f"inotify_add_watch({directory}) failed: {os.strerror(err)}")
+        if wd in self._watches:
+            # Already watched recursively; keep the wider watch
+            recursive = recursive or self._watches[wd][1]
+        self._watches[wd] = (directory, recursive)
+        return wd
+    
+    def _add_tree(self, root: Path) -> List[Path]:
+        """Watch root and its subdirectories; returns the files already in them"""
+        found = []
+        for dirpath, dirs, files in os.walk(root):
+            self._add_watch(Path(dirpath), recursive=True)
+            found.extend(Path(dirpath) / name for name in files)
+        return found
+    
+    def fileno(self) -> int:
+        return self._fd
+    
+    def close(self):
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+    
+    def _read_events(self, changed: Set[Path]) -> bool:
+        """Drain pending events into changed; False if the kernel queue overflowed"""
+        complete = True
+        while True:
+            try:
+                data = os.read(self._fd, 64 * 1024)
+            except BlockingIOError:
+                return complete
+            offset = 0
+            while offset < len(data):
+                wd, mask, _, length = EVENT_HEADER.unpack_from(data, offset)
+                offset += EVENT_HEADER.size
+                name = os.fsdecode(data[offset:offset + length].rstrip(b'\0'))
+                offset += length
+                if mask & IN_Q_OVERFLOW:
+                    complete = False
+                    continue
+                if mask & IN_IGNORED:
+                    self._watches.pop(wd, None)
+                    continue
+                if wd not in self._watches:
+                    continue
+                directory, recursive = self._watches[wd]
+                if not name:
+                    # The watched directory itself was deleted or moved
+                    changed.add(directory)
+                    continue
+                if not recursive and name not in self._files.get(directory, ()):
+                    continue
+                path = directory / name
+                if mask & IN_ISDIR and recursive and mask & (IN_CREATE | IN_MOVED_TO):
+                    try:
+                        # Files may land in a new directory before its watch exists
+                        changed.update(self._add_tree(path))
+                    except OSError:
+                        complete = False
+                changed.add(path)
+    
+    def wait(self, timeout: Optional[float] = None) -> Optional[Set[Path]]:
+        """
+        Block until something changes (or timeout seconds pass).
+        
+        Returns the changed paths (empty on timeout), or None if events were
+        lost and the caller has to rescan.
+        """
+        changed: Set[Path] = set()
+        ready, _, _ = select.select([self._fd], [], [], timeout)
+        if not ready:
+            return changed
+        complete = self._read_events(changed)
+        while select.select([self._fd], [], [], DEBOUNCE_SECONDS)[0]:
+            complete = self._read_events(changed) and complete
+        return changed if complete else None
+
+
+class PollingWatcher:
+    """Watches directory trees and single files by comparing stat snapshots"""
+    
+    def __init__(self, directories: List[Path], files: List[Path] = (),
+                 interval: float = DEFAULT_POLL_INTERVAL):
+        self.directories = [Path(d) for d in directories]
+        self.files = [Path(f) for f in files]
+        self.interval = interval
+        self._snapshot = self._take_snapshot()
+    
+    def _take_snapshot(self) -> Dict[Path, Tuple[int, int, int]]:
+        snapshot = {}
+        pending = list(self.directories)
+        while pending:
+            directory = pending.pop()
+            try:
+                entries = list(os.scandir(directory))
+            except OSError:
+                continue
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(Path(directory) / entry.name)
+                        continue
+                    st = entry.stat()
+                except OSError:
+                    continue
+                snapshot[Path(directory) / entry.name] = (st.st_mtime_ns, st.st_size, st.st_ino)
+        for file_path in self.files:
+            try:
+                st = os.stat(file_path)
+            except OSError:
+                continue
+            snapshot[file_path] = (st.st_mtime_ns, st.st_size, st.st_ino)
+        return snapshot
+    
+    def close(self):
+        pass
+    
+    def wait(self, timeout: Optional[float] = None) -> Optional[Set[Path]]:
+        """Poll until something changes (or timeout seconds pass); returns the changed paths"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            snapshot = self._take_snapshot()
+            changed = {path for path in snapshot.keys() | self._snapshot.keys()
+                       if snapshot.get(path) != self._snapshot.get(path)}
+            self._snapshot = snapshot
+            if changed or (deadline is not None and time.monotonic() >= deadline):
+                return changed
+            time.sleep(self.interval if deadline is None else
+                       max(0.0, min(self.interval, deadline - time.monotonic())))
+
+
+def create_watcher(directories: List[Path], files: List[Path] = (), polling: bool = False,
+                   interval: float = DEFAULT_POLL_INTERVAL):
+    """
+    An inotify watcher where the platform supports it, otherwise a polling one.
+    
+    Returns (watcher, description) - the description names the mechanism in use.
+    """
+    if not polling:
+        try:
+            return InotifyWatcher(directories, files), 'inotify'
+        except (OSError, TypeError) as e:
+            reason = e.strerror if isinstance(e, OSError) and e.strerror else str(e)
+            return PollingWatcher(directories, files, interval), f'polling every {interval:g}s (inotify: {reason})'
+    return PollingWatcher(directories, files, interval), f'polling every {interval:g}s'
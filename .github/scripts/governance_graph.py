@@ -0,0 +1,326 @@
+#!/usr/bin/env python3
+"""
+Governance Dependency Graph
+
+Purpose: Map each canon to the agent contracts and locked sections that cite it,
+         so a change to a few canons re-validates only the affected contracts,
+         locks and inventory entries
+Version: 1.0.0
+
+The graph is derived from the governance index (governance_index.py): every
+file's declared `Authority:` values and every lock's authority (inline
+`Lock ID: X | Authority: ...` markers and `Lock Authority:` metadata). Citations
+are resolved to indexed files by path, then by file name, with or without the
+`.md` suffix (`GOVERNANCE_RIPPLE_MODEL` -> governance/canon/GOVERNANCE_RIPPLE_MODEL.md),
+then to markdown files on disk outside the indexed roots (BUILD_PHILOSOPHY.md).
+Canons that cite a changed canon are affected in turn.
+
+Usage:
+    python .github/scripts/governance_graph.py --base-ref REF [--head-ref REF] [--json]
+    python .github/scripts/governance_graph.py --changed PATH [PATH ...] [--json]
+    python .github/scripts/governance_graph.py --dependents PATH [--json]
+
+Exit Codes:
+  0 = affected set (or dependents) printed
+  1 = git could not diff the given refs
+  2 = invalid usage
+"""
+
+import argparse
+import json
+import os
+import re
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set
+
+from governance_index import DEFAULT_MANIFEST, GovernanceIndex
+
+DEFAULT_CONTRACTS_DIR = '.github/agents'
+DEFAULT_INVENTORY = 'governance/CANON_INVENTORY.json'
+DEFAULT_REGISTRY = 'governance/contracts/protection-registry.md'
+
+# Changes under these paths alter how every document is validated
+FULL_RUN_PATHS = ['.github/scripts/', '.github/workflows/', 'scripts/sync_repo_inventory.py',
+                  'scripts/governance_trace.py']
+
+CITATION_TOKEN_PATTERN = re.compile(r'[\w./-]+')
+
+# Preferred location when a bare file name matches several indexed files
+CANON_DIR = 'governance/canon/'
+
+
+class DependencyGraph:
+    """
+    Citation edges between indexed documents, held in both directions.
+    
+    Keys are repo-relative POSIX paths. Locks are identified by Lock ID and
+    belong to the contract they appear in.
+    """
+    
+    def __init__(self, contracts_dir: str = DEFAULT_CONTRACTS_DIR):
+        self.contracts_dir = Path(contracts_dir).as_posix().rstrip('/') + '/'
+        self.documents: Set[str] = set()
+        self.cites: Dict[str, Set[str]] = {}
+        self.cited_by: Dict[str, Set[str]] = {}
+        self.lock_cites: Dict[str, Set[str]] = {}
+        self.locks_citing: Dict[str, Set[str]] = {}
+        self.lock_files: Dict[str, str] = {}
+        self.inventory: Dict[str, str] = {}
+        self._by_name: Dict[str, str] = {}
+        self._on_disk: Dict[str, bool] = {}
+        self.repo_root = Path('.')
+    
+    @classmethod
+    def from_index(cls, index: GovernanceIndex, inventory: Optional[Dict] = None,
+                   contracts_dir: str = DEFAULT_CONTRACTS_DIR) -> 'DependencyGraph':
+        """Build the graph from index entries and, optionally, a CANON_INVENTORY.json document"""
+        graph = cls(contracts_dir)
+        graph.repo_root = index.repo_root
+        graph.documents = set(index.files)
+        for canon in (inventory or {}).get('canons', []):
+            path = canon.get('path')
+            if path:
+                graph.inventory[path] = canon.get('filename') or path.rsplit('/', 1)[-1]
+        
+        for key in sorted(graph.documents | set(graph.inventory)):
+            name = key.rsplit('/', 1)[-1]
+            current = graph._by_name.get(name)
+            if current is None or (key.startswith(CANON_DIR) and not current.startswith(CANON_DIR)):
+                graph._by_name[name] = key
+        
+        for key, entry in index.files.items():
+            for value in entry.get('authority', []):
+                for target in graph.resolve(value):
+                    if target != key:
+                        graph._add_edge(graph.cites, graph.cited_by, key, target)
+            for lock in entry.get('lock_authorities', []):
+                graph.lock_files.setdefault(lock['lock_id'], key)
+                for target in graph.resolve(lock['authority']):
+                    graph._add_edge(graph.lock_cites, graph.locks_citing, lock['lock_id'], target)
+            for section in entry.get('locked_sections', []):
+                graph.lock_files.setdefault(section['lock_id'], key)
+        return graph
+    
+    @staticmethod
+    def _add_edge(forward: Dict[str, Set[str]], backward: Dict[str, Set[str]], source: str, target: str):
+        forward.setdefault(source, set()).add(target)
+        backward.setdefault(target, set()).add(source)
+    
+    def resolve(self, value: str) -> List[str]:
+        """Indexed files cited by an Authority value, in order of appearance"""
+        targets = []
+        for token in CITATION_TOKEN_PATTERN.findall(value):
+            token = token.rstrip('./')
+            if token.startswith('./'):
+                token = token[2:]
+            target = None
+            for candidate in (token, token + '.md'):
+                if candidate in self.documents or candidate in self.inventory:
+                    target = candidate
+                elif '/' not in candidate:
+                    target = self._by_name.get(candidate)
+                else:
+                    target = self._by_name.get(candidate.rsplit('/', 1)[-1])
+                if target is None and candidate.endswith('.md') and self._exists(candidate):
+                    # Cited files outside the indexed roots, e.g. ./BUILD_PHILOSOPHY.md
+                    target = candidate
+                if target is not None:
+                    break
+            if target is not None and target not in targets:
+                targets.append(target)
+        return targets
+    
+    def _exists(self, key: str) -> bool:
+        if key not in self._on_disk:
+            self._on_disk[key] = (self.repo_root / key).is_file()
+        return self._on_disk[key]
+    
+    def is_contract(self, key: str) -> bool:
+        return key.startswith(self.contracts_dir) and key.endswith('.md')
+    
+    def dependents(self, key: str) -> Set[str]:
+        """key and every document citing it, directly or through other citing documents"""
+        seen = {key}
+        pending = [key]
+        while pending:
+            for source in self.cited_by.get(pending.pop(), ()):
+                if source not in seen:
+                    seen.add(source)
+                    pending.append(source)
+        return seen
+    
+    def affected(self, changed: Iterable[str]) -> Dict:
+        """
+        What has to be re-validated after the given paths changed.
+        
+        Returns a dict of sorted lists: 'changed', 'documents' (changed files
+        plus everything depending on them), 'contracts', 'locks', 'inventory'
+        (CANON_INVENTORY paths whose recorded hash may be stale), plus 'full'
+        (True when a change affects every document, e.g. a gate script) and
+        'registry' (True when the protection registry itself changed).
+        """
+        changed = sorted({Path(path).as_posix() for path in changed})
+        full = any(path.startswith(prefix) or path == prefix.rstrip('/')
+                   for path in changed for prefix in FULL_RUN_PATHS)
+        
+        documents: Set[str] = set()
+        for path in changed:
+            documents |= self.dependents(path)
+        
+        if full:
+            documents |= self.documents
+        contracts = {key for key in documents if self.is_contract(key)}
+        locks = {lock_id for lock_id, key in self.lock_files.items() if key in contracts}
+        for key in documents:
+            locks |= self.locks_citing.get(key, set())
+        # A lock's contract is re-validated whenever the lock is
+        contracts |= {self.lock_files[lock_id] for lock_id in locks
+                      if self.is_contract(self.lock_files.get(lock_id, ''))}
+        
+        if full or DEFAULT_INVENTORY in changed:
+            inventory = set(self.inventory)
+        else:
+            inventory = {key for key in changed if key in self.inventory}
+        
+        return {
+            'changed': changed,
+            'full': full,
+            'registry': DEFAULT_REGISTRY in changed,
+            'documents': sorted(documents),
+            'contracts': sorted(contracts),
+            'locks': sorted(locks),
+            'inventory': sorted(inventory),
+        }
+
+
+def load_inventory(path: str) -> Optional[Dict]:
+    """CANON_INVENTORY.json contents, or None if missing or unreadable"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def git_changed_paths(base_ref: str, head_ref: Optional[str] = None) -> Optional[List[str]]:
+    """
+    Paths changed between base_ref and head_ref (or the working tree), both
+    sides of renames included. None if git rejected the refs.
+    """
+    cmd = ['git', 'diff', '--name-only', '-z', '--no-renames', '--no-ext-diff', base_ref]
+    if head_ref:
+        cmd.append(head_ref)
+    proc = subprocess.run(cmd + ['--'], stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+    if proc.returncode != 0:
+        return None
+    return [path for path in proc.stdout.decode('utf-8', errors='replace').split('\0') if path]
+
+
+def load_graph(manifest_file: str, inventory_file: str = DEFAULT_INVENTORY,
+               contracts_dir: str = DEFAULT_CONTRACTS_DIR, jobs: Optional[int] = None) -> DependencyGraph:
+    """Refresh the governance index (reusing the saved manifest) and build the graph from it"""
+    previous = GovernanceIndex.load(manifest_file)
+    index = GovernanceIndex('.').build(previous, jobs)
+    try:
+        index.save(manifest_file)
+    except OSError as e:
+        print(f"Warning: could not write governance index {manifest_file}: {e}", file=sys.stderr)
+    return DependencyGraph.from_index(index, load_inventory(inventory_file), contracts_dir)
+
+
+def print_affected(affected: Dict):
+    print(f"Changed files: {len(affected['changed'])}")
+    if affected['full']:
+        print("  Gate tooling changed: everything is affected")
+    if affected['registry']:
+        print(f"  Protection registry changed: {DEFAULT_REGISTRY}")
+    for label, field in (('Documents', 'documents'), ('Contracts', 'contracts'),
+                         ('Locks', 'locks'), ('Inventory entries', 'inventory')):
+        print(f"\n{label} ({len(affected[field])}):")
+        for item in affected[field]:
+            print(f"  - {item}")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Show which contracts, locks and inventory entries depend on changed governance files'
+    )
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument(
+        '--base-ref',
+        help='Take changed files from the diff against this git reference'
+    )
+    source.add_argument(
+        '--changed',
+        nargs='+',
+        metavar='PATH',
+        help='Changed files, relative to the repository root'
+    )
+    source.add_argument(
+        '--dependents',
+        metavar='PATH',
+        help='List everything that cites PATH, directly or transitively'
+    )
+    parser.add_argument(
+        '--head-ref',
+        help='Head git reference for --base-ref (default: the working tree)'
+    )
+    parser.add_argument(
+        '--manifest',
+        default=DEFAULT_MANIFEST,
+        help=f'Governance index manifest to reuse and refresh (default: {DEFAULT_MANIFEST})'
+    )
+    parser.add_argument(
+        '--inventory',
+        default=DEFAULT_INVENTORY,
+        help=f'Canon inventory (default: {DEFAULT_INVENTORY})'
+    )
+    parser.add_argument(
+        '--contracts-dir',
+        default=DEFAULT_CONTRACTS_DIR,
+        help='Directory containing agent contracts'
+    )
+    parser.add_argument(
+        '--json',
+        action='store_true',
+        help='Print the result as JSON'
+    )
+    
+    args = parser.parse_args()
+    
+    if args.head_ref and not args.base_ref:
+        parser.error("--head-ref requires --base-ref")
+    
+    changed = args.changed
+    if args.base_ref:
+        changed = git_changed_paths(args.base_ref, args.head_ref)
+        if changed is None:
+            print(f"❌ git could not diff {args.base_ref}{'..' + args.head_ref if args.head_ref else ''}")
+            sys.exit(1)
+    
+    graph = load_graph(args.manifest, args.inventory, args.contracts_dir)
+    
+    if args.dependents:
+        key = Path(os.path.normpath(args.dependents)).as_posix()
+        documents = sorted(graph.dependents(key) - {key})
+        locks = sorted(set().union(*(graph.locks_citing.get(doc, set()) for doc in [key] + documents)))
+        if args.json:
+            print(json.dumps({'path': key, 'documents': documents, 'locks': locks}, indent=2))
+        else:
+            print(f"{key} is cited by {len(documents)} documents and {len(locks)} locks")
+            for item in documents + locks:
+                print(f"  - {item}")
+        sys.exit(0)
+    
+    affected = graph.affected(changed)
+    if args.json:
+        print(json.dumps(affected, indent=2))
+    else:
+        print_affected(affected)
+    sys.exit(0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,407 @@
+#!/usr/bin/env python3
+"""
+Governance Tree Index
+
+Purpose: Walk the governance tree once and record, for every markdown file, what the
+         gate scripts need: size, content hash, YAML frontmatter, locked sections and
+         declared Authority references (per file and per lock)
+Version: 1.1.0
+
+The index is written as a JSON manifest (default: .cache/governance_index.json)
+and reused by the next run: entries whose size and mtime are unchanged are kept
+without reading the file, and files whose content hash is unchanged are not
+re-parsed. Validators given --manifest query it instead of rereading files, so a
+full gate run reads each byte once.
+
+Consumers:
+  check_locked_sections.py --manifest      locked sections and parse errors
+  validate_yaml_frontmatter.py --manifest  frontmatter text
+  scripts/sync_repo_inventory.py --manifest  canon content hashes
+  governance_graph.py                      Authority citations (canon dependency graph)
+
+Usage:
+    python .github/scripts/governance_index.py [--repo-root PATH] [--output PATH]
+                                               [--root DIR ...] [--jobs N] [--rebuild]
+    python .github/scripts/governance_index.py --query PATH [--output PATH]
+
+Exit Codes:
+  0 = index built (or entry printed)
+  1 = --query path not in the index
+  2 = invalid usage
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import sys
+import time
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from check_locked_sections import PARSER_VERSION, _decode_contract, parse_contract_text
+from validate_yaml_frontmatter import extract_frontmatter
+
+try:
+    import yaml
+except ImportError:
+    yaml = None
+
+
+DEFAULT_ROOTS = ['.github/agents', 'governance']
+DEFAULT_MANIFEST = '.cache/governance_index.json'
+
+# `Authority: X`, `**Authority**: X`, `**Authority:** X`, optionally as a list item.
+# Anchored at the line start so `Lock Authority:` metadata is not picked up.
+AUTHORITY_PATTERN = re.compile(r'^[ \t]*(?:[-*][ \t]+)?\**Authority\**[ \t]*:\**[ \t]*(.*?)[ \t]*$',
+                               re.MULTILINE)
+LIST_ITEM_PATTERN = re.compile(r'^[ \t]*[-*][ \t]+(.+?)[ \t]*$')
+MARKDOWN_PATH_PATTERN = re.compile(r'[\w./-]+\.md\b')
+
+# Inline lock markers: <!-- Lock ID: LOCK-X-001 | Authority: A.md, B | Review: quarterly -->
+LOCK_MARKER_PATTERN = re.compile(r'<!--[ \t]*Lock[ \t]+ID:[ \t]*([^\s|]+)[ \t]*\|([^\n]*?)-->', re.IGNORECASE)
+
+
+def parse_authority(text: str) -> Tuple[List[str], List[str]]:
+    """
+    Collect declared Authority values and the markdown files they reference.
+    
+    An empty `**Authority**:` line takes the list items directly below it as
+    its values.
+    
+    Returns:
+        Tuple of (authority values, referenced .md paths) in document order
+    """
+    values = []
+    for match in AUTHORITY_PATTERN.finditer(text):
+        value = match.group(1)
+        if value:
+            values.append(value)
+            continue
+        for line in text[match.end() + 1:].split('\n'):
+            item = LIST_ITEM_PATTERN.match(line)
+            if not item:
+                break
+            values.append(item.group(1))
+    
+    refs = []
+    for value in values:
+        for ref in MARKDOWN_PATH_PATTERN.findall(value):
+            if ref not in refs:
+                refs.append(ref)
+    return values, refs
+
+
+def parse_lock_authorities(text: str, sections: List[Dict]) -> List[Dict]:
+    """
+    Authority cited by each lock: from inline `Lock ID: X | Authority: ...`
+    markers and from the `Lock Authority:` metadata of parsed sections.
+    
+    Returns:
+        List of {'lock_id', 'line', 'authority'} in document order
+    """
+    locks = []
+    for match in LOCK_MARKER_PATTERN.finditer(text):
+        for field in match.group(2).split('|'):
+            name, _, value = field.partition(':')
+            if name.strip().lower() == 'authority' and value.strip():
+                locks.append({
+                    'lock_id': match.group(1),
+                    'line': text.count('\n', 0, match.start()) + 1,
+                    'authority': value.strip(),
+                })
+    for section in sections:
+        authority = section['metadata'].get('authority')
+        if authority:
+            locks.append({'lock_id': section['lock_id'], 'line': section['start_line'],
+                          'authority': authority})
+    locks.sort(key=lambda lock: lock['line'])
+    return locks
+
+
+def _frontmatter_data(frontmatter: Optional[str]) -> Optional[Dict]:
+    """Parse frontmatter text into JSON-safe data, or None if it is not a YAML mapping"""
+    if frontmatter is None or yaml is None:
+        return None
+    try:
+        data = yaml.safe_load(frontmatter)
+    except yaml.YAMLError:
+        return None
+    if not isinstance(data, dict):
+        return None
+    # Dates and other YAML-only scalars become strings
+    return json.loads(json.dumps(data, default=str))
+
+
+def parse_document(key: str, data: bytes) -> Dict:
+    """
+    Extract everything the validators need from one file's bytes.
+    
+    Frontmatter is taken exactly as validate_yaml_frontmatter.py would read
+    it, locked sections exactly as check_locked_sections.py would, so both
+    can use the result in place of their own read.
+    """
+    frontmatter = extract_frontmatter(data.decode('utf-8', errors='replace'))
+    try:
+        text = _decode_contract(data)
+    except Exception as e:
+        sections, lock_errors = [], [f"Error reading {key}: {e}"]
+        authority, authority_refs, lock_authorities = [], [], []
+    else:
+        sections, lock_errors = parse_contract_text(Path(key), text)
+        sections = [s.to_dict() for s in sections]
+        authority, authority_refs = parse_authority(text)
+        lock_authorities = parse_lock_authorities(text, sections)
+    return {
+        'frontmatter': frontmatter,
+        'frontmatter_data': _frontmatter_data(frontmatter),
+        'locked_sections': sections,
+        'lock_errors': lock_errors,
+        'authority': authority,
+        'authority_refs': authority_refs,
+        'lock_authorities': lock_authorities,
+    }
+
+
+def index_file(job: Tuple[str, str, Optional[str]]) -> Tuple[str, Optional[Dict], Optional[Dict]]:
+    """
+    Read, hash and parse one file for GovernanceIndex.build (runs in worker processes).
+    
+    job is (path, key, known_sha256). Returns (key, stat fields, parsed fields);
+    parsed fields are None when the content hash equals known_sha256, and both
+    are None when the file could not be read.
+    """
+    file_path, key, known_digest = job
+    try:
+        st = os.stat(file_path)
+        checked_ns = time.time_ns()
+        with open(file_path, 'rb') as f:
+            data = f.read()
+    except OSError:
+        return key, None, None
+    
+    digest = hashlib.sha256(data).hexdigest()
+    stat_fields = {
+        'size': st.st_size,
+        'mtime_ns': st.st_mtime_ns,
+        'checked_ns': checked_ns,
+        'sha256': digest,
+    }
+    if digest == known_digest:
+        return key, stat_fields, None
+    return key, stat_fields, parse_document(key, data)
+
+
+class GovernanceIndex:
+    """
+    Manifest of the governance tree, keyed by repo-relative POSIX path.
+    
+    Entries are trusted on a size + mtime_ns match unless their mtime is
+    within RACY_WINDOW_NS of the moment they were read, as in the parse
+    and hash caches.
+    """
+    
+    FORMAT_VERSION = 2
+    RACY_WINDOW_NS = 2_000_000_000
+    
+    # Below this many files to (re)read, worker startup costs more than it saves
+    PARALLEL_MIN_FILES = 32
+    
+    def __init__(self, repo_root: str = '.', roots: List[str] = None):
+        self.repo_root = Path(repo_root).resolve()
+        self.roots = list(roots or DEFAULT_ROOTS)
+        self.files: Dict[str, Dict] = {}
+        self.reused = 0
+        self.reread = 0
+    
+    @classmethod
+    def load(cls, manifest_file: str) -> Optional['GovernanceIndex']:
+        """Load a saved manifest, or None if it is missing, unreadable or from another parser"""
+        try:
+            with open(manifest_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if (not isinstance(data, dict)
+                or data.get('version') != cls.FORMAT_VERSION
+                or data.get('parser') != PARSER_VERSION):
+            return None
+        index = cls(data.get('repo_root', '.'), data.get('roots'))
+        index.files = data.get('files', {})
+        return index
+    
+    def save(self, manifest_file: str):
+        """Atomically write the manifest"""
+        data = {
+            'version': self.FORMAT_VERSION,
+            'parser': PARSER_VERSION,
+            'repo_root': str(self.repo_root),
+            'roots': self.roots,
+            'files': self.files,
+        }
+        manifest_file = Path(manifest_file)
+        manifest_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = manifest_file.with_name(manifest_file.name + f'.{os.getpid()}.tmp')
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump(data, f, separators=(',', ':'), ensure_ascii=False)
+        os.replace(tmp_file, manifest_file)
+    
+    def iter_files(self) -> Iterator[Tuple[str, str]]:
+        """Walk each root once, yielding (path, key) for every markdown file in sorted order"""
+        for root in self.roots:
+            for dirpath, dirs, files in os.walk(self.repo_root / root):
+                dirs.sort()
+                for name in sorted(files):
+                    if name.endswith('.md'):
+                        file_path = os.path.join(dirpath, name)
+                        yield file_path, Path(file_path).relative_to(self.repo_root).as_posix()
+    
+    def build(self, previous: Optional['GovernanceIndex'] = None, jobs: Optional[int] = None):
+        """
+        Index the tree, reusing entries from a previous manifest of the same tree.
+        
+        Files whose stat data changed are re-read and re-hashed; they are only
+        re-parsed if the hash differs from the previous entry.
+        """
+        old_files = {}
+        if (previous is not None and previous.repo_root == self.repo_root
+                and previous.roots == self.roots):
+            old_files = previous.files
+        
+        files = {}
+        work = []
+        for file_path, key in self.iter_files():
+            old = old_files.get(key)
+            if old is not None and self._trusted(old, file_path):
+                files[key] = old
+                self.reused += 1
+            else:
+                work.append((file_path, key, old['sha256'] if old else None))
+        
+        for key, stat_fields, parsed in self._run_jobs(work, jobs):
+            if stat_fields is None:
+                continue
+            entry = dict(old_files[key]) if parsed is None else parsed
+            entry.update(stat_fields)
+            files[key] = entry
+            self.reread += 1
+        
+        self.files = dict(sorted(files.items()))
+        return self
+    
+    def _run_jobs(self, work: List[Tuple], jobs: Optional[int]) -> Iterator[Tuple]:
+        if jobs == 1 or len(work) < self.PARALLEL_MIN_FILES:
+            return map(index_file, work)
+        
+        from concurrent.futures import ProcessPoolExecutor
+        workers = jobs or os.cpu_count() or 1
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(index_file, work, chunksize=max(1, len(work) // (workers * 4))))
+    
+    def _trusted(self, entry: Dict, file_path: str) -> bool:
+        """True if the file's stat data still matches the entry and the entry is not racy"""
+        try:
+            st = os.stat(file_path)
+        except OSError:
+            return False
+        return (entry['size'] == st.st_size and entry['mtime_ns'] == st.st_mtime_ns
+                and entry['mtime_ns'] + self.RACY_WINDOW_NS < entry['checked_ns'])
+    
+    def key(self, file_path) -> Optional[str]:
+        """Manifest key for a path (relative to the current directory), or None if outside the tree"""
+        try:
+            return Path(os.path.abspath(file_path)).relative_to(self.repo_root).as_posix()
+        except ValueError:
+            return None
+    
+    def lookup(self, file_path) -> Optional[Dict]:
+        """
+        Return the entry for file_path if it can be trusted as the file's
+        current content, otherwise None (not indexed, changed since, or racy).
+        """
+        key = self.key(file_path)
+        entry = self.files.get(key) if key is not None else None
+        if entry is None or not self._trusted(entry, str(self.repo_root / key)):
+            return None
+        return entry
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Build the shared governance tree index used by the gate scripts'
+    )
+    parser.add_argument(
+        '--repo-root',
+        default='.',
+        help='Repository root (default: current directory)'
+    )
+    parser.add_argument(
+        '--output',
+        default=None,
+        help=f'Manifest location (default: <repo-root>/{DEFAULT_MANIFEST})'
+    )
+    parser.add_argument(
+        '--root',
+        action='append',
+        dest='roots',
+        help=f'Directory to index, relative to the repo root; repeatable (default: {", ".join(DEFAULT_ROOTS)})'
+    )
+    parser.add_argument(
+        '--jobs',
+        type=int,
+        default=None,
+        help='Worker processes for reading files (default: CPU count; 1 disables the pool)'
+    )
+    parser.add_argument(
+        '--rebuild',
+        action='store_true',
+        help='Ignore the existing manifest and read every file'
+    )
+    parser.add_argument(
+        '--query',
+        metavar='PATH',
+        help='Print the manifest entry for PATH as JSON instead of building'
+    )
+    
+    args = parser.parse_args()
+    
+    output = args.output or os.path.join(args.repo_root, DEFAULT_MANIFEST)
+    
+    if args.query:
+        index = GovernanceIndex.load(output)
+        if index is None:
+            print(f"❌ No usable manifest at {output}; build it first")
+            sys.exit(2)
+        key = index.key(args.query)
+        if key not in index.files:
+            print(f"❌ {args.query} is not in the index")
+            sys.exit(1)
+        print(json.dumps(dict(index.files[key], path=key), indent=2, ensure_ascii=False))
+        sys.exit(0)
+    
+    if not os.path.isdir(args.repo_root):
+        print(f"❌ Repository root not found: {args.repo_root}")
+        sys.exit(2)
+    
+    start = time.perf_counter()
+    previous = None if args.rebuild else GovernanceIndex.load(output)
+    index = GovernanceIndex(args.repo_root, args.roots).build(previous, args.jobs)
+    try:
+        index.save(output)
+    except OSError as e:
+        print(f"❌ Could not write manifest {output}: {e}")
+        sys.exit(2)
+    elapsed = time.perf_counter() - start
+    
+    sections = sum(len(entry['locked_sections']) for entry in index.files.values())
+    with_frontmatter = sum(1 for entry in index.files.values() if entry['frontmatter'] is not None)
+    print(f"Indexed {len(index.files)} files under {', '.join(index.roots)} in {elapsed:.2f}s")
+    print(f"  Reused: {index.reused}  Re-read: {index.reread}")
+    print(f"  Frontmatter: {with_frontmatter}  Locked sections: {sections}")
+    print(f"  Manifest: {output}")
+    sys.exit(0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,477 @@
+#!/usr/bin/env python3
+"""
+Governance Full-Text Search
+
+Purpose: Incrementally maintained inverted index (term -> file:line) over the
+         repository's markdown, so auditors can look up evidence across
+         PREHANDOVER_PROOF files, archives and governance documents without
+         grepping the whole tree (single-file gate checks grep the file)
+Version: 1.0.0
+
+The index is written to .cache/governance_search.json. Each run re-reads only
+files whose size or mtime changed and re-tokenizes only those whose SHA-256
+changed too, so an index restored onto a fresh checkout stays valid; files
+deleted since are dropped. Queries are answered from the postings and each
+candidate line is confirmed against the file itself.
+
+Query syntax (case-insensitive, whole words; punctuation and `_` separate words):
+  locked section          both words on one line, in this order
+                          ("sections" is another word: use section* for grep-like prefixes)
+  "exit code" 0           a quoted phrase is matched as adjacent words
+  effective*              a trailing * matches any word with that prefix
+Several --query options match lines satisfying any of them.
+
+Usage:
+    python .github/scripts/governance_search.py [--rebuild]
+    python .github/scripts/governance_search.py --query QUERY [--query QUERY ...]
+        [--path GLOB ...] [--files-with-matches | --count | --quiet] [--json]
+
+Exit Codes:
+  0 = index updated, or at least one line matched
+  1 = no line matched
+  2 = invalid query or usage
+"""
+
+import argparse
+import fnmatch
+import hashlib
+import json
+import os
+import re
+import shlex
+import sys
+import time
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+DEFAULT_INDEX = '.cache/governance_search.json'
+DEFAULT_ROOTS = ['.']
+SKIP_DIRS = {'.git', '.cache', 'node_modules', '__pycache__'}
+
+WORD_PATTERN = re.compile(r'[a-z0-9]+')
+WORD_CHARS = 'a-z0-9'
+
+
+def encode_postings(files: Dict[str, List[int]]) -> str:
+    """{file id: [lines]} -> "id:l,l id:l" (kept as a string until a query needs it)"""
+    return ' '.join(f"{file_id}:{','.join(map(str, lines))}" for file_id, lines in files.items())
+
+
+def decode_postings(encoded: str) -> Dict[str, List[int]]:
+    files = {}
+    for item in encoded.split():
+        file_id, _, lines = item.partition(':')
+        files[file_id] = [int(line) for line in lines.split(',')]
+    return files
+
+
+def tokenize(text: str) -> Dict[str, List[int]]:
+    """Map each word of text to the (1-based, ascending) line numbers it occurs on"""
+    postings: Dict[str, List[int]] = {}
+    for number, line in enumerate(text.lower().split('\n'), 1):
+        for word in set(WORD_PATTERN.findall(line)):
+            postings.setdefault(word, []).append(number)
+    return postings
+
+
+def index_document(job: Tuple[str, str, Optional[str]]) -> Tuple[str, Optional[Dict], Optional[Dict[str, List[int]]]]:
+    """
+    Read, hash and tokenize one file for SearchIndex.update (runs in worker processes).
+    
+    job is (path, key, known_sha256). Returns (key, stat fields, postings);
+    postings are None when the content hash equals known_sha256, and both
+    are None when the file could not be read.
+    """
+    file_path, key, known_digest = job
+    try:
+        st = os.stat(file_path)
+        checked_ns = time.time_ns()
+        with open(file_path, 'rb') as f:
+            data = f.read()
+    except OSError:
+        return key, None, None
+    digest = hashlib.sha256(data).hexdigest()
+    stat_fields = {'size': st.st_size, 'mtime_ns': st.st_mtime_ns, 'checked_ns': checked_ns, 'sha256': digest}
+    if digest == known_digest:
+        return key, stat_fields, None
+    return key, stat_fields, tokenize(data.decode('utf-8', errors='replace'))
+
+
+class Query:
+    """
+    One parsed query: groups of words that must occur on a line in order.
+    
+    Each group is a quoted phrase (adjacent words) or a single word, which
+    may end in `*` to match any word with that prefix.
+    """
+    
+    def __init__(self, text: str):
+        self.text = text
+        try:
+            parts = shlex.split(text, posix=True)
+        except ValueError as e:
+            raise ValueError(f"Invalid query {text!r}: {e}")
+        self.groups: List[List[str]] = []
+        patterns = []
+        for part in parts:
+            if part.endswith('*') and WORD_PATTERN.fullmatch(part[:-1].lower()):
+                word = part[:-1].lower()
+                self.groups.append([word + '*'])
+                patterns.append(f'(?<![{WORD_CHARS}]){re.escape(word)}[{WORD_CHARS}]*')
+                continue
+            words = WORD_PATTERN.findall(part.lower())
+            if not words:
+                continue
+            self.groups.append(words)
+            patterns.append(f'(?<![{WORD_CHARS}])'
+                            + f'[^{WORD_CHARS}]+'.join(re.escape(word) for word in words)
+                            + f'(?![{WORD_CHARS}])')
+        if not self.groups:
+            raise ValueError(f"Query {text!r} contains no searchable words")
+        self.pattern = re.compile('.*'.join(patterns))
+    
+    def terms(self) -> List[str]:
+        return [word for group in self.groups for word in group]
+    
+    def matches(self, line: str) -> bool:
+        return self.pattern.search(line.lower()) is not None
+
+
+class SearchIndex:
+    """
+    Inverted index of markdown files, keyed by repo-relative POSIX path.
+    
+    postings maps word -> encoded {file id: [line numbers]} (see
+    encode_postings), so loading the index parses one string per word and
+    only the words a query names are ever decoded. Each file entry keeps its
+    id and word list so a changed file's postings can be dropped without
+    touching other words. Stat data is trusted as in the other
+    governance caches (size + mtime_ns, outside a 2 second racy window,
+    falling back to a content hash check).
+    """
+    
+    FORMAT_VERSION = 2
+    RACY_WINDOW_NS = 2_000_000_000
+    
+    # Below this many files to (re)read, worker startup costs more than it saves
+    PARALLEL_MIN_FILES = 32
+    
+    def __init__(self, repo_root: str = '.', roots: List[str] = None):
+        self.repo_root = Path(repo_root).resolve()
+        self.roots = list(roots or DEFAULT_ROOTS)
+        self.files: Dict[str, Dict] = {}
+        self.postings: Dict[str, str] = {}
+        self.next_id = 0
+        self.reread = 0
+        self.rehashed = 0
+        self.removed = 0
+        self._paths: Optional[Dict[str, str]] = None
+        self._sorted_terms: Optional[List[str]] = None
+    
+    @classmethod
+    def load(cls, index_file: str) -> Optional['SearchIndex']:
+        """Load a saved index, or None if it is missing, unreadable or another format"""
+        try:
+            with open(index_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(data, dict) or data.get('version') != cls.FORMAT_VERSION:
+            return None
+        index = cls(data.get('repo_root', '.'), data.get('roots'))
+        index.files = data.get('files', {})
+        index.postings = data.get('postings', {})
+        index.next_id = data.get('next_id', 0)
+        return index
+    
+    def save(self, index_file: str):
+        """Atomically write the index"""
+        data = {
+            'version': self.FORMAT_VERSION,
+            'repo_root': str(self.repo_root),
+            'roots': self.roots,
+            'next_id': self.next_id,
+            'files': self.files,
+            'postings': self.postings,
+        }
+        index_file = Path(index_file)
+        index_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = index_file.with_name(index_file.name + f'.{os.getpid()}.tmp')
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump(data, f, separators=(',', ':'), ensure_ascii=False)
+        os.replace(tmp_file, index_file)
+    
+    def iter_files(self) -> Iterator[Tuple[str, str]]:
+        """Walk each root once, yielding (path, key) for every markdown file"""
+        for root in self.roots:
+            for dirpath, dirs, files in os.walk(self.repo_root / root):
+                dirs[:] = sorted(d for d in dirs if d not in SKIP_DIRS)
+                for name in sorted(files):
+                    if name.endswith('.md'):
+                        file_path = os.path.join(dirpath, name)
+                        yield file_path, Path(file_path).relative_to(self.repo_root).as_posix()
+    
+    def update(self, jobs: Optional[int] = None) -> 'SearchIndex':
+        """Re-index files whose stat data changed and drop files that no longer exist"""
+        seen: Set[str] = set()
+        work = []
+        for file_path, key in self.iter_files():
+            seen.add(key)
+            entry = self.files.get(key)
+            if entry is None or not self._trusted(entry, file_path):
+                work.append((file_path, key, entry['sha256'] if entry else None))
+        
+        # Words touched by this update, decoded once and re-encoded at the end
+        touched: Dict[str, Dict[str, List[int]]] = {}
+        
+        for key in [key for key in self.files if key not in seen]:
+            self._remove(key, touched)
+            self.removed += 1
+        
+        for key, stat_fields, postings in self._run_jobs(work, jobs):
+            if stat_fields is not None and postings is None:
+                # Same content under new stat data (e.g. a fresh checkout)
+                self.files[key].update(stat_fields)
+                self.rehashed += 1
+                continue
+            if key in self.files:
+                self._remove(key, touched)
+            if stat_fields is None:
+                continue
+            file_id = str(self.next_id)
+            self.next_id += 1
+            for word, lines in postings.items():
+                self._touch(word, touched)[file_id] = lines
+            self.files[key] = dict(stat_fields, id=file_id, words=' '.join(sorted(postings)))
+            self.reread += 1
+        
+        for word, files in touched.items():
+            if files:
+                self.postings[word] = encode_postings(files)
+            else:
+                self.postings.pop(word, None)
+        
+        self._paths = None
+        self._sorted_terms = None
+        return self
+    
+    def _touch(self, word: str, touched: Dict[str, Dict[str, List[int]]]) -> Dict[str, List[int]]:
+        if word not in touched:
+            touched[word] = decode_postings(self.postings.get(word, ''))
+        return touched[word]
+    
+    def _remove(self, key: str, touched: Dict[str, Dict[str, List[int]]]):
+        entry = self.files.pop(key)
+        for word in entry['words'].split():
+            self._touch(word, touched).pop(entry['id'], None)
+    
+    def _run_jobs(self, work: List[Tuple[str, str, Optional[str]]], jobs: Optional[int]) -> Iterator[Tuple]:
+        if jobs == 1 or len(work) < self.PARALLEL_MIN_FILES:
+            return map(index_document, work)
+        
+        from concurrent.futures import ProcessPoolExecutor
+        workers = jobs or os.cpu_count() or 1
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(index_document, work, chunksize=max(1, len(work) // (workers * 4))))
+    
+    def _trusted(self, entry: Dict, file_path: str) -> bool:
+        try:
+            st = os.stat(file_path)
+        except OSError:
+            return False
+        return (entry['size'] == st.st_size and entry['mtime_ns'] == st.st_mtime_ns
+                and entry['mtime_ns'] + self.RACY_WINDOW_NS < entry['checked_ns'])
+    
+    def _lines_for(self, term: str) -> Dict[str, Set[int]]:
+        """File id -> lines containing the word (or, for `prefix*`, any word with that prefix)"""
+        if not term.endswith('*'):
+            return {file_id: set(lines) for file_id, lines in decode_postings(self.postings.get(term, '')).items()}
+        
+        from bisect import bisect_left
+        if self._sorted_terms is None:
+            self._sorted_terms = sorted(self.postings)
+        prefix = term[:-1]
+        found: Dict[str, Set[int]] = {}
+        for i in range(bisect_left(self._sorted_terms, prefix), len(self._sorted_terms)):
+            word = self._sorted_terms[i]
+            if not word.startswith(prefix):
+                break
+            for file_id, lines in decode_postings(self.postings[word]).items():
+                found.setdefault(file_id, set()).update(lines)
+        return found
+    
+    def candidates(self, query: Query, keys: Optional[Set[str]] = None) -> Dict[str, Set[int]]:
+        """Lines (by file key) containing every word of the query, before order/phrase checks"""
+        if self._paths is None:
+            self._paths = {entry['id']: key for key, entry in self.files.items()}
+        
+        result: Optional[Dict[str, Set[int]]] = None
+        # Rarest words (shortest postings) first keeps the intersections small
+        for term in sorted(set(query.terms()), key=lambda t: len(self.postings.get(t, '')) if '*' not in t else 0):
+            found = self._lines_for(term)
+            if result is None:
+                result = found
+            else:
+                result = {file_id: result[file_id] & lines for file_id, lines in found.items()
+                          if file_id in result and result[file_id] & lines}
+            if not result:
+                return {}
+        
+        by_key = {self._paths[file_id]: lines for file_id, lines in result.items()}
+        if keys is not None:
+            by_key = {key: lines for key, lines in by_key.items() if key in keys}
+        return by_key
+    
+    def search(self, queries: List[Query], path_globs: Optional[List[str]] = None) -> List[Dict]:
+        """Matching lines as {'path', 'line', 'text'}, sorted by path and line"""
+        keys = None
+        if path_globs:
+            keys = {key for key in self.files if any(fnmatch.fnmatch(key, glob) for glob in path_globs)}
+        
+        wanted: Dict[str, Dict[int, List[Query]]] = {}
+        for query in queries:
+            for key, lines in self.candidates(query, keys).items():
+                for line in lines:
+                    wanted.setdefault(key, {}).setdefault(line, []).append(query)
+        
+        matches = []
+        for key in sorted(wanted):
+            try:
+                with open(self.repo_root / key, 'rb') as f:
+                    text_lines = f.read().decode('utf-8', errors='replace').split('\n')
+            except OSError:
+                continue
+            for line in sorted(wanted[key]):
+                text = text_lines[line - 1] if line <= len(text_lines) else ''
+                if any(query.matches(text) for query in wanted[key][line]):
+                    matches.append({'path': key, 'line': line, 'text': text.rstrip('\r')})
+        return matches
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Build and query the full-text index of the repository markdown'
+    )
+    parser.add_argument(
+        '--query',
+        action='append',
+        metavar='QUERY',
+        help='Search the index; repeatable, a line matching any query is reported'
+    )
+    parser.add_argument(
+        '--path',
+        action='append',
+        metavar='GLOB',
+        help='Only report files whose repo-relative path matches GLOB; repeatable'
+    )
+    output = parser.add_mutually_exclusive_group()
+    output.add_argument(
+        '-l', '--files-with-matches',
+        action='store_true',
+        help='Print only the paths of matching files'
+    )
+    output.add_argument(
+        '-c', '--count',
+        action='store_true',
+        help='Print the number of matching lines per file'
+    )
+    output.add_argument(
+        '-q', '--quiet',
+        action='store_true',
+        help='Print nothing; the exit code tells whether anything matched'
+    )
+    output.add_argument(
+        '--json',
+        action='store_true',
+        help='Print matches as JSON'
+    )
+    parser.add_argument(
+        '--repo-root',
+        default='.',
+        help='Repository root (default: current directory)'
+    )
+    parser.add_argument(
+        '--index-file',
+        default=None,
+        help=f'Index location (default: <repo-root>/{DEFAULT_INDEX})'
+    )
+    parser.add_argument(
+        '--root',
+        action='append',
+        dest='roots',
+        help='Directory to index, relative to the repo root; repeatable (default: the whole repository)'
+    )
+    parser.add_argument(
+        '--jobs',
+        type=int,
+        default=None,
+        help='Worker processes for reading files (default: CPU count; 1 disables the pool)'
+    )
+    parser.add_argument(
+        '--rebuild',
+        action='store_true',
+        help='Ignore the existing index and read every file'
+    )
+    parser.add_argument(
+        '--no-update',
+        action='store_true',
+        help='Query the saved index as it is, without checking for changed files'
+    )
+    
+    args = parser.parse_args()
+    
+    try:
+        queries = [Query(text) for text in args.query or []]
+    except ValueError as e:
+        print(f"❌ {e}", file=sys.stderr)
+        sys.exit(2)
+    if not os.path.isdir(args.repo_root):
+        print(f"❌ Repository root not found: {args.repo_root}", file=sys.stderr)
+        sys.exit(2)
+    
+    index_file = args.index_file or os.path.join(args.repo_root, DEFAULT_INDEX)
+    start = time.perf_counter()
+    index = None if args.rebuild else SearchIndex.load(index_file)
+    roots = args.roots or DEFAULT_ROOTS
+    if (index is None or index.repo_root != Path(args.repo_root).resolve() or index.roots != roots):
+        if args.no_update:
+            print(f"❌ No usable index at {index_file}; build it first", file=sys.stderr)
+            sys.exit(2)
+        index = SearchIndex(args.repo_root, roots)
+    if not args.no_update:
+        index.update(args.jobs)
+        if index.reread or index.rehashed or index.removed:
+            try:
+                index.save(index_file)
+            except OSError as e:
+                print(f"Warning: could not write search index {index_file}: {e}", file=sys.stderr)
+    
+    if not queries:
+        elapsed = time.perf_counter() - start
+        print(f"Indexed {len(index.files)} files under {', '.join(index.roots)} in {elapsed:.2f}s")
+        print(f"  Re-indexed: {index.reread}  Unchanged content: {index.rehashed}  Removed: {index.removed}  "
+              f"Words: {len(index.postings)}")
+        print(f"  Index: {index_file}")
+        sys.exit(0)
+    
+    matches = index.search(queries, args.path)
+    
+    if args.json:
+        print(json.dumps(matches, indent=2, ensure_ascii=False))
+    elif args.files_with_matches:
+        for path in sorted({match['path'] for match in matches}):
+            print(path)
+    elif args.count:
+        counts: Dict[str, int] = {}
+        for match in matches:
+            counts[match['path']] = counts.get(match['path'], 0) + 1
+        for path, count in counts.items():
+            print(f"{path}:{count}")
+    elif not args.quiet:
+        for match in matches:
+            print(f"{match['path']}:{match['line']}:{match['text']}")
+    sys.exit(0 if matches else 1)
+
+
+if __name__ == '__main__':
+    main()
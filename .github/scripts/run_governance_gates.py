@@ -0,0 +1,645 @@
+#!/usr/bin/env python3
+"""
+Unified Governance Gate Runner
+
+Purpose: Run the governance gate checks in parallel worker processes, sharing one
+         scan of the governance tree and one set of git results
+Authority: governance/canon/AGENT_CONTRACT_PROTECTION_PROTOCOL.md, BL-027, BL-028
+Version: 1.0.0
+
+Checks (all by default, or a comma-separated subset with --checks):
+  locked-metadata       Lock IDs present, well-formed and unique
+  locked-registry       Locks and protection registry in sync
+  locked-modifications  Locks touched by the --base-ref..--head-ref diff
+  inventory-coverage    Local canons against the central CANON_INVENTORY.json
+  frontmatter           YAML frontmatter passes yamllint (BL-028)
+  scope                 Scope declaration matches the diff against --base-ref (BL-027)
+
+The checks that need git refs are skipped when --base-ref is not given. With
+--affected-only, the governance dependency graph (governance_graph.py) limits
+locked-metadata, locked-registry, inventory-coverage and frontmatter to what the
+--base-ref..--head-ref change set affects; checks with nothing affected are skipped.
+
+Exit Codes:
+  0 = PASS (no check failed)
+  1 = FAIL (at least one check failed or could not run)
+  2 = FAIL (invalid usage)
+"""
+
+import argparse
+import contextlib
+import glob
+import io
+import json
+import multiprocessing
+import os
+import re
+import subprocess
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from check_locked_sections import LockedSectionValidator
+from governance_graph import DependencyGraph, load_inventory
+from governance_index import DEFAULT_MANIFEST, GovernanceIndex
+import validate_scope_to_diff
+import validate_yaml_frontmatter
+
+REPO_SCRIPTS_DIR = Path(__file__).resolve().parents[2] / 'scripts'
+
+CHECKS = ['locked-metadata', 'locked-registry', 'locked-modifications',
+          'inventory-coverage', 'frontmatter', 'scope']
+
+SARIF_SCHEMA = 'https://json.schemastore.org/sarif-2.1.0.json'
+
+# "path:line - message", as reported by check_locked_sections.py
+LOCATED_MESSAGE_PATTERN = re.compile(r'^(?P<path>[^\s:]+):(?P<line>\d+) - ')
+
+
+class GateResult:
+    """Outcome of one check: status, exit code, findings and its captured console output"""
+    
+    def __init__(self, name: str):
+        self.name = name
+        self.status = 'pass'  # pass | warn | skip | fail | error
+        self.exit_code = 0
+        self.findings: List[Dict] = []
+        self.details: Dict = {}
+        self.output = ''
+        self.duration = 0.0
+    
+    def add(self, level: str, message: str, path: str = None, line: int = None):
+        """Record a finding; level is 'error' or 'warning'"""
+        if path is None:
+            located = LOCATED_MESSAGE_PATTERN.match(message)
+            if located:
+                path, line = located.group('path'), int(located.group('line'))
+        finding = {'level': level, 'message': message}
+        if path is not None:
+            finding['path'] = path
+        if line is not None:
+            finding['line'] = line
+        self.findings.append(finding)
+    
+    def finish(self, success: bool):
+        if not success:
+            self.status, self.exit_code = 'fail', 1
+    
+    def to_dict(self) -> Dict:
+        return {
+            'name': self.name,
+            'status': self.status,
+            'exit_code': self.exit_code,
+            'duration_s': round(self.duration, 3),
+            'findings': self.findings,
+            'details': self.details,
+        }
+
+
+class GitMemo:
+    """Runs each distinct git command once and shares its output across checks"""
+    
+    def __init__(self):
+        self._results: Dict[tuple, Optional[str]] = {}
+    
+    def run(self, *args: str) -> Optional[str]:
+        """Return stdout of `git <args>`, or None if it failed"""
+        if args not in self._results:
+            proc = subprocess.run(['git', *args], stdout=subprocess.PIPE,
+                                  stderr=subprocess.DEVNULL, universal_newlines=True)
+            self._results[args] = proc.stdout if proc.returncode == 0 else None
+        return self._results[args]
+    
+    def resolve(self, ref: str) -> Optional[str]:
+        """Commit id for ref, or None if it does not name a commit"""
+        out = self.run('rev-parse', '--verify', '--quiet', f'{ref}^{{commit}}')
+        return out.strip() if out else None
+    
+    def toplevel(self) -> Optional[Path]:
+        out = self.run('rev-parse', '--show-toplevel')
+        return Path(out.strip()) if out else None
+
+
+# Runner whose checks forked workers run; set by GateRunner.run before the pool forks
+_RUNNER: Optional['GateRunner'] = None
+
+
+def _run_forked_check(name: str) -> 'GateResult':
+    return _RUNNER._run_check(name)
+
+
+class GateRunner:
+    """Shared state for one gate run: the tree index, the locked-section scan and git results"""
+    
+    def __init__(self, args: argparse.Namespace):
+        self.args = args
+        self.git = GitMemo()
+        self.index: Optional[GovernanceIndex] = None
+        self.scan: Optional[LockedSectionValidator] = None
+        # governance_graph affected set with --affected-only, otherwise None (everything)
+        self.affected: Optional[Dict] = None
+    
+    def prepare(self):
+        """Index the tree once, reusing the saved manifest, and write it back for later runs"""
+        previous = None if self.args.no_cache else GovernanceIndex.load(self.args.manifest)
+        self.index = GovernanceIndex('.').build(previous, self.args.jobs)
+        if not self.args.no_cache:
+            try:
+                self.index.save(self.args.manifest)
+            except OSError as e:
+                print(f"Warning: could not write governance index {self.args.manifest}: {e}", file=sys.stderr)
+        if self.args.affected_only:
+            self.affected = self.compute_affected()
+    
+    def compute_affected(self) -> Optional[Dict]:
+        """Affected set of the base..head change set, or None (check everything) if git cannot diff it"""
+        base = self.base_commit()
+        head = self.git.resolve(self.args.head_ref)
+        out = self.git.run('diff', '--name-only', '-z', '--no-renames', '--no-ext-diff', base, head, '--') \
+            if base and head else None
+        if out is None:
+            print(f"Warning: could not diff {self.args.base_ref}..{self.args.head_ref}; checking everything",
+                  file=sys.stderr)
+            return None
+        graph = DependencyGraph.from_index(self.index, load_inventory(self.args.inventory_file),
+                                           self.args.contracts_dir)
+        return graph.affected(path for path in out.split('\0') if path)
+    
+    def is_affected(self, field: str, key: Optional[str]) -> bool:
+        return self.affected is None or self.affected['full'] or key in self.affected[field]
+    
+    def locked_sections(self) -> LockedSectionValidator:
+        """Contracts scanned once from the index; every check works on its own view of it"""
+        if self.scan is None:
+            self.scan = LockedSectionValidator(self.args.contracts_dir, jobs=self.args.jobs,
+                                               manifest=self.index)
+            self.scan.scan_contracts()
+        view = LockedSectionValidator(self.args.contracts_dir, jobs=1)
+        view.locked_sections = self.scan.locked_sections
+        view.errors = list(self.scan.errors)
+        return view
+    
+    def base_commit(self) -> Optional[str]:
+        return self.git.resolve(self.args.base_ref) if self.args.base_ref else None
+    
+    def check_workers(self, names: List[str]) -> int:
+        """Worker processes for the checks: one per check up to --jobs (CPU count); 1 runs them in-process"""
+        if 'fork' not in multiprocessing.get_all_start_methods():
+            return 1
+        return max(1, min(len(names), self.args.jobs or os.cpu_count() or 1))
+    
+    def run(self, names: List[str]) -> List[GateResult]:
+        """
+        Run the named checks; results come back in the order given.
+        
+        The shared work (contract scan, with its own process pool, and git ref
+        resolution) happens here first, so forked check workers inherit it and
+        no pool is ever started from a thread. Each worker runs one check at a
+        time and captures its output with redirect_stdout.
+        """
+        global _RUNNER
+        if any(name.startswith('locked-') for name in names):
+            self.locked_sections()
+        if self.args.base_ref:
+            self.base_commit()
+            self.git.resolve(self.args.head_ref)
+            self.git.toplevel()
+        
+        workers = self.check_workers(names)
+        if workers == 1:
+            return [self._run_check(name) for name in names]
+        
+        _RUNNER = self
+        try:
+            with ProcessPoolExecutor(max_workers=workers,
+                                     mp_context=multiprocessing.get_context('fork')) as pool:
+                futures = [pool.submit(_run_forked_check, name) for name in names]
+                return [self._collect(name, future) for name, future in zip(names, futures)]
+        finally:
+            _RUNNER = None
+    
+    def _collect(self, name: str, future) -> GateResult:
+        try:
+            return future.result()
+        except Exception as e:
+            # The worker died or the result could not be sent back
+            result = GateResult(name)
+            result.status, result.exit_code = 'error', 1
+            result.add('error', f"{name} worker failed: {type(e).__name__}: {e}")
+            return result
+    
+    def _run_check(self, name: str) -> GateResult:
+        result = GateResult(name)
+        buffer = io.StringIO()
+        start = time.perf_counter()
+        try:
+            with contextlib.redirect_stdout(buffer):
+                CHECK_FUNCTIONS[name](self, result)
+        except SystemExit as e:
+            # Library code that gives up the way its CLI would
+            result.status, result.exit_code = 'error', 1
+            result.add('error', f"{name} exited with status {e.code}")
+        except Exception as e:
+            result.status, result.exit_code = 'error', 1
+            result.add('error', f"{name} raised {type(e).__name__}: {e}")
+        finally:
+            result.duration = time.perf_counter() - start
+            result.output = buffer.getvalue()
+        return result
+
+
+def _report_validator(result: GateResult, validator: LockedSectionValidator):
+    for error in validator.errors:
+        result.add('error', error)
+    for warning in validator.warnings:
+        result.add('warning', warning)
+    validator.print_summary()
+
+
+def _skip_unaffected(result: GateResult, what: str):
+    result.status = 'skip'
+    print(f"Skipped: no {what} affected by the change set")
+
+
+def check_locked_metadata(runner: GateRunner, result: GateResult):
+    validator = runner.locked_sections()
+    sections = validator.locked_sections
+    affected = [s for s in sections if runner.is_affected('contracts', runner.index.key(s.file_path))]
+    if runner.affected is not None and not runner.affected['full']:
+        if not runner.affected['contracts']:
+            _skip_unaffected(result, 'contracts')
+            return
+        result.details['affected_locked_sections'] = len(affected)
+    # Metadata is checked for affected locks only; Lock ID uniqueness always spans every lock
+    validator.locked_sections = affected
+    success = validator.validate_metadata()
+    validator.locked_sections = sections
+    success = success and validator.check_duplicate_lock_ids()
+    result.details['locked_sections'] = len(validator.locked_sections)
+    _report_validator(result, validator)
+    result.finish(success)
+
+
+def check_locked_registry(runner: GateRunner, result: GateResult):
+    if (runner.affected is not None and not runner.affected['full'] and not runner.affected['registry']
+            and not runner.affected['contracts']):
+        _skip_unaffected(result, 'contracts or registry entries')
+        return
+    validator = runner.locked_sections()
+    success = validator.verify_registry_sync(runner.args.registry_file)
+    _report_validator(result, validator)
+    result.finish(success)
+
+
+def check_locked_modifications(runner: GateRunner, result: GateResult):
+    if not runner.args.base_ref:
+        result.status = 'skip'
+        print("Skipped: --base-ref not given")
+        return
+    
+    base = runner.base_commit()
+    head = runner.git.resolve(runner.args.head_ref)
+    if base is None or head is None:
+        bad_ref = runner.args.base_ref if base is None else runner.args.head_ref
+        result.add('error', f"Unknown git ref: {bad_ref}")
+        result.finish(False)
+        return
+    
+    validator = runner.locked_sections()
+    validator.errors = []
+    modified, modified_locks = validator.detect_modifications(base, head, runner.git.toplevel())
+    result.details['locked_sections_modified'] = modified
+    result.details['modified_locks'] = modified_locks
+    for error in validator.errors:
+        result.add('error', error)
+    if validator.errors:
+        result.finish(False)
+        return
+    
+    print(f"locked_sections_modified={'true' if modified else 'false'}")
+    if modified:
+        print(f"\n⚠️  Locked section modifications detected:\n")
+        for lock_id in modified_locks:
+            print(f"  - {lock_id}")
+            result.add('warning', f"Locked section {lock_id} modified (requires CS2 approval)")
+    else:
+        print("\n✅ No locked section modifications detected")
+
+
+def check_inventory_coverage(runner: GateRunner, result: GateResult):
+    if str(REPO_SCRIPTS_DIR) not in sys.path:
+        sys.path.insert(0, str(REPO_SCRIPTS_DIR))
+    import sync_repo_inventory
+    
+    if runner.affected is not None and not runner.affected['full']:
+        # Coverage only moves when canons or the inventory itself change
+        canon_changes = [path for path in runner.affected['changed']
+                         if path.startswith('governance/canon/')]
+        if not runner.affected['inventory'] and not canon_changes:
+            _skip_unaffected(result, 'canons or inventory entries')
+            return
+        result.details['affected_inventory'] = runner.affected['inventory']
+    
+    repo_root = Path('.').resolve()
+    inventory = sync_repo_inventory.generate_inventory(
+        repo_root=repo_root,
+        governance_source_path=repo_root,
+        repo_name="<owner>/<repo>",
+        manifest=runner.index.files
+    )
+    result.details['coverage_percentage'] = inventory['coverage_percentage']
+    result.details['missing'] = [canon['id'] for canon in inventory['missing']]
+    for canon in inventory['missing']:
+        level = 'error' if runner.args.strict_inventory and canon['mandatory'] else 'warning'
+        result.add(level, f"Canon {canon['id']} missing ({canon['classification']}, {canon['priority']})")
+    sync_repo_inventory.print_compliance_report(inventory)
+    
+    if inventory['coverage_percentage'] < 100:
+        if runner.args.strict_inventory:
+            result.finish(False)
+        else:
+            result.status = 'warn'
+
+
+def check_frontmatter(runner: GateRunner, result: GateResult):
+    if validate_yaml_frontmatter.linter is None:
+        result.status, result.exit_code = 'error', 2
+        result.add('error', "yamllint not installed (pip install yamllint)")
+        return
+    
+    files = sorted({path for pattern in runner.args.frontmatter for path in glob.glob(pattern)
+                    if runner.is_affected('documents', runner.index.key(path))})
+    if not files:
+        _skip_unaffected(result, 'files with frontmatter')
+        return
+    config = validate_yaml_frontmatter.load_yamllint_config()
+    file_results = validate_yaml_frontmatter.validate_files(files, config, jobs=1, manifest=runner.index)
+    for file_path, status, problems in file_results:
+        for problem in problems:
+            line = int(problem.split(':', 1)[0])
+            level = 'error' if '  error  ' in problem else 'warning'
+            result.add(level, f"{file_path}:{problem}", path=file_path, line=line)
+    counts = validate_yaml_frontmatter.print_results(file_results)
+    result.details.update(counts)
+    result.finish(counts['failed'] == 0)
+
+
+def check_scope(runner: GateRunner, result: GateResult):
+    if not runner.args.base_ref:
+        result.status = 'skip'
+        print("Skipped: --base-ref not given")
+        return
+    
+    scope_file = runner.args.scope_file
+    try:
+        with open(scope_file, 'r', encoding='utf-8') as f:
+            declaration = validate_scope_to_diff.ScopeDeclaration.parse(f.read())
+    except FileNotFoundError:
+        result.add('error', f"{scope_file} not found (BL-027 requires a scope declaration)")
+        result.finish(False)
+        return
+    
+    base = runner.base_commit()
+    changed = validate_scope_to_diff.git_changed_files(base) if base else None
+    if changed is None:
+        print(f"⚠️  WARNING: Could not diff against {runner.args.base_ref}, falling back to HEAD")
+        changed = validate_scope_to_diff.git_changed_files('HEAD') or []
+    if not changed:
+        result.status = 'skip'
+        print("⚠️  WARNING: No changed files detected in git diff; skipping validation")
+        return
+    
+    comparison = validate_scope_to_diff.compare(changed, declaration)
+    result.details.update(comparison)
+    for path in comparison['undeclared']:
+        result.add('error', f"{path} changed but not declared in {scope_file}", path=path)
+    for path in comparison['over_declared']:
+        result.add('error', f"{path} declared in {scope_file} but not changed")
+    for mismatch in comparison['status_mismatches']:
+        result.add('warning', f"{mismatch['path']} declared as {mismatch['declared']} "
+                              f"but is {mismatch['actual']} in the diff", path=mismatch['path'])
+    success = not comparison['undeclared'] and not comparison['over_declared']
+    print("✅ PASS: Scope declaration matches git diff" if success
+          else "❌ FAIL: Scope declaration does not match git diff")
+    result.finish(success)
+
+
+CHECK_FUNCTIONS: Dict[str, Callable[[GateRunner, GateResult], None]] = {
+    'locked-metadata': check_locked_metadata,
+    'locked-registry': check_locked_registry,
+    'locked-modifications': check_locked_modifications,
+    'inventory-coverage': check_inventory_coverage,
+    'frontmatter': check_frontmatter,
+    'scope': check_scope,
+}
+
+
+def build_sarif(results: List[GateResult]) -> Dict:
+    """One SARIF run with a rule per check and a result per finding"""
+    sarif_results = []
+    for result in results:
+        for finding in result.findings:
+            entry = {
+                'ruleId': result.name,
+                'level': finding['level'],
+                'message': {'text': finding['message']},
+            }
+            if 'path' in finding:
+                location = {'artifactLocation': {'uri': finding['path']}}
+                if 'line' in finding:
+                    location['region'] = {'startLine': max(1, finding['line'])}
+                entry['locations'] = [{'physicalLocation': location}]
+            sarif_results.append(entry)
+    return {
+        '$schema': SARIF_SCHEMA,
+        'version': '2.1.0',
+        'runs': [{
+            'tool': {'driver': {
+                'name': 'run_governance_gates',
+                'version': '1.0.0',
+                'rules': [{'id': result.name, 'shortDescription': {'text': result.name}}
+                          for result in results],
+            }},
+            'results': sarif_results,
+        }],
+    }
+
+
+def write_github_outputs(results: Dict[str, GateResult]):
+    """Write the step outputs the individual gate scripts and workflow steps set today"""
+    lines = []
+    if 'locked-modifications' in results:
+        details = results['locked-modifications'].details
+        modified = details.get('locked_sections_modified', False)
+        lines.append(f"locked_sections_modified={'true' if modified else 'false'}")
+        if modified:
+            lines.append(f"modified_locks={', '.join(details['modified_locks'])}")
+            with open('/tmp/modified_lock_ids.txt', 'w') as f:
+                for lock_id in details['modified_locks']:
+                    f.write(f"- {lock_id}\n")
+        lines.append(f"modifications_exit_code={results['locked-modifications'].exit_code}")
+    if 'locked-metadata' in results:
+        lines.append(f"metadata_exit_code={results['locked-metadata'].exit_code}")
+    if 'locked-registry' in results:
+        lines.append(f"registry_exit_code={results['locked-registry'].exit_code}")
+    if 'scope' in results and results['scope'].exit_code == 0:
+        lines.append("script_passed=true")
+    
+    if 'GITHUB_OUTPUT' in os.environ:
+        with open(os.environ['GITHUB_OUTPUT'], 'a') as f:
+            for line in lines:
+                f.write(line + '\n')
+
+
+def write_json_file(path: str, data: Dict):
+    if path == '-':
+        json.dump(data, sys.stdout, indent=2)
+        print()
+        return
+    with open(path, 'w') as f:
+        json.dump(data, f, indent=2)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Run the governance gate checks in parallel, sharing one scan of the tree'
+    )
+    parser.add_argument(
+        '--checks',
+        default=','.join(CHECKS),
+        help=f'Comma-separated checks to run (default: all of {", ".join(CHECKS)})'
+    )
+    parser.add_argument(
+        '--base-ref',
+        help='Base git reference for locked-modifications and scope (those checks are skipped without it)'
+    )
+    parser.add_argument(
+        '--head-ref',
+        default='HEAD',
+        help='Head git reference for locked-modifications (default: HEAD)'
+    )
+    parser.add_argument(
+        '--contracts-dir',
+        default='.github/agents',
+        help='Directory containing agent contracts'
+    )
+    parser.add_argument(
+        '--registry-file',
+        default='governance/contracts/protection-registry.md',
+        help='Path to protection registry'
+    )
+    parser.add_argument(
+        '--scope-file',
+        default=validate_scope_to_diff.DEFAULT_SCOPE_FILE,
+        help=f'Scope declaration (default: {validate_scope_to_diff.DEFAULT_SCOPE_FILE})'
+    )
+    parser.add_argument(
+        '--frontmatter',
+        action='append',
+        metavar='GLOB',
+        help='Files whose frontmatter is linted; repeatable (default: .github/agents/*.md)'
+    )
+    parser.add_argument(
+        '--strict-inventory',
+        action='store_true',
+        help='Fail inventory-coverage when coverage is below 100%% (default: warn)'
+    )
+    parser.add_argument(
+        '--affected-only',
+        action='store_true',
+        help='Limit checks to what the --base-ref..--head-ref changes affect (see governance_graph.py)'
+    )
+    parser.add_argument(
+        '--inventory-file',
+        default='governance/CANON_INVENTORY.json',
+        help='Canon inventory used by --affected-only (default: governance/CANON_INVENTORY.json)'
+    )
+    parser.add_argument(
+        '--manifest',
+        default=DEFAULT_MANIFEST,
+        help=f'Governance index manifest to reuse and refresh (default: {DEFAULT_MANIFEST})'
+    )
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Index the tree from scratch and do not write the manifest'
+    )
+    parser.add_argument(
+        '--jobs',
+        type=int,
+        default=None,
+        help='Worker processes for indexing files and running checks (default: CPU count; 1 disables the pools)'
+    )
+    parser.add_argument(
+        '--json',
+        metavar='PATH',
+        help="Write the combined report as JSON to PATH ('-' for stdout)"
+    )
+    parser.add_argument(
+        '--sarif',
+        metavar='PATH',
+        help='Write findings as SARIF 2.1.0 to PATH'
+    )
+    
+    args = parser.parse_args()
+    
+    names = [name.strip() for name in args.checks.split(',') if name.strip()]
+    unknown = [name for name in names if name not in CHECK_FUNCTIONS]
+    if unknown or not names:
+        parser.error(f"unknown check(s): {', '.join(unknown) or '(none given)'}; choose from {', '.join(CHECKS)}")
+    if args.frontmatter is None:
+        args.frontmatter = ['.github/agents/*.md']
+    if args.affected_only and not args.base_ref:
+        parser.error("--affected-only requires --base-ref")
+    
+    start = time.perf_counter()
+    runner = GateRunner(args)
+    runner.prepare()
+    results = runner.run(names)
+    elapsed = time.perf_counter() - start
+    
+    for result in results:
+        print("=" * 80)
+        print(f"[{result.name}]")
+        print("=" * 80)
+        print(result.output.rstrip('\n'))
+        print()
+    
+    overall = 'FAIL' if any(result.exit_code for result in results) else 'PASS'
+    
+    print("=" * 80)
+    print("GOVERNANCE GATE SUMMARY")
+    print("=" * 80)
+    for result in results:
+        print(f"  {result.status.upper():5}  {result.name:22} {result.duration:6.2f}s  "
+              f"({len(result.findings)} findings)")
+    print(f"\nIndexed {len(runner.index.files)} files; total {elapsed:.2f}s")
+    affected = runner.affected
+    if affected is not None and affected['full']:
+        print(f"Affected by {len(affected['changed'])} changed files: everything (gate tooling changed)")
+    elif affected is not None:
+        print(f"Affected by {len(affected['changed'])} changed files: {len(affected['contracts'])} contracts, "
+              f"{len(affected['locks'])} locks, {len(affected['inventory'])} inventory entries")
+    print(f"\n{'✅' if overall == 'PASS' else '❌'} {overall}")
+    
+    by_name = {result.name: result for result in results}
+    write_github_outputs(by_name)
+    if args.json:
+        write_json_file(args.json, {
+            'result': overall,
+            'base_ref': args.base_ref,
+            'head_ref': args.head_ref,
+            'duration_s': round(elapsed, 3),
+            'affected': runner.affected,
+            'checks': [result.to_dict() for result in results],
+        })
+    if args.sarif:
+        write_json_file(args.sarif, build_sarif(results))
+    
+    sys.exit(1 if overall == 'FAIL' else 0)
+
+
+if __name__ == '__main__':
+    main()
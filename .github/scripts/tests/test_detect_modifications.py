@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Regression test: detect-modifications for pure deletions around locked section markers
+
+check_locked_sections.py maps every `git diff -U0` hunk onto the locked
+sections of the head version and, for hunks that remove base lines, onto the
+sections of the base version. A deletion has no head-side lines, so removing a
+START or END marker (or a whole section) is only visible on the base side.
+Each test commits a contract, deletes lines next to a marker in a second
+commit, and checks which Lock IDs are reported for base..head.
+
+Run:
+    python -m pytest .github/scripts/tests
+    python .github/scripts/tests/test_detect_modifications.py
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+sys.path.insert(0, str(REPO_ROOT / '.github' / 'scripts'))
+from check_locked_sections import LockedSectionValidator  # noqa: E402
+
+CONTRACT = """# Example Agent
+
+Intro line.
+<!-- LOCKED SECTION START -->
+<!-- Lock ID: LOCK-EXAMPLE-001 -->
+<!-- END METADATA -->
+First protected line.
+Last protected line.
+<!-- LOCKED SECTION END -->
+Outro line.
+
+<!-- LOCKED SECTION START -->
+<!-- Lock ID: LOCK-EXAMPLE-002 -->
+<!-- END METADATA -->
+Second section body.
+<!-- LOCKED SECTION END -->
+"""
+
+
+def line_of(text: str) -> int:
+    """1-based line number of the first CONTRACT line equal to text"""
+    return CONTRACT.split('\n').index(text) + 1
+
+
+def git(cwd: Path, *args: str) -> str:
+    return subprocess.check_output(['git', *args], cwd=cwd, universal_newlines=True).strip()
+
+
+class DetectModificationsTest(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name).resolve()
+        git(self.root, 'init', '-q')
+        git(self.root, 'config', 'user.email', 'test@example.com')
+        git(self.root, 'config', 'user.name', 'Test')
+        self.agents = self.root / '.github' / 'agents'
+        self.agents.mkdir(parents=True)
+        self.contract = self.agents / 'example.md'
+        self.contract.write_text(CONTRACT, encoding='utf-8')
+        git(self.root, 'add', '-A')
+        git(self.root, 'commit', '-q', '-m', 'base')
+        self.base = git(self.root, 'rev-parse', 'HEAD')
+        self._cwd = os.getcwd()
+        os.chdir(self.root)
+    
+    def tearDown(self):
+        os.chdir(self._cwd)
+        self._tmp.cleanup()
+    
+    def modified_after(self, first: int, count: int = 1):
+        """Delete count lines from 1-based line first, commit, and return detect_modifications(base, head)"""
+        lines = CONTRACT.split('\n')
+        del lines[first - 1:first - 1 + count]
+        self.contract.write_text('\n'.join(lines), encoding='utf-8')
+        git(self.root, 'commit', '-q', '-am', 'head')
+        validator = LockedSectionValidator('.github/agents', jobs=1)
+        validator.scan_contracts()
+        # A head with a deleted marker has scan errors of its own; detection must add none
+        scan_errors = list(validator.errors)
+        result = validator.detect_modifications(self.base, 'HEAD', self.root)
+        self.assertEqual(validator.errors, scan_errors)
+        return result
+    
+    def test_deleting_line_after_end_marker_is_not_a_modification(self):
+        self.assertEqual(self.modified_after(line_of('Outro line.')), (False, []))
+    
+    def test_deleting_line_before_start_marker_is_not_a_modification(self):
+        self.assertEqual(self.modified_after(line_of('Intro line.')), (False, []))
+    
+    def test_deleting_first_body_line_after_metadata(self):
+        self.assertEqual(self.modified_after(line_of('First protected line.')), (True, ['LOCK-EXAMPLE-001']))
+    
+    def test_deleting_last_body_line_before_end_marker(self):
+        self.assertEqual(self.modified_after(line_of('Last protected line.')), (True, ['LOCK-EXAMPLE-001']))
+    
+    def test_deleting_start_marker(self):
+        # The head has no section left where the marker was; only the base shows it
+        self.assertEqual(self.modified_after(line_of('<!-- LOCKED SECTION START -->')),
+                         (True, ['LOCK-EXAMPLE-001']))
+    
+    def test_deleting_end_marker(self):
+        # The head section now runs into the next START, so both sides report the lock
+        modified, locks = self.modified_after(line_of('<!-- LOCKED SECTION END -->'))
+        self.assertTrue(modified)
+        self.assertIn('LOCK-EXAMPLE-001', locks)
+    
+    def test_deleting_whole_section(self):
+        start = line_of('<!-- Lock ID: LOCK-EXAMPLE-002 -->') - 1
+        self.assertEqual(self.modified_after(start, 5), (True, ['LOCK-EXAMPLE-002']))
+    
+    def test_deleting_contract(self):
+        git(self.root, 'rm', '-q', str(self.contract))
+        git(self.root, 'commit', '-q', '-m', 'head')
+        validator = LockedSectionValidator('.github/agents', jobs=1)
+        validator.scan_contracts()
+        self.assertEqual(validator.detect_modifications(self.base, 'HEAD', self.root),
+                         (True, ['LOCK-EXAMPLE-001', 'LOCK-EXAMPLE-002']))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Tests for check_locked_sections.py reading the git object database (compare-refs)
+
+GitObjectReader talks to one `git cat-file --batch` process. Object specs may
+contain spaces, and git echoes the spec back in its "<spec> missing" reply, so
+a missing path with spaces must read as None and leave the stream usable.
+
+Run:
+    python -m pytest .github/scripts/tests
+    python .github/scripts/tests/test_git_object_reader.py
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+sys.path.insert(0, str(REPO_ROOT / '.github' / 'scripts'))
+from check_locked_sections import GitObjectReader, LockedSectionValidator  # noqa: E402
+
+
+def contract(*lock_ids: str, body: str = 'Protected text.') -> str:
+    sections = [f"<!-- LOCKED SECTION START -->\n<!-- Lock ID: {lock_id} -->\n<!-- END METADATA -->\n"
+                f"{body}\n<!-- LOCKED SECTION END -->\n" for lock_id in lock_ids]
+    return "# Agent\n\n" + "\n".join(sections)
+
+
+def git(cwd: Path, *args: str) -> str:
+    return subprocess.check_output(['git', *args], cwd=cwd, universal_newlines=True).strip()
+
+
+class GitObjectReaderTest(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name).resolve()
+        git(self.root, 'init', '-q')
+        git(self.root, 'config', 'user.email', 'test@example.com')
+        git(self.root, 'config', 'user.name', 'Test')
+        self.agents = self.root / 'agent contracts'
+        self.agents.mkdir()
+        (self.agents / 'one agent.md').write_text(contract('LOCK-ONE-001', 'LOCK-ONE-002'), encoding='utf-8')
+        (self.agents / 'README.md').write_text(contract('LOCK-README-001'), encoding='utf-8')
+        git(self.root, 'add', '-A')
+        git(self.root, 'commit', '-q', '-m', 'base')
+        self.base = git(self.root, 'rev-parse', 'HEAD')
+        self._cwd = os.getcwd()
+        os.chdir(self.root)
+    
+    def tearDown(self):
+        os.chdir(self._cwd)
+        self._tmp.cleanup()
+    
+    def test_missing_specs_with_spaces(self):
+        with GitObjectReader() as reader:
+            for spec in ('HEAD:agent/none.md', 'HEAD:agent contracts/none.md',
+                         'HEAD:a b c/none.md', 'no-such-ref', 'HEAD:x missing'):
+                with self.subTest(spec=spec):
+                    self.assertIsNone(reader.read(spec))
+            # The stream is still in step after the misses
+            oid, obj_type, content = reader.read('HEAD:agent contracts/one agent.md')
+            self.assertEqual(obj_type, 'blob')
+            self.assertIn(b'LOCK-ONE-001', content)
+            self.assertEqual(oid, git(self.root, 'rev-parse', 'HEAD:agent contracts/one agent.md'))
+    
+    def test_iter_tree_paths_with_spaces(self):
+        with GitObjectReader() as reader:
+            tree = reader.read('HEAD^{tree}')
+            self.assertEqual(tree[1], 'tree')
+            self.assertEqual(sorted(path for path, _ in reader.iter_tree(tree[0])),
+                             ['agent contracts/README.md', 'agent contracts/one agent.md'])
+    
+    def test_compare_refs(self):
+        (self.agents / 'one agent.md').write_text(
+            contract('LOCK-ONE-001', body='Edited.') + contract('LOCK-ONE-003'), encoding='utf-8')
+        git(self.root, 'commit', '-q', '-am', 'head')
+        validator = LockedSectionValidator('agent contracts', jobs=1)
+        result = validator.compare_refs(self.base, 'HEAD')
+        self.assertEqual(validator.errors, [])
+        self.assertEqual(result, {'added': ['LOCK-ONE-003'], 'removed': ['LOCK-ONE-002'],
+                                  'changed': ['LOCK-ONE-001']})
+    
+    def test_compare_refs_unknown_ref(self):
+        validator = LockedSectionValidator('agent contracts', jobs=1)
+        self.assertIsNone(validator.compare_refs(self.base, 'no-such-ref'))
+        self.assertEqual(validator.errors, ["Git ref 'no-such-ref' not found"])
+
+
+if __name__ == '__main__':
+    unittest.main()
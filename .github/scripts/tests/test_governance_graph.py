@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Tests for governance_graph.py: citation resolution and the affected set of a change
+
+Run:
+    python -m pytest .github/scripts/tests
+    python .github/scripts/tests/test_governance_graph.py
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+sys.path.insert(0, str(REPO_ROOT / '.github' / 'scripts'))
+from governance_graph import DependencyGraph  # noqa: E402
+from governance_index import GovernanceIndex  # noqa: E402
+
+FILES = {
+    # The contract cites A; A cites B by bare name; the lock cites C
+    '.github/agents/agent.md': (
+        "# Agent\n\n**Authority**: governance/canon/A.md\n\n"
+        "<!-- LOCKED SECTION START -->\n<!-- Lock ID: LOCK-AGENT-001 -->\n"
+        "<!-- Lock Authority: governance/canon/C.md -->\n<!-- END METADATA -->\n"
+        "Protected text.\n<!-- LOCKED SECTION END -->\n"
+    ),
+    '.github/agents/other.md': (
+        "# Other\n\nAuthority: governance/canon/D.md\n\n"
+        "<!-- LOCKED SECTION START -->\n<!-- Lock ID: LOCK-OTHER-001 -->\n<!-- END METADATA -->\n"
+        "Protected text.\n<!-- LOCKED SECTION END -->\n"
+    ),
+    'governance/canon/A.md': "# A\n\nAuthority: B (section 1)\n",
+    'governance/canon/B.md': "# B\n",
+    'governance/canon/C.md': "# C\n",
+    'governance/canon/D.md': "# D\n",
+    'governance/notes/B.md': "# Another B outside the canon directory\n",
+}
+
+INVENTORY = {'canons': [{'path': f'governance/canon/{name}.md', 'filename': f'{name}.md'}
+                        for name in 'ABCD']}
+
+
+class DependencyGraphTest(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name).resolve()
+        for name, text in FILES.items():
+            path = self.root / name
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(text, encoding='utf-8')
+        self._cwd = os.getcwd()
+        os.chdir(self.root)
+        index = GovernanceIndex(str(self.root)).build(jobs=1)
+        self.graph = DependencyGraph.from_index(index, INVENTORY)
+    
+    def tearDown(self):
+        os.chdir(self._cwd)
+        self._tmp.cleanup()
+    
+    def test_resolve(self):
+        self.assertEqual(self.graph.resolve('governance/canon/A.md, governance/canon/D.md'),
+                         ['governance/canon/A.md', 'governance/canon/D.md'])
+        # Bare names resolve with or without .md, preferring governance/canon/
+        self.assertEqual(self.graph.resolve('B'), ['governance/canon/B.md'])
+        self.assertEqual(self.graph.resolve('CS2 approval'), [])
+    
+    def test_transitive_citations(self):
+        affected = self.graph.affected(['governance/canon/B.md'])
+        self.assertEqual(affected['documents'], ['.github/agents/agent.md', 'governance/canon/A.md',
+                                                 'governance/canon/B.md'])
+        self.assertEqual(affected['contracts'], ['.github/agents/agent.md'])
+        self.assertEqual(affected['locks'], ['LOCK-AGENT-001'])
+        self.assertEqual(affected['inventory'], ['governance/canon/B.md'])
+        self.assertFalse(affected['full'])
+    
+    def test_lock_authority_citation(self):
+        affected = self.graph.affected(['governance/canon/C.md'])
+        self.assertEqual(affected['documents'], ['governance/canon/C.md'])
+        self.assertEqual(affected['locks'], ['LOCK-AGENT-001'])
+        self.assertEqual(affected['contracts'], ['.github/agents/agent.md'])
+    
+    def test_unrelated_change(self):
+        affected = self.graph.affected(['README.md'])
+        self.assertEqual((affected['contracts'], affected['locks'], affected['inventory']), ([], [], []))
+        self.assertFalse(affected['registry'])
+    
+    def test_gate_tooling_change_affects_everything(self):
+        affected = self.graph.affected(['.github/scripts/check_locked_sections.py'])
+        self.assertTrue(affected['full'])
+        self.assertEqual(affected['contracts'], ['.github/agents/agent.md', '.github/agents/other.md'])
+        self.assertEqual(affected['locks'], ['LOCK-AGENT-001', 'LOCK-OTHER-001'])
+        self.assertEqual(len(affected['inventory']), 4)
+    
+    def test_inventory_and_registry_changes(self):
+        affected = self.graph.affected(['governance/CANON_INVENTORY.json',
+                                        'governance/contracts/protection-registry.md'])
+        self.assertEqual(len(affected['inventory']), 4)
+        self.assertTrue(affected['registry'])
+        self.assertEqual(affected['contracts'], [])
+
+
+if __name__ == '__main__':
+    unittest.main()
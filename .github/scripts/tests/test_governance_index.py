@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Tests for governance_index.py: building, reusing and querying the tree manifest
+
+Run:
+    python -m pytest .github/scripts/tests
+    python .github/scripts/tests/test_governance_index.py
+"""
+
+import os
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+sys.path.insert(0, str(REPO_ROOT / '.github' / 'scripts'))
+from check_locked_sections import LockedSectionValidator  # noqa: E402
+from governance_index import GovernanceIndex, parse_authority  # noqa: E402
+
+CONTRACT = """---
+name: agent
+version: 1.0.0
+---
+# Agent
+
+**Authority**:
+- governance/canon/A.md
+- governance/canon/B.md (section 2)
+
+<!-- LOCKED SECTION START -->
+<!-- Lock ID: LOCK-AGENT-001 -->
+<!-- Lock Authority: governance/canon/C.md -->
+<!-- END METADATA -->
+Protected text.
+<!-- LOCKED SECTION END -->
+"""
+
+
+def set_old_mtime(path: Path, seconds_ago: int = 60):
+    """Move mtime out of the index's racy window"""
+    stamp = time.time() - seconds_ago
+    os.utime(path, (stamp, stamp))
+
+
+class GovernanceIndexTest(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name).resolve()
+        files = {
+            '.github/agents/agent.md': CONTRACT,
+            'governance/canon/A.md': '# A\n\nAuthority: governance/canon/B.md\n',
+            'governance/canon/B.md': '# B\n',
+            'governance/notes.txt': 'not markdown\n',
+        }
+        for name, text in files.items():
+            path = self.root / name
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(text, encoding='utf-8')
+            set_old_mtime(path)
+        self.manifest = self.root / '.cache' / 'index.json'
+        self._cwd = os.getcwd()
+        os.chdir(self.root)
+    
+    def tearDown(self):
+        os.chdir(self._cwd)
+        self._tmp.cleanup()
+    
+    def build(self):
+        previous = GovernanceIndex.load(str(self.manifest))
+        index = GovernanceIndex(str(self.root)).build(previous, jobs=1)
+        index.save(str(self.manifest))
+        return index
+    
+    def test_entries(self):
+        index = self.build()
+        self.assertEqual(list(index.files), ['.github/agents/agent.md', 'governance/canon/A.md',
+                                             'governance/canon/B.md'])
+        entry = index.files['.github/agents/agent.md']
+        self.assertEqual(entry['frontmatter_data'], {'name': 'agent', 'version': '1.0.0'})
+        self.assertEqual(entry['authority_refs'], ['governance/canon/A.md', 'governance/canon/B.md'])
+        self.assertEqual([s['lock_id'] for s in entry['locked_sections']], ['LOCK-AGENT-001'])
+        # Metadata is kept as written (consumers normalize it), so match the reference only
+        self.assertEqual(entry['lock_authorities'][0]['lock_id'], 'LOCK-AGENT-001')
+        self.assertIn('governance/canon/C.md', entry['lock_authorities'][0]['authority'])
+    
+    def test_rebuild_reuses_unchanged_entries(self):
+        self.build()
+        index = self.build()
+        self.assertEqual((index.reused, index.reread), (3, 0))
+    
+    def test_edit_invalidates_entry(self):
+        self.build()
+        path = self.root / 'governance/canon/B.md'
+        path.write_text('# B\n\nAuthority: governance/canon/A.md\n', encoding='utf-8')
+        stale = GovernanceIndex.load(str(self.manifest))
+        self.assertIsNone(stale.lookup('governance/canon/B.md'))
+        self.assertIsNotNone(stale.lookup('governance/canon/A.md'))
+        index = self.build()
+        self.assertEqual((index.reused, index.reread), (2, 1))
+        self.assertEqual(index.files['governance/canon/B.md']['authority_refs'], ['governance/canon/A.md'])
+    
+    def test_deleted_file_is_dropped(self):
+        self.build()
+        (self.root / 'governance/canon/B.md').unlink()
+        self.assertNotIn('governance/canon/B.md', self.build().files)
+    
+    def test_validator_reads_sections_from_manifest(self):
+        index = self.build()
+        direct = LockedSectionValidator('.github/agents', jobs=1)
+        direct.scan_contracts()
+        indexed = LockedSectionValidator('.github/agents', jobs=1, manifest=index)
+        indexed.scan_contracts()
+        self.assertEqual([s.to_dict() for s in indexed.locked_sections],
+                         [s.to_dict() for s in direct.locked_sections])
+        self.assertEqual(indexed.errors, direct.errors)
+    
+    def test_manifest_from_other_tree_is_not_reused(self):
+        self.build()
+        other = GovernanceIndex(str(self.root), roots=['governance']).build(
+            GovernanceIndex.load(str(self.manifest)), jobs=1)
+        self.assertEqual((other.reused, other.reread), (0, 2))
+
+
+class ParseAuthorityTest(unittest.TestCase):
+
+    def test_inline_and_list_values(self):
+        text = ("**Authority:** governance/canon/A.md, governance/canon/B.md\n"
+                "- Authority: CS2\n"
+                "Lock Authority: governance/canon/X.md\n"
+                "Authority:\n- governance/canon/C.md\n- governance/canon/A.md\n\nAfter.\n")
+        values, refs = parse_authority(text)
+        self.assertEqual(values, ['governance/canon/A.md, governance/canon/B.md', 'CS2',
+                                  'governance/canon/C.md', 'governance/canon/A.md'])
+        self.assertEqual(refs, ['governance/canon/A.md', 'governance/canon/B.md', 'governance/canon/C.md'])
+
+
+if __name__ == '__main__':
+    unittest.main()
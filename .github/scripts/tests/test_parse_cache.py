@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Tests for check_locked_sections.py's persistent parse cache (ParseCache)
+
+Cached parse results are trusted on a size + mtime_ns match unless the entry
+is racy (modified within RACY_WINDOW_NS of being hashed); otherwise the file
+is re-hashed and only re-parsed when its content changed.
+
+Run:
+    python -m pytest .github/scripts/tests
+    python .github/scripts/tests/test_parse_cache.py
+"""
+
+import contextlib
+import io
+import json
+import os
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+sys.path.insert(0, str(REPO_ROOT / '.github' / 'scripts'))
+import check_locked_sections  # noqa: E402
+from check_locked_sections import LockedSectionValidator, default_cache_file  # noqa: E402
+
+
+def contract(lock_id: str) -> str:
+    return (f"# Agent\n\n<!-- LOCKED SECTION START -->\n<!-- Lock ID: {lock_id} -->\n"
+            f"<!-- END METADATA -->\nProtected text.\n<!-- LOCKED SECTION END -->\n")
+
+
+def set_old_mtime(path: Path, seconds_ago: int = 60):
+    """Move mtime out of the parse cache's racy window"""
+    stamp = time.time() - seconds_ago
+    os.utime(path, (stamp, stamp))
+
+
+class ParseCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+        self.agents = self.root / 'agents'
+        self.agents.mkdir()
+        self.cache_file = self.root / 'cache' / 'parse.json'
+        for name, lock_id in (('one.md', 'LOCK-ONE-001'), ('two.md', 'LOCK-TWO-001')):
+            (self.agents / name).write_text(contract(lock_id), encoding='utf-8')
+            set_old_mtime(self.agents / name)
+    
+    def tearDown(self):
+        self._tmp.cleanup()
+    
+    def scan(self, **kwargs):
+        """Scan with the cache; returns the validator and whether any contract was parsed"""
+        validator = LockedSectionValidator(str(self.agents), jobs=1, cache_file=str(self.cache_file), **kwargs)
+        with mock.patch.object(check_locked_sections, 'parse_contract_text',
+                               wraps=check_locked_sections.parse_contract_text) as parse:
+            validator.scan_contracts()
+        return validator, parse.call_count
+    
+    def lock_ids(self, validator):
+        return sorted(section.lock_id for section in validator.locked_sections)
+    
+    def test_unchanged_contracts_are_not_parsed(self):
+        _, parsed = self.scan()
+        self.assertEqual(parsed, 2)
+        validator, parsed = self.scan()
+        self.assertEqual((parsed, validator.cache.hits, validator.cache.misses), (0, 2, 0))
+        self.assertEqual(self.lock_ids(validator), ['LOCK-ONE-001', 'LOCK-TWO-001'])
+    
+    def test_size_change_reparses(self):
+        self.scan()
+        path = self.agents / 'one.md'
+        path.write_text(contract('LOCK-ONE-0001'), encoding='utf-8')
+        set_old_mtime(path)
+        validator, parsed = self.scan()
+        self.assertEqual(parsed, 1)
+        self.assertEqual(self.lock_ids(validator), ['LOCK-ONE-0001', 'LOCK-TWO-001'])
+    
+    def test_same_size_edit_reparses(self):
+        self.scan()
+        path = self.agents / 'one.md'
+        path.write_text(contract('LOCK-ONE-009'), encoding='utf-8')
+        set_old_mtime(path, seconds_ago=30)
+        validator, parsed = self.scan()
+        self.assertEqual(parsed, 1)
+        self.assertEqual(self.lock_ids(validator), ['LOCK-ONE-009', 'LOCK-TWO-001'])
+    
+    def test_touch_rehashes_without_reparsing(self):
+        self.scan()
+        set_old_mtime(self.agents / 'one.md', seconds_ago=30)
+        validator, parsed = self.scan()
+        self.assertEqual((parsed, validator.cache.hits), (0, 2))
+        # The new stat data is saved, so the next run is a plain hit again
+        entry = json.loads(self.cache_file.read_text())['files'][str(self.agents / 'one.md')]
+        self.assertEqual(entry['mtime_ns'], (self.agents / 'one.md').stat().st_mtime_ns)
+    
+    def test_racy_entry_catches_same_size_edit_with_same_mtime(self):
+        path = self.agents / 'one.md'
+        path.write_text(contract('LOCK-ONE-001'), encoding='utf-8')
+        mtime_ns = path.stat().st_mtime_ns
+        self.scan()
+        # Same size, same mtime: only the racy check notices the edit
+        path.write_text(contract('LOCK-ONE-009'), encoding='utf-8')
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+        validator, parsed = self.scan()
+        self.assertEqual(parsed, 1)
+        self.assertEqual(self.lock_ids(validator), ['LOCK-ONE-009', 'LOCK-TWO-001'])
+    
+    def test_deleted_contracts_are_pruned(self):
+        self.scan()
+        (self.agents / 'two.md').unlink()
+        self.scan()
+        self.assertEqual(list(json.loads(self.cache_file.read_text())['files']), [str(self.agents / 'one.md')])
+    
+    def test_other_parser_version_or_tree_is_discarded(self):
+        self.scan()
+        data = json.loads(self.cache_file.read_text())
+        for key, value in (('parser', -1), ('scope', {'contracts_dir': 'elsewhere', 'resolved': '/elsewhere'})):
+            with self.subTest(key=key):
+                self.cache_file.write_text(json.dumps(dict(data, **{key: value})))
+                validator, parsed = self.scan()
+                self.assertEqual((parsed, validator.cache.hits), (2, 0))
+    
+    def test_rebuild_ignores_the_cache(self):
+        self.scan()
+        validator, parsed = self.scan(rebuild_cache=True)
+        self.assertEqual((parsed, validator.cache.hits), (2, 0))
+    
+    def test_unwritable_cache_does_not_fail(self):
+        self.cache_file.parent.write_text('not a directory')
+        stderr = io.StringIO()
+        with contextlib.redirect_stderr(stderr):
+            validator, parsed = self.scan()
+        self.assertEqual((parsed, validator.errors), (2, []))
+        self.assertIn('could not write parse cache', stderr.getvalue())
+    
+    def test_default_cache_file_is_outside_the_tree(self):
+        cache_file = default_cache_file(str(self.agents))
+        self.assertEqual(cache_file.parent, check_locked_sections.CACHE_DIR)
+        self.assertNotIn(self.root, cache_file.parents)
+        self.assertNotEqual(cache_file, default_cache_file(str(self.root)))
+
+
+if __name__ == '__main__':
+    unittest.main()
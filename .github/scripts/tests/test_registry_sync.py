@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Tests for check_locked_sections.py verify-registry: which findings fail the gate
+
+Only a locked section missing from the protection registry is an error, as
+before the exact Lock ID index. Stale registry entries, duplicate
+registrations and registrations against another contract are warnings.
+
+Run:
+    python -m pytest .github/scripts/tests
+    python .github/scripts/tests/test_registry_sync.py
+"""
+
+import contextlib
+import io
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+sys.path.insert(0, str(REPO_ROOT / '.github' / 'scripts'))
+from check_locked_sections import LockedSectionValidator  # noqa: E402
+
+
+def contract(*lock_ids: str) -> str:
+    sections = [f"<!-- LOCKED SECTION START -->\n<!-- Lock ID: {lock_id} -->\n"
+                f"<!-- Lock Authority: CS2 -->\n<!-- END METADATA -->\nProtected text.\n"
+                f"<!-- LOCKED SECTION END -->\n" for lock_id in lock_ids]
+    return "# Agent\n\n" + "\n".join(sections)
+
+
+def registry(*rows) -> str:
+    """Registry table from (lock_id, contract_file) rows"""
+    lines = ["# Protection Registry", "",
+             "| Lock ID | Contract File | Authority |",
+             "|---------|---------------|-----------|"]
+    lines += [f"| {lock_id} | {contract_file} | CS2 |" for lock_id, contract_file in rows]
+    return "\n".join(lines) + "\n"
+
+
+class RegistrySyncTest(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+        self.agents = self.root / 'agents'
+        self.agents.mkdir()
+        (self.agents / 'one.md').write_text(contract('LOCK-ONE-001', 'LOCK-ONE-002'), encoding='utf-8')
+        (self.agents / 'two.md').write_text(contract('LOCK-TWO-001'), encoding='utf-8')
+        self.registry_file = self.root / 'registry.md'
+    
+    def tearDown(self):
+        self._tmp.cleanup()
+    
+    def verify(self, *rows):
+        self.registry_file.write_text(registry(*rows), encoding='utf-8')
+        validator = LockedSectionValidator(str(self.agents), jobs=1)
+        with contextlib.redirect_stdout(io.StringIO()):
+            validator.scan_contracts()
+        success = validator.verify_registry_sync(str(self.registry_file))
+        return success, validator
+    
+    def test_in_sync(self):
+        success, validator = self.verify(('LOCK-ONE-001', 'one.md'), ('LOCK-ONE-002', 'one.md'),
+                                         ('LOCK-TWO-001', 'two.md'))
+        self.assertTrue(success)
+        self.assertEqual((validator.errors, validator.warnings), ([], []))
+    
+    def test_unregistered_lock_fails(self):
+        success, validator = self.verify(('LOCK-ONE-001', 'one.md'), ('LOCK-TWO-001', 'two.md'))
+        self.assertFalse(success)
+        self.assertEqual(len(validator.errors), 1)
+        self.assertIn("'LOCK-ONE-002'", validator.errors[0])
+    
+    def test_exact_lock_id_match(self):
+        # LOCK-ONE-0010 does not register LOCK-ONE-001
+        success, validator = self.verify(('LOCK-ONE-0010', 'one.md'), ('LOCK-ONE-002', 'one.md'),
+                                         ('LOCK-TWO-001', 'two.md'))
+        self.assertFalse(success)
+        self.assertIn("'LOCK-ONE-001'", validator.errors[0])
+    
+    def test_registry_side_findings_are_warnings(self):
+        success, validator = self.verify(
+            ('LOCK-ONE-001', 'one.md'), ('LOCK-ONE-002', 'two.md'), ('LOCK-TWO-001', 'two.md'),
+            ('LOCK-TWO-001', 'two.md'), ('LOCK-GONE-001', 'gone.md'))
+        self.assertTrue(success)
+        self.assertEqual(validator.errors, [])
+        warnings = '\n'.join(validator.warnings)
+        self.assertEqual(len(validator.warnings), 3, warnings)
+        self.assertIn("'LOCK-TWO-001' registered more than once", warnings)
+        self.assertIn("'LOCK-ONE-002' is registered for two.md", warnings)
+        self.assertIn("'LOCK-GONE-001'", warnings)
+
+
+if __name__ == '__main__':
+    unittest.main()
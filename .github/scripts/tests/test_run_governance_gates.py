@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Tests for run_governance_gates.py: per-check output capture and worker processes
+
+GateRunner does the shared work (contract scan, git ref resolution) in the
+main process, then forks one worker per check (up to --jobs). Each check's
+prints, including those of threads it starts, must land in its own result
+and nowhere else.
+
+Run:
+    python -m pytest .github/scripts/tests
+    python .github/scripts/tests/test_run_governance_gates.py
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from unittest import mock
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+sys.path.insert(0, str(REPO_ROOT / '.github' / 'scripts'))
+import run_governance_gates as gates  # noqa: E402
+
+CONTRACT = """# Agent
+
+<!-- LOCKED SECTION START -->
+<!-- Lock ID: LOCK-AGENT-001 -->
+<!-- Lock Reason: Test -->
+<!-- Lock Authority: Test -->
+<!-- Lock Date: 2026-01-01 -->
+<!-- Last Reviewed: 2026-01-01 -->
+<!-- Review Frequency: quarterly -->
+<!-- END METADATA -->
+Protected text.
+<!-- LOCKED SECTION END -->
+"""
+
+
+def gate_args(root: Path, jobs: int) -> argparse.Namespace:
+    return argparse.Namespace(
+        contracts_dir='.github/agents', registry_file='registry.md', jobs=jobs,
+        manifest=str(root / 'index.json'), no_cache=True, affected_only=False,
+        base_ref=None, head_ref='HEAD', inventory_file='inventory.json',
+    )
+
+
+def noisy_check(label: str):
+    """A check printing from its own thread and from a helper thread it starts"""
+    def check(runner, result):
+        print(f"{label} start")
+        helper = threading.Thread(target=print, args=(f"{label} helper",))
+        helper.start()
+        helper.join()
+        print(f"{label} pid={os.getpid()}")
+        result.details['pid'] = os.getpid()
+    return check
+
+
+def failing_check(runner, result):
+    print("before failure")
+    raise ValueError("boom")
+
+
+def exiting_check(runner, result):
+    sys.exit(3)
+
+
+def dying_check(runner, result):
+    os._exit(3)
+
+
+def scan_check(runner, result):
+    # The main process scanned the contracts before this worker started
+    result.details['scanned_before'] = runner.scan is not None
+    result.details['locks'] = [s.lock_id for s in runner.locked_sections().locked_sections]
+
+
+FAKE_CHECKS = {
+    'one': noisy_check('one'), 'two': noisy_check('two'), 'three': noisy_check('three'),
+    'failing': failing_check, 'exiting': exiting_check, 'dying': dying_check,
+    'locked-scan': scan_check,
+}
+
+
+class GateRunnerTest(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name).resolve()
+        agents = self.root / '.github' / 'agents'
+        agents.mkdir(parents=True)
+        (agents / 'agent.md').write_text(CONTRACT, encoding='utf-8')
+        self._cwd = os.getcwd()
+        os.chdir(self.root)
+        patcher = mock.patch.dict(gates.CHECK_FUNCTIONS, FAKE_CHECKS)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+    
+    def tearDown(self):
+        os.chdir(self._cwd)
+        self._tmp.cleanup()
+    
+    def run_checks(self, names, jobs):
+        runner = gates.GateRunner(gate_args(self.root, jobs))
+        runner.prepare()
+        return runner, runner.run(names)
+    
+    def assert_own_output(self, results):
+        for result in results:
+            name = result.name
+            self.assertEqual(result.output, f"{name} start\n{name} helper\n{name} pid={result.details['pid']}\n")
+    
+    def test_output_captured_per_check_in_workers(self):
+        runner, results = self.run_checks(['one', 'two', 'three'], jobs=3)
+        self.assertEqual(runner.check_workers(['one', 'two', 'three']), 3)
+        self.assertEqual([result.name for result in results], ['one', 'two', 'three'])
+        self.assert_own_output(results)
+        self.assertNotIn(os.getpid(), [result.details['pid'] for result in results])
+    
+    def test_jobs_1_runs_in_process(self):
+        stdout = sys.stdout
+        _, results = self.run_checks(['one', 'two'], jobs=1)
+        self.assert_own_output(results)
+        self.assertEqual({result.details['pid'] for result in results}, {os.getpid()})
+        self.assertIs(sys.stdout, stdout)
+    
+    def test_errors_and_exits_become_error_results(self):
+        for jobs in (1, 2):
+            with self.subTest(jobs=jobs):
+                _, results = self.run_checks(['failing', 'exiting', 'one'], jobs=jobs)
+                failing, exiting, one = results
+                self.assertEqual((failing.status, failing.exit_code), ('error', 1))
+                self.assertEqual(failing.findings, [{'level': 'error', 'message': 'failing raised ValueError: boom'}])
+                self.assertEqual(failing.output, "before failure\n")
+                self.assertEqual(exiting.findings, [{'level': 'error', 'message': 'exiting exited with status 3'}])
+                self.assertEqual(one.status, 'pass')
+    
+    def test_dead_worker_is_an_error_result(self):
+        _, results = self.run_checks(['dying', 'one'], jobs=2)
+        self.assertEqual((results[0].status, results[0].exit_code), ('error', 1))
+        self.assertIn('dying worker failed', results[0].findings[0]['message'])
+    
+    def test_contracts_scanned_once_in_main_process(self):
+        scans = []
+        original = gates.LockedSectionValidator.scan_contracts
+        
+        def recording_scan(validator):
+            scans.append((os.getpid(), threading.current_thread() is threading.main_thread()))
+            return original(validator)
+        
+        with mock.patch.object(gates.LockedSectionValidator, 'scan_contracts', recording_scan):
+            _, results = self.run_checks(['locked-scan', 'one'], jobs=2)
+        self.assertEqual(scans, [(os.getpid(), True)])
+        self.assertEqual(results[0].details, {'scanned_before': True, 'locks': ['LOCK-AGENT-001']})
+
+
+if __name__ == '__main__':
+    unittest.main()
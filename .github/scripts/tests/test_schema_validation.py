@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+Tests for scripts/schema_validation.py and scripts/validate_tenant_memory.py
+
+Covers the compiled schema checks, streaming entries out of JSON arrays and
+JSON Lines files, the per-file result cache, and splitting large JSON Lines
+files into byte ranges.
+
+Run:
+    python -m pytest .github/scripts/tests
+    python .github/scripts/tests/test_schema_validation.py
+"""
+
+import io
+import json
+import os
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+sys.path.insert(0, str(REPO_ROOT / 'scripts'))
+import schema_validation  # noqa: E402
+import validate_tenant_memory as memory  # noqa: E402
+from schema_validation import CompiledSchema, ResultCache, SchemaError, iter_json_array, iter_json_entries  # noqa: E402
+
+SCHEMA = {
+    '$schema': 'http://json-schema.org/draft-07/schema#',
+    'title': 'Entry',
+    'type': 'object',
+    'required': ['id', 'kind'],
+    'additionalProperties': False,
+    'properties': {
+        'id': {'type': 'string', 'pattern': '^e_[0-9]+$'},
+        'kind': {'enum': ['a', 'b']},
+        'count': {'type': 'integer', 'minimum': 0},
+        'at': {'type': 'string', 'format': 'date-time'},
+        'tags': {'type': 'array', 'items': {'type': 'string', 'minLength': 1}, 'uniqueItems': True},
+    },
+}
+
+
+def entry(number: int, **fields) -> dict:
+    return dict({'id': f'e_{number}', 'kind': 'a'}, **fields)
+
+
+def set_old_mtime(path: Path, seconds_ago: int = 60):
+    """Move mtime out of the result cache's racy window"""
+    stamp = time.time() - seconds_ago
+    os.utime(path, (stamp, stamp))
+
+
+class CompiledSchemaTest(unittest.TestCase):
+
+    def setUp(self):
+        self.schema = CompiledSchema(SCHEMA)
+    
+    def test_valid(self):
+        self.assertEqual(self.schema.engine, 'compiled')
+        self.assertEqual(self.schema.violations(entry(1, count=2, at='2026-01-01T00:00:00Z', tags=['x'])), [])
+    
+    def test_violation_paths(self):
+        violations = self.schema.violations({'id': 'bad', 'count': -1, 'at': 'yesterday',
+                                             'tags': ['x', 'x', ''], 'extra': 1})
+        paths = sorted(path for path, _ in violations)
+        self.assertEqual(paths, ['$', '$', '$.at', '$.count', '$.id', '$.tags', '$.tags[2]'])
+    
+    def test_booleans_are_not_integers(self):
+        self.assertEqual([path for path, _ in self.schema.violations(entry(1, count=True))], ['$.count'])
+        self.assertEqual(self.schema.violations(entry(1, count=3.0)), [])
+    
+    def test_unsupported_keyword_without_jsonschema(self):
+        with mock.patch.object(schema_validation, 'jsonschema', None):
+            with self.assertRaises(SchemaError):
+                CompiledSchema({'type': 'object', 'patternProperties': {'^x': {'type': 'string'}}})
+
+
+class StreamingTest(unittest.TestCase):
+
+    def test_array_across_chunk_boundaries(self):
+        elements = [entry(n, count=n * 1000, tags=['t' * n]) for n in range(1, 30)] + [12.5, None, 'x']
+        text = '[\n' + ',\n'.join(json.dumps(e) for e in elements) + '\n]\n'
+        for chunk_size in (1, 3, 7, 64):
+            with self.subTest(chunk_size=chunk_size):
+                streamed = list(iter_json_array(io.StringIO(text), chunk_size=chunk_size))
+                self.assertEqual([element for _, _, element in streamed], elements)
+                self.assertEqual([line for _, line, _ in streamed], list(range(2, len(elements) + 2)))
+    
+    def test_malformed_arrays(self):
+        for text in ('[1, 2', '[1 2]', '[1] x', '{}'):
+            with self.subTest(text=text):
+                with self.assertRaises(ValueError):
+                    list(iter_json_array(io.StringIO(text), chunk_size=2))
+    
+    def test_entries_from_files(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            jsonl = Path(tmp) / 'entries.jsonl'
+            jsonl.write_text(json.dumps(entry(1)) + '\n\n{bad\n', encoding='utf-8')
+            single = Path(tmp) / 'entry.json'
+            single.write_text(json.dumps(entry(2)), encoding='utf-8')
+            array = Path(tmp) / 'entries.json'
+            array.write_text(json.dumps([entry(3), entry(4)]), encoding='utf-8')
+            rows = list(iter_json_entries(str(jsonl)))
+            self.assertEqual([(offset, error is None) for offset, _, error in rows],
+                             [('line 1', True), ('line 3', False)])
+            self.assertEqual([e for _, e, _ in iter_json_entries(str(single))], [entry(2)])
+            self.assertEqual([offset for offset, _, _ in iter_json_entries(str(array))],
+                             ['[0] line 1', '[1] line 1'])
+
+
+class TenantMemoryTest(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+        self.schema = CompiledSchema(SCHEMA)
+        self.cache_file = str(self.root / 'cache.json')
+        self.valid = self.root / 'valid.json'
+        self.valid.write_text(json.dumps([entry(1), entry(2)]), encoding='utf-8')
+        self.mixed = self.root / 'mixed.jsonl'
+        self.mixed.write_text('\n'.join(json.dumps(e) for e in (entry(3), {'id': 'x'}, entry(4))) + '\n',
+                              encoding='utf-8')
+        for path in (self.valid, self.mixed):
+            set_old_mtime(path)
+    
+    def tearDown(self):
+        self._tmp.cleanup()
+    
+    def validate(self, files=None, digest='schema-1'):
+        files = files or [str(self.valid), str(self.mixed)]
+        cache = ResultCache(self.cache_file, digest)
+        results, cached = memory.validate_paths(files, self.schema, 1, cache)
+        cache.save(files)
+        return results, cached
+    
+    def test_results(self):
+        results, cached = self.validate()
+        self.assertEqual(cached, 0)
+        self.assertEqual((results[str(self.valid)]['entries'], results[str(self.valid)]['invalid']), (2, 0))
+        mixed = results[str(self.mixed)]
+        self.assertEqual((mixed['entries'], mixed['invalid'], mixed['violations']), (3, 1, 2))
+        self.assertEqual({v['offset'] for v in mixed['violations_list']}, {'line 2'})
+    
+    def test_cache_hits_and_invalidation(self):
+        first, _ = self.validate()
+        results, cached = self.validate()
+        self.assertEqual((cached, results), (2, first))
+        # An edit (new size) is validated again
+        self.mixed.write_text(json.dumps(entry(5)) + '\n', encoding='utf-8')
+        set_old_mtime(self.mixed)
+        results, cached = self.validate()
+        self.assertEqual(cached, 1)
+        self.assertEqual(results[str(self.mixed)]['invalid'], 0)
+        # A different schema discards every cached result
+        _, cached = self.validate(digest='schema-2')
+        self.assertEqual(cached, 0)
+    
+    def test_racy_files_are_not_served_from_cache(self):
+        os.utime(self.valid)
+        self.validate()
+        _, cached = self.validate()
+        self.assertEqual(cached, 1)
+    
+    def test_split_ranges_match_whole_file(self):
+        lines = [json.dumps(entry(n) if n % 7 else {'id': n}) for n in range(1, 400)]
+        big = self.root / 'big.jsonl'
+        big.write_text('\n'.join(lines) + '\n', encoding='utf-8')
+        whole, _ = memory.validate_paths([str(big)], self.schema, 1, ResultCache(None, ''))
+        with mock.patch.object(memory, 'SPLIT_MIN_BYTES', 512):
+            ranges = memory.split_jsonl(str(big), big.stat().st_size, 8)
+            split, _ = memory.validate_paths([str(big)], self.schema, 2, ResultCache(None, ''))
+        self.assertGreater(len(ranges), 1)
+        self.assertEqual(ranges[0][0], 0)
+        self.assertEqual(ranges[-1][1], big.stat().st_size)
+        self.assertEqual(split, whole)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Tests for validate_scope_to_diff.py: declaration parsing, glob matching and the diff comparison
+
+Run:
+    python -m pytest .github/scripts/tests
+    python .github/scripts/tests/test_scope_to_diff.py
+"""
+
+import io
+import sys
+import unittest
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+sys.path.insert(0, str(REPO_ROOT / '.github' / 'scripts'))
+from validate_scope_to_diff import (  # noqa: E402
+    ChangedFile, ScopeDeclaration, compare, iter_name_status, iter_nul_fields
+)
+
+
+def declare(*lines: str) -> ScopeDeclaration:
+    return ScopeDeclaration.parse('\n'.join(lines))
+
+
+class GlobMatchTest(unittest.TestCase):
+
+    def test_star_stays_within_a_directory(self):
+        declaration = declare('M governance/canon/*.md')
+        self.assertEqual(declaration.glob_matches('governance/canon/A.md'), [0])
+        self.assertEqual(declaration.glob_matches('governance/canon/sub/A.md'), [])
+    
+    def test_double_star_spans_directories(self):
+        declaration = declare('M governance/**/*.md')
+        self.assertEqual(declaration.glob_matches('governance/A.md'), [0])
+        self.assertEqual(declaration.glob_matches('governance/canon/sub/A.md'), [0])
+        self.assertEqual(declaration.glob_matches('other/A.md'), [])
+    
+    def test_overlapping_globs_all_match(self):
+        declaration = declare('M governance/**', 'M governance/canon/*.md')
+        self.assertEqual(declaration.glob_matches('governance/canon/A.md'), [0, 1])
+        self.assertEqual(declaration.glob_matches('governance/runbooks/B.md'), [0])
+
+
+class CompareTest(unittest.TestCase):
+
+    def test_exact_declaration(self):
+        result = compare([ChangedFile('M', 'a.md'), ChangedFile('A', 'b.md')], declare('M a.md', 'A b.md'))
+        self.assertEqual(result, {'undeclared': [], 'over_declared': [], 'status_mismatches': []})
+    
+    def test_undeclared_and_over_declared(self):
+        result = compare([ChangedFile('M', 'a.md')], declare('M b.md', 'M docs/*.md'))
+        self.assertEqual(result['undeclared'], ['a.md'])
+        self.assertEqual(result['over_declared'], ['b.md', 'docs/*.md'])
+    
+    def test_overlapping_globs_are_not_over_declared(self):
+        declaration = declare('M governance/**', 'M governance/canon/*.md')
+        result = compare([ChangedFile('M', 'governance/canon/A.md')], declaration)
+        self.assertEqual(result, {'undeclared': [], 'over_declared': [], 'status_mismatches': []})
+    
+    def test_first_matching_glob_decides_status(self):
+        declaration = declare('A governance/canon/*.md', 'M governance/**')
+        result = compare([ChangedFile('M', 'governance/canon/A.md')], declaration)
+        self.assertEqual(result['status_mismatches'],
+                         [{'path': 'governance/canon/A.md', 'declared': 'A', 'actual': 'M'}])
+    
+    def test_rename_covers_old_path_declarations(self):
+        changed = [ChangedFile('R', 'new/x.md', 'old/x.md')]
+        result = compare(changed, declare('R old/x.md new/x.md'))
+        self.assertEqual(result, {'undeclared': [], 'over_declared': [], 'status_mismatches': []})
+        result = compare(changed, declare('M new/x.md', 'D old/*.md'))
+        self.assertEqual(result['over_declared'], [])
+
+
+class NameStatusTest(unittest.TestCase):
+
+    def test_renames_and_spaces(self):
+        stream = io.BytesIO(b'M\0a.md\0R087\0old name.md\0new name.md\0D\0gone.md\0')
+        entries = [entry.to_dict() for entry in iter_name_status(iter_nul_fields(stream, chunk_size=3))]
+        self.assertEqual(entries, [
+            {'status': 'M', 'path': 'a.md'},
+            {'status': 'R', 'path': 'new name.md', 'old_path': 'old name.md'},
+            {'status': 'D', 'path': 'gone.md'},
+        ])
+    
+    def test_quoted_declarations(self):
+        declaration = declare('M "path with spaces.md"', 'R `old one.md` -> `new one.md`')
+        self.assertEqual(declaration.statuses,
+                         {'path with spaces.md': 'M', 'old one.md': 'R', 'new one.md': 'R'})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,298 @@
+#!/usr/bin/env python3
+"""
+Tests for scripts/sync_repo_inventory.py: hash cache, inventory delta and fleet mode
+
+Run:
+    python -m pytest .github/scripts/tests
+    python .github/scripts/tests/test_sync_repo_inventory.py
+"""
+
+import contextlib
+import io
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+sys.path.insert(0, str(REPO_ROOT / 'scripts'))
+import sync_repo_inventory as sync  # noqa: E402
+
+SCRIPT = REPO_ROOT / 'scripts' / 'sync_repo_inventory.py'
+
+CANON_TEXT = {'A.md': 'alpha\n', 'B.md': 'bravo\n'}
+
+
+def central_inventory(**overrides) -> sync.CentralInventory:
+    canons = [
+        {'type': 'canon', 'filename': name, 'version': '1.0.0', 'layer_down_status': 'PUBLIC_API',
+         'file_hash': sync.hashlib.sha256(text.encode()).hexdigest()[:sync.SHA256_TRUNCATE_LENGTH]}
+        for name, text in CANON_TEXT.items()
+    ]
+    canons.append({'type': 'canon', 'filename': 'C.md', 'version': '1.0.0', 'file_hash': 'x',
+                   'layer_down_status': 'PUBLIC_API'})
+    return sync.CentralInventory.from_dict(dict({'version': '2.0.0', 'canons': canons}, **overrides))
+
+
+def set_old_mtime(path: Path, seconds_ago: int = 60):
+    """Move mtime out of the hash cache's racy window"""
+    stamp = time.time() - seconds_ago
+    os.utime(path, (stamp, stamp))
+
+
+class SyncTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.tmp = Path(self._tmp.name)
+        self.repo = self.tmp / 'repo'
+        self.canon_dir = self.repo / 'governance' / 'canon'
+        self.canon_dir.mkdir(parents=True)
+        for name, text in CANON_TEXT.items():
+            (self.canon_dir / name).write_text(text, encoding='utf-8')
+            set_old_mtime(self.canon_dir / name)
+        # Keep caches out of the governance repository the tests run in
+        patcher = mock.patch.object(sync, 'HASH_CACHE_DIR', self.tmp / 'cache')
+        patcher.start()
+        self.addCleanup(patcher.stop)
+    
+    def tearDown(self):
+        self._tmp.cleanup()
+    
+    def generate(self, **kwargs):
+        with contextlib.redirect_stdout(io.StringIO()):
+            return sync.generate_inventory(repo_root=self.repo, governance_source_path=self.repo,
+                                           repo_name='owner/repo', central_index=central_inventory(),
+                                           jobs=1, **kwargs)
+
+
+class HashCacheTest(SyncTestCase):
+
+    def scan(self, cache_path: Path):
+        cache = sync.HashCache(cache_path)
+        with contextlib.redirect_stdout(io.StringIO()):
+            canons = sync.scan_local_canons(self.repo, jobs=1, hash_cache=cache)
+        return cache, {name: canon['sha256'] for name, canon in canons.items()}
+    
+    def test_unchanged_files_hit(self):
+        cache_path = self.tmp / 'hashes.json'
+        cache, first = self.scan(cache_path)
+        self.assertEqual((cache.hits, cache.misses), (0, 2))
+        cache, second = self.scan(cache_path)
+        self.assertEqual((cache.hits, cache.misses), (2, 0))
+        self.assertEqual(first, second)
+    
+    def test_size_change_rehashes(self):
+        cache_path = self.tmp / 'hashes.json'
+        _, first = self.scan(cache_path)
+        path = self.canon_dir / 'A.md'
+        stat = path.stat()
+        path.write_text('alpha, edited\n', encoding='utf-8')
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        cache, second = self.scan(cache_path)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+        self.assertNotEqual(first['A.md'], second['A.md'])
+        self.assertEqual(second['A.md'], sync.calculate_sha256(path))
+    
+    def test_same_size_mtime_change_rehashes(self):
+        cache_path = self.tmp / 'hashes.json'
+        self.scan(cache_path)
+        path = self.canon_dir / 'A.md'
+        path.write_text('ALPHA\n', encoding='utf-8')
+        set_old_mtime(path, seconds_ago=30)
+        cache, hashes = self.scan(cache_path)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+        self.assertEqual(hashes['A.md'], sync.calculate_sha256(path))
+    
+    def test_racy_entries_are_rehashed(self):
+        path = self.canon_dir / 'A.md'
+        os.utime(path)  # mtime now: inside the racy window of the coming hash
+        cache_path = self.tmp / 'hashes.json'
+        self.scan(cache_path)
+        cache, _ = self.scan(cache_path)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+    
+    def test_deleted_files_are_pruned(self):
+        cache_path = self.tmp / 'hashes.json'
+        self.scan(cache_path)
+        (self.canon_dir / 'B.md').unlink()
+        cache, _ = self.scan(cache_path)
+        self.assertEqual(sorted(json.loads(cache_path.read_text())['files']), ['governance/canon/A.md'])
+    
+    def test_other_format_is_ignored(self):
+        cache_path = self.tmp / 'hashes.json'
+        self.scan(cache_path)
+        data = json.loads(cache_path.read_text())
+        data['truncate_length'] = 8
+        cache_path.write_text(json.dumps(data))
+        cache, _ = self.scan(cache_path)
+        self.assertEqual(cache.hits, 0)
+    
+    def test_default_location_is_outside_the_repository(self):
+        cache_file = sync.default_hash_cache_file(self.repo)
+        self.assertEqual(cache_file.parent, self.tmp / 'cache')
+        self.assertNotEqual(cache_file, sync.default_hash_cache_file(self.tmp))
+
+
+class CanonRecordTest(unittest.TestCase):
+
+    def test_null_fields(self):
+        record = sync.CanonRecord.from_entry(
+            {'type': 'canon', 'filename': 'A.md', 'version': None, 'layer_down_status': None})
+        self.assertIsNone(record.version)
+        self.assertIsNone(record.layer_down_status)
+        self.assertIsNone(sync.CanonRecord.from_entry({'type': 'policy', 'filename': 'P.md'}))
+
+
+class InventoryDeltaTest(SyncTestCase):
+
+    def test_unchanged_inventory(self):
+        inventory = self.generate()
+        previous = dict(inventory, last_sync='2020-01-01')
+        delta = sync.compute_inventory_delta(previous, inventory)
+        self.assertFalse(delta['changed'])
+        self.assertEqual(delta['previous_sync'], '2020-01-01')
+    
+    def test_changes(self):
+        previous = self.generate()
+        (self.canon_dir / 'A.md').write_text('alpha, edited\n', encoding='utf-8')
+        (self.canon_dir / 'C.md').write_text('charlie\n', encoding='utf-8')
+        current = self.generate()
+        delta = sync.compute_inventory_delta(previous, current)
+        self.assertTrue(delta['changed'])
+        self.assertEqual(delta['added'], ['C.md'])
+        self.assertEqual(delta['missing_resolved'], ['C.md'])
+        self.assertEqual(delta['status_changes'], [{'id': 'A.md', 'from': 'UP_TO_DATE', 'to': 'MODIFIED'}])
+        self.assertEqual(delta['coverage']['previous'], 66.67)
+    
+    def test_old_format_previous_inventory(self):
+        # Hand-edited or written before last_sync and per-canon ids existed
+        previous = {'repository': 'owner/repo', 'coverage_percentage': 'n/a',
+                    'layered_down': [{'path': 'governance/canon/A.md'}, {'id': 'B.md', 'status': 'MODIFIED'}],
+                    'missing': None}
+        current = self.generate()
+        delta = sync.compute_inventory_delta(previous, current)
+        self.assertTrue(delta['changed'])
+        self.assertIsNone(delta['previous_sync'])
+        self.assertEqual(delta['added'], ['A.md'])
+        self.assertEqual(delta['status_changes'], [{'id': 'B.md', 'from': 'MODIFIED', 'to': 'UP_TO_DATE'}])
+        self.assertEqual(delta['coverage'], {'previous': None, 'current': current['coverage_percentage'],
+                                             'change': None})
+    
+    def test_save_if_changed_without_previous_last_sync(self):
+        output = self.repo / sync.INVENTORY_FILENAME
+        inventory = self.generate()
+        previous = {k: v for k, v in inventory.items() if k != 'last_sync'}
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.assertTrue(sync.save_inventory_if_changed(inventory, output, previous))
+            self.assertFalse(sync.save_inventory_if_changed(inventory, output,
+                                                            sync.load_previous_inventory(output)))
+        self.assertEqual(json.loads(output.read_text())['last_sync'], inventory['last_sync'])
+
+
+class FleetSyncTest(SyncTestCase):
+
+    def sync_repo(self, delta: bool = True):
+        with contextlib.redirect_stdout(io.StringIO()):
+            return sync.sync_fleet_repo(self.repo, central_inventory(), jobs=1, use_cache=True,
+                                        git_metadata=False, blob_hashes={}, delta=delta)
+    
+    def test_delta_rewrites_only_on_change(self):
+        output = self.repo / sync.INVENTORY_FILENAME
+        inventory, delta = self.sync_repo()
+        self.assertTrue(delta['changed'])
+        written = json.loads(output.read_text())
+        self.assertEqual(written, inventory)
+        
+        previous = dict(written, last_sync='2020-01-01')
+        output.write_text(json.dumps(previous), encoding='utf-8')
+        inventory, delta = self.sync_repo()
+        self.assertFalse(delta['changed'])
+        self.assertEqual(inventory['last_sync'], '2020-01-01')
+        self.assertEqual(json.loads(output.read_text()), previous)
+    
+    def test_previous_inventory_without_last_sync(self):
+        output = self.repo / sync.INVENTORY_FILENAME
+        inventory, _ = self.sync_repo(delta=False)
+        del inventory['last_sync']
+        output.write_text(json.dumps(inventory), encoding='utf-8')
+        inventory, delta = self.sync_repo()
+        self.assertTrue(delta['changed'])
+        self.assertIn('last_sync', json.loads(output.read_text()))
+    
+    def test_caches_stay_out_of_the_repository(self):
+        self.sync_repo()
+        self.assertFalse((self.repo / '.cache').exists())
+        self.assertTrue(sync.default_hash_cache_file(self.repo).exists())
+    
+    def test_fleet_report(self):
+        inventory, delta = self.sync_repo()
+        report = sync.build_fleet_report(central_inventory(), [
+            {'repo_root': self.repo, 'inventory': inventory, 'delta': delta},
+            {'repo_root': self.tmp / 'gone', 'error': 'Repository root not found'},
+        ])
+        self.assertEqual((report['repositories_synced'], report['repositories_failed']), (1, 1))
+        self.assertEqual(report['missing_by_canon'], {'C.md': [str(self.repo)]})
+        self.assertTrue(report['repositories'][0]['changed'])
+
+
+
+class FleetCommandLineTest(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.tmp = Path(self._tmp.name)
+        source = self.tmp / 'governance-source'
+        (source / 'governance').mkdir(parents=True)
+        canons = [
+            {'type': 'canon', 'filename': name, 'path': f'governance/canon/{name}', 'version': '1.0.0',
+             'layer_down_status': 'PUBLIC_API',
+             'file_hash': sync.hashlib.sha256(text.encode()).hexdigest()[:sync.SHA256_TRUNCATE_LENGTH]}
+            for name, text in CANON_TEXT.items()
+        ]
+        (source / 'governance' / 'CANON_INVENTORY.json').write_text(
+            json.dumps({'version': '2.0.0', 'canons': canons}), encoding='utf-8')
+        self.source = source
+        for repo, names in (('repo-a', CANON_TEXT), ('repo-b', {'A.md': CANON_TEXT['A.md']})):
+            canon_dir = self.tmp / 'fleet' / repo / 'governance' / 'canon'
+            canon_dir.mkdir(parents=True)
+            for name in names:
+                (canon_dir / name).write_text(CANON_TEXT[name], encoding='utf-8')
+    
+    def tearDown(self):
+        self._tmp.cleanup()
+    
+    def run_fleet(self, *roots: str):
+        return subprocess.run(
+            [sys.executable, str(SCRIPT), '--governance-source', str(self.source), '--no-cache',
+             '--fleet', *roots, '--fleet-report', 'fleet.json', '--delta-output', 'delta.json'],
+            cwd=self.tmp, universal_newlines=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    
+    def test_fleet_run(self):
+        proc = self.run_fleet(str(self.tmp / 'fleet' / 'repo-*'))
+        self.assertEqual(proc.returncode, 0, proc.stdout + proc.stderr)
+        report = json.loads((self.tmp / 'fleet.json').read_text())
+        self.assertEqual((report['repositories_synced'], report['repositories_failed']), (2, 0))
+        self.assertEqual(report['missing_by_canon'], {'B.md': [str(self.tmp / 'fleet' / 'repo-b')]})
+        for repo in ('repo-a', 'repo-b'):
+            self.assertTrue((self.tmp / 'fleet' / repo / sync.INVENTORY_FILENAME).exists())
+        self.assertEqual(json.loads((self.tmp / 'delta.json').read_text())['repositories_changed'], 2)
+        
+        # A second run over unchanged repositories lists no deltas
+        proc = self.run_fleet(str(self.tmp / 'fleet' / 'repo-*'))
+        self.assertEqual(json.loads((self.tmp / 'delta.json').read_text())['repositories_changed'], 0)
+    
+    def test_missing_repository_fails(self):
+        proc = self.run_fleet(str(self.tmp / 'fleet' / 'repo-a'), str(self.tmp / 'fleet' / 'gone'))
+        self.assertEqual(proc.returncode, 1)
+        report = json.loads((self.tmp / 'fleet.json').read_text())
+        self.assertEqual((report['repositories_synced'], report['repositories_failed']), (1, 1))
+
+
+if __name__ == '__main__':
+    unittest.main()
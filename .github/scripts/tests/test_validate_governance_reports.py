@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Tests for scripts/validate_governance_reports.py and fleet report validation
+
+Run:
+    python -m pytest .github/scripts/tests
+    python .github/scripts/tests/test_validate_governance_reports.py
+"""
+
+import contextlib
+import io
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+sys.path.insert(0, str(REPO_ROOT / 'scripts'))
+import sync_repo_inventory as sync  # noqa: E402
+import validate_governance_reports as reports  # noqa: E402
+from schema_validation import ResultCache  # noqa: E402
+
+SCRIPT = REPO_ROOT / 'scripts' / 'validate_governance_reports.py'
+
+SCHEMAS = {
+    'BUILD_QA_REPORT.schema.json': {
+        'type': 'object', 'required': ['builder_id', 'build_status'],
+        'properties': {'builder_id': {'type': 'string'}, 'build_status': {'enum': ['PASS', 'FAIL']}},
+    },
+    'GOVERNANCE_COMPLIANCE_REPORT.schema.json': {
+        'type': 'object', 'required': ['compliance_status'],
+        'properties': {'compliance_status': {'enum': ['COMPLIANT', 'NON_COMPLIANT']}},
+    },
+}
+
+
+class ReportsTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+        self.source = self.root / 'governance-source'
+        schemas_dir = self.source / reports.SCHEMAS_DIR
+        schemas_dir.mkdir(parents=True)
+        for name, schema in SCHEMAS.items():
+            (schemas_dir / name).write_text(json.dumps(schema), encoding='utf-8')
+    
+    def tearDown(self):
+        self._tmp.cleanup()
+    
+    def write_reports(self, repo: Path, qa: list, compliance: list = ()) -> Path:
+        qa_dir = repo / '.qa' / 'builder'
+        qa_dir.mkdir(parents=True, exist_ok=True)
+        (qa_dir / 'BUILD_QA_REPORT.json').write_text(json.dumps(qa), encoding='utf-8')
+        if compliance:
+            (qa_dir / 'GOVERNANCE_COMPLIANCE_REPORT-2026.jsonl').write_text(
+                ''.join(json.dumps(report) + '\n' for report in compliance), encoding='utf-8')
+        return repo
+
+
+class ValidateReportsTest(ReportsTestCase):
+
+    def test_report_kind(self):
+        self.assertEqual(reports.report_kind('BUILD_QA_REPORT.json'), 'BUILD_QA_REPORT')
+        self.assertEqual(reports.report_kind('GOVERNANCE_COMPLIANCE_REPORT-2026.jsonl'),
+                         'GOVERNANCE_COMPLIANCE_REPORT')
+        self.assertIsNone(reports.report_kind('BUILD_QA_REPORT.schema.json'))
+        self.assertIsNone(reports.report_kind('BUILD_QA_REPORT.md'))
+        self.assertIsNone(reports.report_kind('OTHER.json'))
+    
+    def test_validate_and_summarize(self):
+        repo = self.write_reports(self.root / 'repo',
+                                  [{'builder_id': 'b', 'build_status': 'PASS'},
+                                   {'builder_id': 'b', 'build_status': 'FAIL'},
+                                   {'build_status': 'UNKNOWN'}],
+                                  [{'compliance_status': 'COMPLIANT'}])
+        schemas, digest = reports.load_report_schemas(self.source)
+        files = list(reports.iter_report_files([str(repo / '.qa')]))
+        self.assertEqual([kind for _, kind in files], ['BUILD_QA_REPORT', 'GOVERNANCE_COMPLIANCE_REPORT'])
+        results, cached = reports.validate_reports(files, schemas, 1, ResultCache(None, digest))
+        summary = reports.summarize(results)
+        self.assertEqual((summary['files'], summary['reports'], summary['invalid_reports']), (2, 4, 1))
+        self.assertEqual(summary['by_kind']['BUILD_QA_REPORT']['statuses'], {'FAIL': 1, 'PASS': 1})
+        self.assertEqual(summary['by_kind']['GOVERNANCE_COMPLIANCE_REPORT']['statuses'], {'COMPLIANT': 1})
+        qa_result = results[files[0][0]]
+        self.assertEqual(sorted(v['path'] for v in qa_result['violations_list']), ['$', '$.build_status'])
+        self.assertTrue(all(v['offset'].startswith('[2] ') for v in qa_result['violations_list']))
+    
+    def test_schema_edit_invalidates_cache(self):
+        repo = self.write_reports(self.root / 'repo', [{'builder_id': 'b', 'build_status': 'PASS'}])
+        files = list(reports.iter_report_files([str(repo / '.qa')]))
+        os.utime(files[0][0], (0, 0))
+        cache_file = str(self.root / 'cache.json')
+        
+        def run():
+            schemas, digest = reports.load_report_schemas(self.source)
+            cache = ResultCache(cache_file, digest)
+            _, cached = reports.validate_reports(files, schemas, 1, cache)
+            cache.save([path for path, _ in files])
+            return cached
+        
+        self.assertEqual((run(), run()), (0, 1))
+        schema_file = self.source / reports.SCHEMAS_DIR / 'GOVERNANCE_COMPLIANCE_REPORT.schema.json'
+        schema_file.write_text(json.dumps({'type': 'object'}), encoding='utf-8')
+        self.assertEqual(run(), 0)
+    
+    def test_repository_schemas_compile(self):
+        schemas, _ = reports.load_report_schemas(REPO_ROOT)
+        self.assertEqual({kind: schema.engine for kind, schema in schemas.items()},
+                         {kind: 'compiled' for kind in reports.REPORT_KINDS})
+
+
+class CommandLineTest(ReportsTestCase):
+
+    def run_script(self, *args: str):
+        return subprocess.run([sys.executable, str(SCRIPT), '--governance-source', str(self.source),
+                               '--no-cache', *args], cwd=self.root, universal_newlines=True,
+                              stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    
+    def test_exit_codes(self):
+        repo = self.write_reports(self.root / 'repo', [{'builder_id': 'b', 'build_status': 'PASS'}])
+        self.assertEqual(self.run_script(str(repo)).returncode, 0)
+        self.write_reports(repo, [{'build_status': 'PASS'}])
+        self.assertEqual(self.run_script(str(repo)).returncode, 1)
+        (self.source / reports.SCHEMAS_DIR / 'BUILD_QA_REPORT.schema.json').unlink()
+        self.assertEqual(self.run_script(str(repo)).returncode, 2)
+    
+    def test_json_to_stdout_is_pure_json(self):
+        repo = self.write_reports(self.root / 'repo', [{'builder_id': 'b', 'build_status': 'FAIL'}])
+        proc = self.run_script(str(repo), '--json', '-')
+        self.assertEqual(proc.returncode, 0, proc.stderr)
+        report = json.loads(proc.stdout)
+        self.assertEqual(report['summary']['by_kind']['BUILD_QA_REPORT']['statuses'], {'FAIL': 1})
+        self.assertIn('PASS', proc.stderr)
+
+
+class FleetReportsTest(ReportsTestCase):
+
+    def test_per_repository_summaries(self):
+        good = self.write_reports(self.root / 'good', [{'builder_id': 'b', 'build_status': 'PASS'}])
+        bad = self.write_reports(self.root / 'bad', [{'builder_id': 'b', 'build_status': 'PASS'}, {}],
+                                 [{'compliance_status': 'NON_COMPLIANT'}])
+        empty = self.root / 'empty'
+        empty.mkdir()
+        with contextlib.redirect_stdout(io.StringIO()):
+            validation = sync.validate_fleet_reports([good, bad, empty], self.source, 1, use_cache=False)
+        self.assertEqual((validation['summary']['reports'], validation['summary']['invalid_reports']), (4, 1))
+        repositories = validation['repositories']
+        self.assertEqual(repositories[good]['invalid_files'], [])
+        self.assertEqual([f['invalid_reports'] for f in repositories[bad]['invalid_files']], [1])
+        self.assertEqual(repositories[empty]['files'], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+Tests for check_locked_sections.py --watch and the file watchers in file_watch.py
+
+watch_contracts re-parses only the contracts a watcher reports, re-runs the
+checks over the in-memory state and prints the findings each change adds or
+resolves. The loop is driven here by a scripted watcher; the real inotify and
+polling watchers are tested on their own.
+
+Run:
+    python -m pytest .github/scripts/tests
+    python .github/scripts/tests/test_watch_mode.py
+"""
+
+import contextlib
+import io
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+sys.path.insert(0, str(REPO_ROOT / '.github' / 'scripts'))
+import file_watch  # noqa: E402
+from check_locked_sections import LockedSectionValidator, watch_contracts  # noqa: E402
+
+
+def contract(*lock_ids: str) -> str:
+    sections = [f"<!-- LOCKED SECTION START -->\n<!-- Lock ID: {lock_id} -->\n"
+                f"<!-- Lock Reason: Test -->\n<!-- Lock Authority: CS2 -->\n"
+                f"<!-- Lock Date: 2026-01-01 -->\n<!-- Review Frequency: quarterly -->\n"
+                f"<!-- END METADATA -->\nProtected text.\n<!-- LOCKED SECTION END -->\n"
+                for lock_id in lock_ids]
+    return "# Agent\n\n" + "\n".join(sections)
+
+
+class ScriptedWatcher:
+    """Watcher whose wait() applies the next scripted edit and reports what it touched"""
+    
+    def __init__(self, steps):
+        self.steps = list(steps)
+        self.closed = False
+    
+    def wait(self, timeout=None):
+        if not self.steps:
+            raise KeyboardInterrupt
+        return self.steps.pop(0)()
+    
+    def close(self):
+        self.closed = True
+
+
+class WatchContractsTest(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.agents = Path(self._tmp.name) / 'agents'
+        self.agents.mkdir()
+        self.one = self.agents / 'one.md'
+        self.two = self.agents / 'two.md'
+        self.one.write_text(contract('LOCK-ONE-001'), encoding='utf-8')
+        self.two.write_text(contract('LOCK-TWO-001'), encoding='utf-8')
+    
+    def tearDown(self):
+        self._tmp.cleanup()
+    
+    def write(self, path: Path, text: str):
+        def step():
+            path.write_text(text, encoding='utf-8')
+            return {path}
+        return step
+    
+    def scanned(self) -> LockedSectionValidator:
+        validator = LockedSectionValidator(str(self.agents), jobs=1)
+        validator.scan_contracts()
+        return validator
+    
+    def watch(self, *steps, validator: LockedSectionValidator = None):
+        validator = validator or self.scanned()
+        watcher = ScriptedWatcher(steps)
+        output = io.StringIO()
+        with mock.patch.object(file_watch, 'create_watcher', return_value=(watcher, 'scripted')), \
+                contextlib.redirect_stdout(output):
+            success = watch_contracts(validator, 'validate-metadata', 'registry.md')
+        self.assertTrue(watcher.closed)
+        return success, validator, output.getvalue()
+    
+    def test_finding_added_and_resolved(self):
+        duplicate = "Duplicate Lock ID 'LOCK-ONE-001'"
+        success, validator, output = self.watch(
+            self.write(self.two, contract('LOCK-ONE-001')),
+            self.write(self.two, contract('LOCK-TWO-002')),
+        )
+        self.assertTrue(success)
+        added = [line for line in output.splitlines() if line.startswith('  + ')]
+        resolved = [line for line in output.splitlines() if line.endswith('(resolved)')]
+        self.assertEqual(len(added), 1)
+        self.assertIn(duplicate, added[0])
+        # The finding spans several lines; its last line carries the "(resolved)" mark
+        self.assertEqual(len(resolved), 1)
+        self.assertIn(str(self.two), resolved[0])
+        self.assertEqual(validator.errors, [])
+        self.assertEqual(sorted(s.lock_id for s in validator.locked_sections), ['LOCK-ONE-001', 'LOCK-TWO-002'])
+    
+    def test_only_changed_contracts_are_reparsed(self):
+        validator = self.scanned()
+        with mock.patch('check_locked_sections.load_contract',
+                        wraps=sys.modules['check_locked_sections'].load_contract) as load:
+            self.watch(self.write(self.two, contract('LOCK-TWO-002')), validator=validator)
+        self.assertEqual([call.args[0][0] for call in load.call_args_list], [self.two])
+    
+    def test_deleted_and_new_contracts(self):
+        def delete_one():
+            self.one.unlink()
+            return {self.one}
+        three = self.agents / 'sub' / 'three.md'
+        
+        def add_three():
+            three.parent.mkdir()
+            three.write_text(contract('LOCK-THREE-001'), encoding='utf-8')
+            return {three.parent, three}
+        
+        _, validator, _ = self.watch(delete_one, add_three, lambda: {self.agents / 'notes.txt'})
+        self.assertEqual(sorted(s.lock_id for s in validator.locked_sections), ['LOCK-THREE-001', 'LOCK-TWO-001'])
+    
+    def test_lost_events_rescan_everything(self):
+        def overflow():
+            self.one.write_text(contract('LOCK-ONE-002'), encoding='utf-8')
+            return None
+        _, validator, output = self.watch(overflow)
+        self.assertEqual(sorted(s.lock_id for s in validator.locked_sections), ['LOCK-ONE-002', 'LOCK-TWO-001'])
+        self.assertIn('2 files changed', output)
+    
+    def test_failing_last_run(self):
+        success, _, _ = self.watch(self.write(self.two, contract('LOCK-ONE-001')))
+        self.assertFalse(success)
+
+
+class FileWatcherTest(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name) / 'watched'
+        (self.root / 'sub').mkdir(parents=True)
+        self.existing = self.root / 'sub' / 'a.md'
+        self.existing.write_text('a\n', encoding='utf-8')
+        self.single = Path(self._tmp.name) / 'registry.md'
+        self.single.write_text('r\n', encoding='utf-8')
+    
+    def tearDown(self):
+        self._tmp.cleanup()
+    
+    def assert_reported(self, watcher, path: Path):
+        """Wait up to 5 s for watcher to report path (a new directory may come first)"""
+        deadline = time.monotonic() + 5
+        while time.monotonic() < deadline:
+            changed = watcher.wait(timeout=max(0.0, deadline - time.monotonic()))
+            self.assertIsNotNone(changed, "events were lost")
+            if path in changed:
+                return
+        self.fail(f"{path} not reported")
+    
+    def check_watcher(self, watcher):
+        try:
+            self.assertEqual(watcher.wait(timeout=0.05), set())
+            self.existing.write_text('changed\n', encoding='utf-8')
+            self.assert_reported(watcher, self.existing)
+            new_dir = self.root / 'new'
+            new_dir.mkdir()
+            new_file = new_dir / 'b.md'
+            new_file.write_text('b\n', encoding='utf-8')
+            self.assert_reported(watcher, new_file)
+            self.single.write_text('registry changed\n', encoding='utf-8')
+            self.assert_reported(watcher, self.single)
+            self.existing.unlink()
+            self.assert_reported(watcher, self.existing)
+        finally:
+            watcher.close()
+    
+    def test_polling_watcher(self):
+        # Every edit also changes the size, so coarse filesystem timestamps do not hide it
+        self.check_watcher(file_watch.PollingWatcher([self.root], [self.single], interval=0.01))
+    
+    def test_inotify_watcher(self):
+        try:
+            watcher = file_watch.InotifyWatcher([self.root], [self.single])
+        except (OSError, TypeError) as e:
+            self.skipTest(f"inotify unavailable: {e}")
+        self.check_watcher(watcher)
+    
+    def test_create_watcher_polling(self):
+        watcher, mechanism = file_watch.create_watcher([self.root], polling=True, interval=0.5)
+        self.assertIsInstance(watcher, file_watch.PollingWatcher)
+        self.assertEqual(mechanism, 'polling every 0.5s')
+
+
+if __name__ == '__main__':
+    unittest.main()
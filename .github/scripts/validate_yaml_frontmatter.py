@@ -0,0 +1,285 @@
+#!/usr/bin/env python3
+"""
+YAML Frontmatter Validation Script
+
+Purpose: Extract and validate YAML frontmatter from markdown files with yamllint,
+         in one process for any number of files
+Authority: BL-028 (Yamllint Warnings Are Errors - Zero Test Debt)
+Version: 1.0.0
+
+Exit Codes:
+  0 = PASS (all YAML frontmatter valid, no warnings, no errors)
+  1 = FAIL (yamllint errors or warnings found)
+  2 = FAIL (invalid usage or yamllint not installed)
+"""
+
+import argparse
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+try:
+    from yamllint import linter
+    from yamllint.cli import find_project_config_filepath
+    from yamllint.config import YamlLintConfig, YamlLintConfigError
+except ImportError:
+    linter = None
+
+
+# Below this many files, worker startup costs more than linting in-process
+PARALLEL_MIN_FILES = 16
+
+# Per-worker yamllint configuration, built once by _init_worker
+_config = None
+
+
+def extract_frontmatter(text: str) -> Optional[str]:
+    """
+    Extract YAML frontmatter exactly as the original shell pipeline did.
+    
+    Equivalent to `awk '/^---$/{if(++n==2) exit} n>=1'` captured with `$(...)`
+    and written back with `echo`: everything from the first `---` line up to
+    (not including) the second, trailing newlines collapsed to one. Lines are
+    split on `\\n` only, so a `---\\r` line is not a marker, as in awk.
+    
+    Returns:
+        The frontmatter document, or None if the file has no `---` line
+    """
+    markers = 0
+    lines = []
+    for line in text.split("\n"):
+        if line == "---":
+            markers += 1
+            if markers == 2:
+                break
+        if markers >= 1:
+            lines.append(line)
+    content = "\n".join(lines).rstrip("\n")
+    return content + "\n" if content else None
+
+
+def load_yamllint_config(config_file: Optional[str] = None) -> 'YamlLintConfig':
+    """
+    Load yamllint configuration the way the yamllint CLI does.
+    
+    An explicit file wins, then .yamllint / .yamllint.yaml / .yamllint.yml in
+    the current directory or any parent, then the user's global config, then
+    yamllint's default rules.
+    """
+    if config_file:
+        return YamlLintConfig(file=config_file)
+    
+    project_config = find_project_config_filepath()
+    if project_config:
+        return YamlLintConfig(file=project_config)
+    
+    if 'YAMLLINT_CONFIG_FILE' in os.environ:
+        user_global_config = os.path.expanduser(os.environ['YAMLLINT_CONFIG_FILE'])
+    elif 'XDG_CONFIG_HOME' in os.environ:
+        user_global_config = os.path.join(os.environ['XDG_CONFIG_HOME'], 'yamllint', 'config')
+    else:
+        user_global_config = os.path.expanduser('~/.config/yamllint/config')
+    if os.path.isfile(user_global_config):
+        return YamlLintConfig(file=user_global_config)
+    
+    return YamlLintConfig('extends: default')
+
+
+def _init_worker(config: 'YamlLintConfig'):
+    """Install the parent's yamllint configuration in a worker process."""
+    global _config
+    _config = config
+
+
+def validate_file(file_path: str, indexed: bool = False,
+                  frontmatter: Optional[str] = None) -> Tuple[str, str, List[str]]:
+    """
+    Extract and lint one file's frontmatter.
+    
+    With indexed=True, frontmatter is the file's frontmatter as already
+    recorded by the governance index and the file is not read.
+    
+    Returns:
+        Tuple of (file_path, status, problems) where status is one of
+        'pass', 'fail', 'missing' or 'no-frontmatter'
+    """
+    if not indexed:
+        if not os.path.isfile(file_path):
+            return file_path, 'missing', []
+        
+        # newline='' keeps '\r' on lines, matching awk's view of the file
+        with open(file_path, 'r', encoding='utf-8', errors='replace', newline='') as f:
+            frontmatter = extract_frontmatter(f.read())
+    if frontmatter is None:
+        return file_path, 'no-frontmatter', []
+    
+    # BL-028: every problem counts, whatever its yamllint level
+    problems = [
+        f"{problem.line}:{problem.column}  {problem.level}  {problem.desc}"
+        + (f"  ({problem.rule})" if problem.rule else "")
+        for problem in linter.run(frontmatter, _config)
+    ]
+    return file_path, 'fail' if problems else 'pass', problems
+
+
+def validate_files(file_paths: List[str], config: 'YamlLintConfig', jobs: Optional[int] = None,
+                   manifest=None) -> List[Tuple[str, str, List[str]]]:
+    """
+    Validate many files, in worker processes when there are enough of them; keeps input order.
+    
+    manifest is an optional governance_index.GovernanceIndex; files with a
+    fresh entry take their frontmatter from it instead of being read.
+    """
+    indexed = [False] * len(file_paths)
+    frontmatters = [None] * len(file_paths)
+    if manifest is not None:
+        for position, file_path in enumerate(file_paths):
+            entry = manifest.lookup(file_path)
+            if entry is not None:
+                indexed[position] = True
+                frontmatters[position] = entry['frontmatter']
+    
+    if jobs == 1 or len(file_paths) < PARALLEL_MIN_FILES:
+        _init_worker(config)
+        return list(map(validate_file, file_paths, indexed, frontmatters))
+    
+    with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker, initargs=(config,)) as pool:
+        return list(pool.map(validate_file, file_paths, indexed, frontmatters, chunksize=8))
+
+
+def print_results(results: List[Tuple[str, str, List[str]]]) -> Dict[str, int]:
+    """Print per-file results in the original script's format and return the counts."""
+    counts = {'total': 0, 'failed': 0, 'skipped': 0}
+    for file_path, status, problems in results:
+        if status == 'missing':
+            print(f"⚠️  SKIP: File not found: {file_path}")
+            counts['skipped'] += 1
+            continue
+        
+        print(f"Validating: {file_path}")
+        if status == 'no-frontmatter':
+            print("  ⚠️  No YAML frontmatter found (no --- markers)")
+            counts['skipped'] += 1
+            print()
+            continue
+        
+        counts['total'] += 1
+        if status == 'pass':
+            print("  ✅ PASS")
+        else:
+            print("  ❌ FAIL")
+            print()
+            print("  yamllint errors/warnings:")
+            for problem in problems:
+                print(f"    {problem}")
+            print()
+            print("  BL-028: Warnings ARE errors. All violations must be fixed.")
+            print(f"  Fix the YAML frontmatter in {file_path} and re-run.")
+            print()
+            counts['failed'] += 1
+        print()
+    return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Validate YAML frontmatter in markdown files with yamllint (BL-028)'
+    )
+    parser.add_argument(
+        'files',
+        nargs='*',
+        help='Markdown files to validate (e.g. .github/agents/*.md)'
+    )
+    parser.add_argument(
+        '--config-file',
+        help='yamllint configuration file (default: discovered like the yamllint CLI)'
+    )
+    parser.add_argument(
+        '--jobs',
+        type=int,
+        help='Worker processes (default: CPU count, 1 = serial)'
+    )
+    parser.add_argument(
+        '--manifest',
+        help='Governance index manifest (governance_index.py) to take frontmatter from'
+    )
+    
+    args = parser.parse_args()
+    
+    if linter is None:
+        print("❌ FAIL: yamllint not installed")
+        print()
+        print("Install with: pip install yamllint")
+        print()
+        print("In agent environments where this script cannot run:")
+        print("  - Extract YAML frontmatter manually using awk")
+        print("  - Validate with yamllint or equivalent")
+        print("  - Document results in PREHANDOVER_PROOF with exit code 0")
+        print("  - Include attestation that all warnings/errors fixed")
+        print()
+        sys.exit(2)
+    
+    if not args.files:
+        print("❌ FAIL: No files specified")
+        print()
+        print(f"Usage: {sys.argv[0]} <file1.md> [file2.md] [...]")
+        print(f"Example: {sys.argv[0]} .github/agents/*.md")
+        print()
+        sys.exit(2)
+    
+    try:
+        config = load_yamllint_config(args.config_file)
+    except YamlLintConfigError as e:
+        print(f"❌ FAIL: Invalid yamllint configuration: {e}")
+        sys.exit(2)
+    
+    print("===================================")
+    print("YAML Frontmatter Validation (BL-028)")
+    print("===================================")
+    print()
+    
+    manifest = None
+    if args.manifest:
+        from governance_index import GovernanceIndex
+        manifest = GovernanceIndex.load(args.manifest)
+        if manifest is None:
+            print(f"⚠️  Governance index {args.manifest} is missing or outdated; reading files directly")
+            print()
+    
+    counts = print_results(validate_files(args.files, config, args.jobs, manifest))
+    
+    print("===================================")
+    print("Summary")
+    print("===================================")
+    print(f"Files validated: {counts['total']}")
+    print(f"Files skipped: {counts['skipped']}")
+    print(f"Files failed: {counts['failed']}")
+    print()
+    
+    if counts['failed']:
+        print("❌ VALIDATION FAILED: Exit code 1")
+        print()
+        print("BL-028 requires:")
+        print("  1. Fix ALL yamllint warnings/errors")
+        print("  2. Re-run this script")
+        print("  3. Achieve exit code 0")
+        print("  4. Document in PREHANDOVER_PROOF")
+        print()
+        print("NO rationalization permitted (\"warnings are stylistic\" is FALSE)")
+        print()
+        sys.exit(1)
+    
+    if counts['total'] == 0:
+        print("⚠️  No files with YAML frontmatter found")
+        sys.exit(0)
+    
+    print("✅ ALL PASS: Exit code 0")
+    print()
+    print("BL-028 Compliant: No warnings, no errors.")
+    print()
+    sys.exit(0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,336 @@
+#!/usr/bin/env python3
+"""
+Canon Inventory Generator
+
+This script regenerates governance/CANON_INVENTORY.json by:
+1. Listing every canon (governance/canon/*.md) and policy (governance/policy/*.md)
+2. Hashing each file, skipping files unchanged since the last run via the hash cache
+3. Reusing the existing inventory entry for every file whose hash is unchanged
+4. Extracting version, effective date and description from the header or
+   frontmatter of new and changed files, in parallel
+5. Writing the inventory with stable ordering, only if its content changed
+
+Layer-down status is taken from the existing inventory entry, then from the
+GOVERNANCE_CANON_MANIFEST.md tables, then defaults to PUBLIC_API.
+
+Usage:
+    python generate_canon_inventory.py [--repo-root PATH] [--output PATH]
+                                       [--check] [--jobs N] [--no-cache]
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from sync_repo_inventory import HashCache, hash_files
+
+# Constants
+SOURCE_DIRS = (
+    ("governance/canon", "canon"),
+    ("governance/policy", "policy"),
+)
+INVENTORY_PATH = "governance/CANON_INVENTORY.json"
+MANIFEST_PATH = "governance/canon/GOVERNANCE_CANON_MANIFEST.md"
+HASH_CACHE_FILENAME = ".cache/generate_canon_inventory.json"  # Relative to the repo root
+DEFAULT_VERSION = "1.0.0"
+DEFAULT_LAYER_DOWN_STATUS = "PUBLIC_API"
+DESCRIPTION_MAX_LENGTH = 200
+HEADER_SCAN_CHARS = 4000  # Version and date lines live in the document header
+PARALLEL_MIN_FILES = 16  # Below this, worker startup costs more than it saves
+
+FRONTMATTER_FIELD_PATTERN = re.compile(
+    r'^(version|effective_date|description):[ \t]*(.+?)[ \t]*$',
+    re.MULTILINE
+)
+VERSION_PATTERN = re.compile(
+    r'^[ \t]*(?:[-*][ \t]*)?\**Version\**[ \t]*:\**[ \t]*v?([0-9][0-9A-Za-z.\-]*)',
+    re.IGNORECASE | re.MULTILINE
+)
+DATE_PATTERN = re.compile(
+    r'^[ \t]*(?:[-*][ \t]*)?\**(?:Effective Date|Date)\**[ \t]*:\**[ \t]*(\d{4}-\d{2}-\d{2})',
+    re.IGNORECASE | re.MULTILINE
+)
+PURPOSE_HEADING_PATTERN = re.compile(r'^#{2,}[ \t]+(?:\d+\.[ \t]*)?Purpose\b', re.IGNORECASE)
+MANIFEST_ROW_PATTERN = re.compile(
+    r'^\|\s*`([^`]+)`\s*\|\s*([^|]*?)\s*\|\s*(PUBLIC_API|OPTIONAL|INTERNAL)\s*\|'
+)
+
+
+def split_frontmatter(text: str) -> Tuple[Dict[str, str], str]:
+    """Split leading `---` YAML frontmatter into simple top-level scalars and the body."""
+    if not text.startswith("---\n"):
+        return {}, text
+    end = text.find("\n---", 3)
+    if end == -1:
+        return {}, text
+    fields = {
+        key: value.strip('"\'')
+        for key, value in FRONTMATTER_FIELD_PATTERN.findall(text[4:end])
+    }
+    return fields, text[end + 4:]
+
+
+def extract_description(body: str) -> Optional[str]:
+    """Return the first paragraph of the Purpose section, truncated for the inventory."""
+    lines = body.split("\n")
+    for index, line in enumerate(lines):
+        if not PURPOSE_HEADING_PATTERN.match(line):
+            continue
+        paragraph = []
+        for candidate in lines[index + 1:]:
+            if candidate.startswith("#"):
+                break
+            if not candidate.strip():
+                if paragraph:
+                    break
+                continue
+            paragraph.append(candidate)
+        if paragraph:
+            description = "\n".join(paragraph).replace("**", "")
+            if len(description) > DESCRIPTION_MAX_LENGTH:
+                description = description[:DESCRIPTION_MAX_LENGTH - 3] + "..."
+            return description
+    return None
+
+
+def extract_canon_metadata(file_path: Path) -> Dict[str, Optional[str]]:
+    """
+    Extract version, effective date and description from one canon file.
+    
+    Frontmatter fields win over header lines. Fields that cannot be found
+    are returned as None so the caller can apply its fallbacks.
+    """
+    text = file_path.read_text(encoding="utf-8")
+    fields, body = split_frontmatter(text)
+    header = body[:HEADER_SCAN_CHARS]
+    
+    version = fields.get("version")
+    if version is None:
+        match = VERSION_PATTERN.search(header)
+        version = match.group(1) if match else None
+    
+    effective_date = fields.get("effective_date")
+    if effective_date is None:
+        match = DATE_PATTERN.search(header)
+        effective_date = match.group(1) if match else None
+    
+    return {
+        "version": version.lstrip("v") if version else None,
+        "effective_date": effective_date,
+        "description": fields.get("description") or extract_description(body)
+    }
+
+
+def extract_all(file_paths: List[Path], jobs: Optional[int] = None) -> Dict[Path, Dict]:
+    """Extract metadata from many files, in worker processes when there are enough of them."""
+    if jobs == 1 or len(file_paths) < PARALLEL_MIN_FILES:
+        return {path: extract_canon_metadata(path) for path in file_paths}
+    
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        return dict(zip(file_paths, pool.map(extract_canon_metadata, file_paths, chunksize=8)))
+
+
+def load_manifest_statuses(repo_root: Path) -> Dict[str, Dict[str, str]]:
+    """Read filename -> {version, layer_down_status} from the canon manifest tables."""
+    manifest_path = repo_root / MANIFEST_PATH
+    statuses = {}
+    if not manifest_path.exists():
+        return statuses
+    
+    with open(manifest_path, 'r', encoding="utf-8") as f:
+        for line in f:
+            match = MANIFEST_ROW_PATTERN.match(line)
+            if match:
+                filename, version, status = match.groups()
+                statuses[filename] = {"version": version, "layer_down_status": status}
+    return statuses
+
+
+def load_existing_inventory(inventory_path: Path) -> Dict:
+    """Load the current inventory, or an empty one if it does not exist yet."""
+    if not inventory_path.exists():
+        return {"canons": []}
+    with open(inventory_path, 'r', encoding="utf-8") as f:
+        return json.load(f)
+
+
+def list_canon_files(repo_root: Path) -> List[Tuple[Path, str]]:
+    """List (path, type) for every canon and policy file, sorted by repo-relative path."""
+    files = []
+    for directory, canon_type in SOURCE_DIRS:
+        source_dir = repo_root / directory
+        if source_dir.exists():
+            files.extend((path, canon_type) for path in source_dir.glob("*.md"))
+    return sorted(files, key=lambda item: str(item[0].relative_to(repo_root)))
+
+
+def generate_canon_inventory(
+    repo_root: Path,
+    existing: Dict,
+    jobs: Optional[int] = None,
+    hash_cache: Optional[HashCache] = None
+) -> Tuple[Dict, Dict[str, List[str]]]:
+    """
+    Build the canon inventory, reusing existing entries whose file hash is unchanged.
+    
+    Returns:
+        Tuple of (inventory, changes) where changes lists the filenames that
+        were "added", "updated", "removed" and "reused"
+    """
+    previous = {entry["path"]: entry for entry in existing.get("canons", [])}
+    canon_files = list_canon_files(repo_root)
+    rel_paths = {path: str(path.relative_to(repo_root)) for path, _ in canon_files}
+    
+    # Hash every file, letting the cache skip files whose stat data is unchanged
+    stats = {path: path.stat() for path, _ in canon_files}
+    hashes = {}
+    to_hash = []
+    for path, _ in canon_files:
+        cached = hash_cache.lookup(rel_paths[path], stats[path]) if hash_cache else None
+        if cached is not None:
+            hashes[path] = cached
+        else:
+            to_hash.append(path)
+    # Taken before hashing so edits made while hashing count as racy
+    hashed_ns = time.time_ns()
+    hashes.update(hash_files(to_hash))
+    if hash_cache is not None:
+        for path in to_hash:
+            hash_cache.store(rel_paths[path], stats[path], hashes[path], hashed_ns)
+        hash_cache.prune(list(rel_paths.values()))
+        hash_cache.save()
+    
+    changed = [
+        path for path, canon_type in canon_files
+        if previous.get(rel_paths[path], {}).get("file_hash") != hashes[path]
+        or previous[rel_paths[path]].get("type") != canon_type
+    ]
+    extracted = extract_all(changed, jobs)
+    manifest = load_manifest_statuses(repo_root) if changed else {}
+    
+    changes = {"added": [], "updated": [], "removed": [], "reused": []}
+    canons = []
+    for path, canon_type in canon_files:
+        rel_path = rel_paths[path]
+        old_entry = previous.get(rel_path)
+        if path not in extracted:
+            canons.append(old_entry)
+            changes["reused"].append(path.name)
+            continue
+        
+        old_entry = old_entry or {}
+        manifest_entry = manifest.get(path.name, {})
+        metadata = extracted[path]
+        canons.append({
+            "filename": path.name,
+            "version": (metadata["version"] or manifest_entry.get("version")
+                        or old_entry.get("version") or DEFAULT_VERSION),
+            "file_hash": hashes[path],
+            "effective_date": (metadata["effective_date"] or old_entry.get("effective_date")
+                               or datetime.now().strftime("%Y-%m-%d")),
+            "description": (metadata["description"]
+                            or f"Canonical governance document: {path.stem}"),
+            "type": canon_type,
+            "path": rel_path,
+            "layer_down_status": (old_entry.get("layer_down_status")
+                                  or manifest_entry.get("layer_down_status")
+                                  or DEFAULT_LAYER_DOWN_STATUS)
+        })
+        changes["updated" if old_entry else "added"].append(path.name)
+    
+    live_paths = set(rel_paths.values())
+    changes["removed"] = sorted(
+        entry["filename"] for path, entry in previous.items() if path not in live_paths
+    )
+    
+    modified = bool(changes["added"] or changes["updated"] or changes["removed"])
+    now = datetime.now()
+    inventory = {
+        "version": existing.get("version", "1.0.0"),
+        "last_updated": now.strftime("%Y-%m-%d") if modified else existing.get("last_updated"),
+        "total_canons": len(canons),
+        "generation_timestamp": now.isoformat() if modified else existing.get("generation_timestamp"),
+        "canons": canons
+    }
+    return inventory, changes
+
+
+def serialize_inventory(inventory: Dict) -> str:
+    """Serialize the inventory exactly as committed (2-space indent, UTF-8, no trailing newline)."""
+    return json.dumps(inventory, indent=2, ensure_ascii=False)
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(
+        description="Regenerate governance/CANON_INVENTORY.json from canon and policy files"
+    )
+    parser.add_argument(
+        "--repo-root",
+        type=Path,
+        default=Path.cwd(),
+        help="Root directory of the governance repository (default: current directory)"
+    )
+    parser.add_argument(
+        "--output",
+        type=Path,
+        help=f"Inventory file to read and update (default: <repo-root>/{INVENTORY_PATH})"
+    )
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="Do not write; exit 1 if the inventory is out of date (for pre-commit and CI)"
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        help="Worker processes for metadata extraction (default: CPU count, 1 = serial)"
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Hash every file without reading or writing the hash cache"
+    )
+    
+    args = parser.parse_args()
+    
+    if args.output is None:
+        args.output = args.repo_root / INVENTORY_PATH
+    
+    hash_cache = None if args.no_cache else HashCache(args.repo_root / HASH_CACHE_FILENAME)
+    existing = load_existing_inventory(args.output)
+    inventory, changes = generate_canon_inventory(args.repo_root, existing, args.jobs, hash_cache)
+    
+    print(f"Canons:    {inventory['total_canons']}")
+    print(f"Reused:    {len(changes['reused'])}")
+    for kind in ("added", "updated", "removed"):
+        print(f"{kind.capitalize() + ':':<10} {len(changes[kind])}")
+        for filename in changes[kind]:
+            print(f"  - {filename}")
+    
+    content = serialize_inventory(inventory)
+    if args.output.exists() and args.output.read_text(encoding="utf-8") == content:
+        print(f"✓ {args.output} is up to date")
+        sys.exit(0)
+    
+    if args.check:
+        print(f"ERROR: {args.output} is out of date; run scripts/generate_canon_inventory.py")
+        sys.exit(1)
+    
+    tmp_path = args.output.with_name(f"{args.output.name}.{os.getpid()}.tmp")
+    with open(tmp_path, 'w', encoding="utf-8") as f:
+        f.write(content)
+    os.replace(tmp_path, args.output)
+    print(f"✓ Inventory saved to {args.output}")
+    sys.exit(0)
+
+
+if __name__ == "__main__":
+    main()
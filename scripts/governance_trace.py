@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+"""
+Governance Script Phase Tracer
+
+Shared timing instrumentation for the governance scripts
+(scripts/sync_repo_inventory.py, .github/scripts/check_locked_sections.py).
+
+Scripts wrap their phases in TRACE.span("name") and bump counters with
+TRACE.count("name", n). Both are no-ops until TRACE.enable() is called,
+which the scripts do for --timings, --trace FILE and --profile FILE. At exit
+the tracer prints a phase table (--timings, on stderr), appends one JSON
+record per run to the trace file (--trace), and dumps cProfile statistics of
+the main thread (--profile).
+
+Trace files are JSON Lines, so runs from many CI jobs can be concatenated
+and aggregated:
+
+    python scripts/governance_trace.py summarize trace.jsonl [more.jsonl ...]
+"""
+
+import argparse
+import atexit
+import json
+import os
+import statistics
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from typing import Dict, Iterator, List, Optional
+
+TRACE_FORMAT_VERSION = 1
+
+
+class Tracer:
+    """
+    Records nested phase spans and named counters for one script run.
+    
+    Span names are joined with their enclosing spans ("scan/parse"); each
+    thread keeps its own nesting, so spans opened in worker threads nest
+    under nothing rather than under whatever the main thread is doing.
+    """
+    
+    def __init__(self):
+        self.enabled = False
+        self.tool = None
+        self.spans: List[Dict] = []
+        self.counters: Dict[str, float] = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._origin = time.perf_counter()
+        self._started = None
+        self._profiler = None
+        self._trace_file = None
+        self._profile_file = None
+        self._print_timings = False
+    
+    def enable(self, tool: str, timings: bool = False, trace_file: Optional[str] = None,
+               profile_file: Optional[str] = None):
+        """Start recording; the report is emitted at interpreter exit"""
+        self.enabled = True
+        self.tool = tool
+        self._print_timings = timings
+        self._trace_file = trace_file
+        self._profile_file = profile_file
+        self._origin = time.perf_counter()
+        self._started = datetime.now(timezone.utc)
+        if profile_file:
+            import cProfile
+            self._profiler = cProfile.Profile()
+            self._profiler.enable()
+        atexit.register(self.finish)
+    
+    @contextmanager
+    def span(self, name: str) -> Iterator[None]:
+        """Time the enclosed block as a phase"""
+        if not self.enabled:
+            yield
+            return
+        stack = getattr(self._local, 'stack', None)
+        if stack is None:
+            stack = self._local.stack = []
+        stack.append(name)
+        path = '/'.join(stack)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            end = time.perf_counter()
+            stack.pop()
+            with self._lock:
+                self.spans.append({
+                    'name': path,
+                    'start_s': round(start - self._origin, 6),
+                    'duration_s': round(end - start, 6),
+                    'thread': threading.current_thread().name,
+                })
+    
+    @contextmanager
+    def subprocess(self, label: str) -> Iterator[None]:
+        """Time a child process as span "subprocess:<label>" and count it"""
+        if not self.enabled:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            with self.span(f'subprocess:{label}'):
+                yield
+        finally:
+            self.count('subprocess_calls')
+            self.count('subprocess_s', time.perf_counter() - start)
+    
+    def count(self, name: str, value: float = 1):
+        """Add value to a named counter"""
+        if not self.enabled:
+            return
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + value
+    
+    def phases(self) -> Dict[str, Dict]:
+        """Spans aggregated by name: call count and total seconds"""
+        phases: Dict[str, Dict] = {}
+        for span in self.spans:
+            phase = phases.setdefault(span['name'], {'calls': 0, 'total_s': 0.0})
+            phase['calls'] += 1
+            phase['total_s'] += span['duration_s']
+        for phase in phases.values():
+            phase['total_s'] = round(phase['total_s'], 6)
+        return dict(sorted(phases.items()))
+    
+    def report(self) -> Dict:
+        counters = {name: round(value, 6) if isinstance(value, float) else value
+                    for name, value in sorted(self.counters.items())}
+        return {
+            'version': TRACE_FORMAT_VERSION,
+            'tool': self.tool,
+            'started': self._started.strftime('%Y-%m-%dT%H:%M:%SZ') if self._started else None,
+            'argv': sys.argv[1:],
+            'pid': os.getpid(),
+            'wall_s': round(time.perf_counter() - self._origin, 6),
+            'phases': self.phases(),
+            'counters': counters,
+            'spans': self.spans,
+        }
+    
+    def finish(self):
+        """Stop profiling and emit the requested outputs (runs once, at exit)"""
+        if not self.enabled:
+            return
+        self.enabled = False
+        if self._profiler is not None:
+            self._profiler.disable()
+            try:
+                self._profiler.dump_stats(self._profile_file)
+            except OSError as e:
+                print(f"Warning: could not write profile {self._profile_file}: {e}", file=sys.stderr)
+        report = self.report()
+        if self._trace_file:
+            try:
+                with open(self._trace_file, 'a') as f:
+                    f.write(json.dumps(report, separators=(',', ':')) + '\n')
+            except OSError as e:
+                print(f"Warning: could not write trace {self._trace_file}: {e}", file=sys.stderr)
+        if self._print_timings:
+            print_timings(report, sys.stderr)
+
+
+def print_timings(report: Dict, stream=sys.stdout):
+    """Print one run's phases and counters as a table"""
+    print(f"\n{'=' * 60}", file=stream)
+    print(f"TIMINGS: {report['tool']} ({report['wall_s'] * 1000:.1f} ms wall)", file=stream)
+    print('=' * 60, file=stream)
+    for name, phase in report['phases'].items():
+        depth = name.count('/')
+        label = '  ' * depth + name.rsplit('/', 1)[-1]
+        print(f"  {label:38} {phase['total_s'] * 1000:10.2f} ms  x{phase['calls']}", file=stream)
+    if report['counters']:
+        print('-' * 60, file=stream)
+        for name, value in report['counters'].items():
+            print(f"  {name:38} {value:>13}", file=stream)
+    print('=' * 60, file=stream)
+
+
+def iter_trace_records(paths: List[str]) -> Iterator[Dict]:
+    for path in paths:
+        with open(path, 'r') as f:
+            for line in f:
+                line = line.strip()
+                if line:
+                    yield json.loads(line)
+
+
+def summarize(records: List[Dict]) -> Dict[str, Dict]:
+    """Per tool and phase: runs, mean, median and max total seconds across runs"""
+    samples: Dict[str, Dict[str, List[float]]] = {}
+    for record in records:
+        tool = samples.setdefault(record.get('tool') or '?', {})
+        tool.setdefault('(wall)', []).append(record['wall_s'])
+        for name, phase in record.get('phases', {}).items():
+            tool.setdefault(name, []).append(phase['total_s'])
+    
+    summary: Dict[str, Dict] = {}
+    for tool, phases in samples.items():
+        summary[tool] = {}
+        for name, values in phases.items():
+            summary[tool][name] = {
+                'runs': len(values),
+                'mean_s': round(statistics.mean(values), 6),
+                'median_s': round(statistics.median(values), 6),
+                'max_s': round(max(values), 6),
+            }
+    return summary
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Aggregate governance script trace files')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    summarize_parser = subparsers.add_parser('summarize', help='Phase statistics across recorded runs')
+    summarize_parser.add_argument('files', nargs='+', help='Trace files written with --trace (JSON Lines)')
+    summarize_parser.add_argument('--json', action='store_true', help='Print the summary as JSON')
+    args = parser.parse_args()
+    
+    try:
+        records = list(iter_trace_records(args.files))
+    except (OSError, ValueError) as e:
+        print(f"ERROR: Could not read trace records: {e}")
+        sys.exit(2)
+    summary = summarize(records)
+    
+    if args.json:
+        print(json.dumps(summary, indent=2))
+        return
+    for tool, phases in summary.items():
+        width = max(len(name) for name in phases)
+        print(f"\n{tool}")
+        print(f"  {'Phase':{width}} {'Runs':>5} {'Mean ms':>10} {'Median ms':>10} {'Max ms':>10}")
+        for name, stats in phases.items():
+            print(f"  {name:{width}} {stats['runs']:5} {stats['mean_s'] * 1000:10.2f} "
+                  f"{stats['median_s'] * 1000:10.2f} {stats['max_s'] * 1000:10.2f}")
+
+
+# Process-wide tracer shared by every instrumented module
+TRACE = Tracer()
+
+
+if __name__ == '__main__':
+    main()
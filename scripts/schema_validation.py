@@ -0,0 +1,526 @@
+#!/usr/bin/env python3
+"""
+Compiled JSON Schema Validation
+
+Shared by the bulk validators (scripts/validate_tenant_memory.py,
+scripts/validate_governance_reports.py). A schema is
+compiled once into nested validator functions, so validating an entry costs
+only the checks its schema declares, with no per-entry keyword dispatch.
+
+The compiler covers the draft-07 keywords the governance schemas use: type,
+const, enum, pattern, minLength/maxLength, minimum/maximum (and the exclusive
+forms), format (date-time, date), required, properties, additionalProperties,
+items, minItems/maxItems and uniqueItems. Annotations (title, description,
+default, $id, keys starting with "_") are ignored. A schema using any other
+keyword is validated with jsonschema's Draft7Validator instead, when jsonschema
+is installed.
+
+Entries are streamed from files with iter_json_entries: JSON Lines one line at
+a time, and top-level JSON arrays one element at a time, so large files are
+never held in memory as a whole. ResultCache keeps per-file results between
+runs for files whose size and mtime are unchanged.
+"""
+
+import json
+import os
+import re
+from datetime import date, datetime
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+try:
+    import jsonschema  # Optional: schemas beyond the compiled keyword set
+except ImportError:
+    jsonschema = None
+
+# (path, message), path as "$.value.type" / "$.tags[2]"
+Violation = Tuple[str, str]
+Check = Callable[[object, str], Iterator[Violation]]
+
+ANNOTATION_KEYWORDS = {'$schema', '$id', '$comment', 'title', 'description', 'default', 'examples'}
+
+JSON_TYPES = {
+    'object': lambda v: isinstance(v, dict),
+    'array': lambda v: isinstance(v, list),
+    'string': lambda v: isinstance(v, str),
+    'boolean': lambda v: isinstance(v, bool),
+    'null': lambda v: v is None,
+    'integer': lambda v: (isinstance(v, int) and not isinstance(v, bool))
+                         or (isinstance(v, float) and v.is_integer()),
+    'number': lambda v: isinstance(v, (int, float)) and not isinstance(v, bool),
+}
+
+# Types testable with a single isinstance() call
+PYTHON_TYPES = {'object': dict, 'array': list, 'string': str, 'boolean': bool, 'null': type(None)}
+
+DATE_TIME_PATTERN = re.compile(r'^\d{4}-\d{2}-\d{2}[Tt ]\d{2}:\d{2}:\d{2}(?:\.\d+)?(?:[Zz]|[+-]\d{2}:\d{2})$')
+DATE_PATTERN = re.compile(r'^\d{4}-\d{2}-\d{2}$')
+
+STREAM_CHUNK_SIZE = 1024 * 1024
+
+
+class SchemaError(Exception):
+    """Schema cannot be loaded or validated with what is installed"""
+
+
+class UnsupportedSchemaError(SchemaError):
+    """Schema uses a keyword the compiler does not implement"""
+
+
+def _is_date_time(value: str) -> bool:
+    if not DATE_TIME_PATTERN.match(value):
+        return False
+    try:
+        datetime.fromisoformat(value.replace(' ', 'T'))
+    except ValueError:
+        return False
+    return True
+
+
+def _is_date(value: str) -> bool:
+    if not DATE_PATTERN.match(value):
+        return False
+    try:
+        date.fromisoformat(value)
+    except ValueError:
+        return False
+    return True
+
+
+FORMAT_CHECKS = {'date-time': _is_date_time, 'date': _is_date}
+
+
+def _json_equal(a, b) -> bool:
+    """Equality as JSON sees it: true is not 1"""
+    if isinstance(a, bool) or isinstance(b, bool):
+        return isinstance(a, bool) and isinstance(b, bool) and a == b
+    if isinstance(a, list) and isinstance(b, list):
+        return len(a) == len(b) and all(_json_equal(x, y) for x, y in zip(a, b))
+    if isinstance(a, dict) and isinstance(b, dict):
+        return a.keys() == b.keys() and all(_json_equal(a[k], b[k]) for k in a)
+    return a == b
+
+
+def compile_schema(schema, path: str = '#') -> Check:
+    """
+    Compile a schema node into a function yielding its violations for a value.
+    
+    Raises:
+        UnsupportedSchemaError: a keyword outside the compiled set is used
+    """
+    if schema is True or schema == {}:
+        return lambda value, at: iter(())
+    if schema is False:
+        return lambda value, at: iter([(at, "False schema does not allow any value")])
+    if not isinstance(schema, dict):
+        raise SchemaError(f"{path}: schema must be an object or boolean")
+    
+    checks: List[Check] = []
+    handled = set(ANNOTATION_KEYWORDS)
+    
+    def keyword(name):
+        handled.add(name)
+        return schema[name]
+    
+    if 'type' in schema:
+        types = keyword('type')
+        types = [types] if isinstance(types, str) else list(types)
+        unknown = [t for t in types if t not in JSON_TYPES]
+        if unknown:
+            raise SchemaError(f"{path}: unknown type {unknown[0]!r}")
+        testers = [JSON_TYPES[t] for t in types]
+        label = repr(types[0]) if len(types) == 1 else repr(types)
+        
+        if all(t in PYTHON_TYPES for t in types):
+            classes = tuple(PYTHON_TYPES[t] for t in types)
+            
+            def check_type(value, at):
+                if not isinstance(value, classes):
+                    yield at, f"{value!r} is not of type {label}"
+        else:
+            def check_type(value, at):
+                if not any(test(value) for test in testers):
+                    yield at, f"{value!r} is not of type {label}"
+        checks.append(check_type)
+    
+    if 'const' in schema:
+        expected = keyword('const')
+        
+        def check_const(value, at):
+            if not _json_equal(value, expected):
+                yield at, f"{expected!r} was expected"
+        checks.append(check_const)
+    
+    if 'enum' in schema:
+        options = keyword('enum')
+        
+        def check_enum(value, at):
+            if not any(_json_equal(value, option) for option in options):
+                yield at, f"{value!r} is not one of {options!r}"
+        checks.append(check_enum)
+    
+    checks.extend(_compile_string(schema, keyword, path))
+    checks.extend(_compile_number(schema, keyword))
+    checks.extend(_compile_object(schema, keyword, path))
+    checks.extend(_compile_array(schema, keyword, path))
+    
+    unsupported = sorted(k for k in schema if k not in handled and not k.startswith('_'))
+    if unsupported:
+        raise UnsupportedSchemaError(f"{path}: unsupported keyword {unsupported[0]!r}")
+    
+    if len(checks) == 1:
+        return checks[0]
+    
+    def check_all(value, at):
+        for check in checks:
+            yield from check(value, at)
+    return check_all
+
+
+def _compile_string(schema: Dict, keyword, path: str) -> List[Check]:
+    checks = []
+    if 'pattern' in schema:
+        source = keyword('pattern')
+        try:
+            regex = re.compile(source)
+        except re.error as e:
+            raise SchemaError(f"{path}: invalid pattern {source!r}: {e}")
+        
+        def check_pattern(value, at):
+            if isinstance(value, str) and not regex.search(value):
+                yield at, f"{value!r} does not match {source!r}"
+        checks.append(check_pattern)
+    
+    if 'minLength' in schema:
+        min_length = keyword('minLength')
+        
+        def check_min_length(value, at):
+            if isinstance(value, str) and len(value) < min_length:
+                yield at, f"{value!r} is too short"
+        checks.append(check_min_length)
+    
+    if 'maxLength' in schema:
+        max_length = keyword('maxLength')
+        
+        def check_max_length(value, at):
+            if isinstance(value, str) and len(value) > max_length:
+                yield at, f"{value!r} is too long"
+        checks.append(check_max_length)
+    
+    if 'format' in schema:
+        name = keyword('format')
+        # Formats without a checker are annotations, as in the specification
+        test = FORMAT_CHECKS.get(name)
+        if test is not None:
+            def check_format(value, at):
+                if isinstance(value, str) and not test(value):
+                    yield at, f"{value!r} is not a {name!r}"
+            checks.append(check_format)
+    return checks
+
+
+def _compile_number(schema: Dict, keyword) -> List[Check]:
+    checks = []
+    bounds = [
+        ('minimum', lambda v, b: v < b, 'less than the minimum of'),
+        ('maximum', lambda v, b: v > b, 'greater than the maximum of'),
+        ('exclusiveMinimum', lambda v, b: v <= b, 'less than or equal to the minimum of'),
+        ('exclusiveMaximum', lambda v, b: v >= b, 'greater than or equal to the maximum of'),
+    ]
+    for name, fails, text in bounds:
+        if name not in schema:
+            continue
+        bound = keyword(name)
+        
+        def check_bound(value, at, bound=bound, fails=fails, text=text):
+            if JSON_TYPES['number'](value) and fails(value, bound):
+                yield at, f"{value!r} is {text} {bound!r}"
+        checks.append(check_bound)
+    return checks
+
+
+def _compile_object(schema: Dict, keyword, path: str) -> List[Check]:
+    checks = []
+    if 'required' in schema:
+        required = keyword('required')
+        
+        def check_required(value, at):
+            if isinstance(value, dict):
+                for name in required:
+                    if name not in value:
+                        yield at, f"{name!r} is a required property"
+        checks.append(check_required)
+    
+    properties = {}
+    if 'properties' in schema:
+        properties = {name: compile_schema(sub, f"{path}/properties/{name}")
+                      for name, sub in keyword('properties').items()}
+        
+        def check_properties(value, at):
+            if isinstance(value, dict):
+                for name, check in properties.items():
+                    if name in value:
+                        yield from check(value[name], f"{at}.{name}")
+        checks.append(check_properties)
+    
+    if 'additionalProperties' in schema:
+        additional = keyword('additionalProperties')
+        if additional is False:
+            def check_additional(value, at):
+                if isinstance(value, dict):
+                    extra = [name for name in value if name not in properties]
+                    if extra:
+                        listed = ', '.join(repr(name) for name in extra)
+                        yield at, (f"Additional properties are not allowed ({listed} "
+                                   f"{'was' if len(extra) == 1 else 'were'} unexpected)")
+            checks.append(check_additional)
+        elif additional is not True:
+            check_extra = compile_schema(additional, f"{path}/additionalProperties")
+            
+            def check_additional(value, at):
+                if isinstance(value, dict):
+                    for name in value:
+                        if name not in properties:
+                            yield from check_extra(value[name], f"{at}.{name}")
+            checks.append(check_additional)
+    return checks
+
+
+def _compile_array(schema: Dict, keyword, path: str) -> List[Check]:
+    checks = []
+    if 'items' in schema:
+        items = keyword('items')
+        if isinstance(items, list):
+            raise UnsupportedSchemaError(f"{path}: tuple-form 'items' is not supported")
+        check_item = compile_schema(items, f"{path}/items")
+        
+        def check_items(value, at):
+            if isinstance(value, list):
+                for i, item in enumerate(value):
+                    yield from check_item(item, f"{at}[{i}]")
+        checks.append(check_items)
+    
+    if 'minItems' in schema:
+        min_items = keyword('minItems')
+        
+        def check_min_items(value, at):
+            if isinstance(value, list) and len(value) < min_items:
+                yield at, f"{value!r} is too short"
+        checks.append(check_min_items)
+    
+    if 'maxItems' in schema:
+        max_items = keyword('maxItems')
+        
+        def check_max_items(value, at):
+            if isinstance(value, list) and len(value) > max_items:
+                yield at, f"{value!r} is too long"
+        checks.append(check_max_items)
+    
+    if 'uniqueItems' in schema and keyword('uniqueItems'):
+        def check_unique(value, at):
+            if isinstance(value, list):
+                for i, item in enumerate(value):
+                    if any(_json_equal(item, other) for other in value[:i]):
+                        yield at, f"{value!r} has non-unique elements"
+                        return
+        checks.append(check_unique)
+    return checks
+
+
+class CompiledSchema:
+    """A schema ready to validate many instances: compiled, or via jsonschema as a fallback"""
+    
+    def __init__(self, schema: Dict, name: str = 'schema'):
+        self.schema = schema
+        self.name = name
+        self.engine = 'compiled'
+        try:
+            self._check = compile_schema(schema)
+        except UnsupportedSchemaError as e:
+            if jsonschema is None:
+                raise SchemaError(f"{name}: {e}; install jsonschema to validate it "
+                                  f"(pip install jsonschema)")
+            validator = jsonschema.Draft7Validator(schema, format_checker=jsonschema.FormatChecker())
+            self._check = lambda value, at: (
+                (at + ''.join(f"[{p}]" if isinstance(p, int) else f".{p}" for p in error.absolute_path),
+                 error.message)
+                for error in validator.iter_errors(value)
+            )
+            self.engine = 'jsonschema'
+    
+    @classmethod
+    def load(cls, schema_path: str) -> 'CompiledSchema':
+        try:
+            with open(schema_path, 'r', encoding='utf-8') as f:
+                schema = json.load(f)
+        except (OSError, ValueError) as e:
+            raise SchemaError(f"Cannot load schema {schema_path}: {e}")
+        return cls(schema, schema_path)
+    
+    def violations(self, instance) -> List[Violation]:
+        return list(self._check(instance, '$'))
+
+
+def iter_json_array(f, chunk_size: int = STREAM_CHUNK_SIZE) -> Iterator[Tuple[int, int, object]]:
+    """
+    Stream the elements of a top-level JSON array from a text file.
+    
+    Yields (index, line, element) with the 1-based line each element starts
+    on. Only the element being decoded (plus one chunk) is held in memory.
+    
+    Raises:
+        ValueError: the document is not a well-formed array
+    """
+    decoder = json.JSONDecoder()
+    buf = f.read(chunk_size)
+    eof = not buf
+    pos = 0
+    line = 1
+    
+    def skip_space():
+        nonlocal pos, line
+        while True:
+            start = pos
+            while pos < len(buf) and buf[pos] in ' \t\r\n':
+                pos += 1
+            line += buf.count('\n', start, pos)
+            if pos < len(buf) or not refill():
+                return
+    
+    def refill() -> bool:
+        nonlocal buf, pos, eof
+        if eof:
+            return False
+        more = f.read(chunk_size)
+        if not more:
+            eof = True
+            return False
+        buf = buf[pos:] + more
+        pos = 0
+        return True
+    
+    skip_space()
+    if pos >= len(buf) or buf[pos] != '[':
+        raise ValueError(f"line {line}: expected a JSON array")
+    pos += 1
+    skip_space()
+    if pos < len(buf) and buf[pos] == ']':
+        return
+    
+    index = 0
+    while True:
+        while True:
+            try:
+                element, end = decoder.raw_decode(buf, pos)
+            except json.JSONDecodeError as e:
+                if refill():
+                    continue
+                raise ValueError(f"line {line + buf.count(chr(10), pos, e.pos)}: {e.msg}")
+            # A number may continue past the chunk boundary ("1." decodes as
+            # 1); only accept a value once a delimiter follows it
+            if (end == len(buf) or buf[end] not in ' \t\r\n,]') and refill():
+                continue
+            break
+        yield index, line, element
+        line += buf.count('\n', pos, end)
+        pos = end
+        index += 1
+        skip_space()
+        if pos >= len(buf):
+            raise ValueError(f"line {line}: unterminated array")
+        if buf[pos] == ']':
+            pos += 1
+            skip_space()
+            if pos < len(buf):
+                raise ValueError(f"line {line}: extra data after the array")
+            return
+        if buf[pos] != ',':
+            raise ValueError(f"line {line}: expected ',' or ']'")
+        pos += 1
+        skip_space()
+
+
+def iter_json_entries(file_path: str) -> Iterator[Tuple[str, Optional[object], Optional[str]]]:
+    """
+    Stream the entries of a JSON or JSON Lines file.
+    
+    .jsonl files yield one entry per non-blank line; .json files yield the
+    elements of a top-level array, or the document itself otherwise. Yields
+    (offset, entry, error): offset is "line N" or "[i] line N", and error is
+    a parse error message (entry None) when the input is malformed at that point.
+    """
+    if file_path.endswith('.jsonl'):
+        with open(file_path, 'r', encoding='utf-8') as f:
+            for number, text in enumerate(f, 1):
+                if not text.strip():
+                    continue
+                try:
+                    yield f"line {number}", json.loads(text), None
+                except ValueError as e:
+                    yield f"line {number}", None, f"Invalid JSON: {e}"
+        return
+    
+    with open(file_path, 'r', encoding='utf-8') as f:
+        head = f.read(STREAM_CHUNK_SIZE)
+        stripped = head.lstrip()
+        if not stripped.startswith('['):
+            try:
+                yield "line 1", json.loads(head + f.read()), None
+            except ValueError as e:
+                yield "line 1", None, f"Invalid JSON: {e}"
+            return
+        f.seek(0)
+        try:
+            for index, line, element in iter_json_array(f):
+                yield f"[{index}] line {line}", element, None
+        except ValueError as e:
+            yield "end", None, f"Invalid JSON: {e}"
+
+
+class ResultCache:
+    """Per-file validation results, trusted while size and mtime_ns match and the schema is unchanged"""
+    
+    VERSION = 1
+    RACY_WINDOW_NS = 2_000_000_000
+    
+    def __init__(self, cache_path: Optional[str], schema_digest: str):
+        self.cache_path = cache_path
+        self.schema_digest = schema_digest
+        self.entries: Dict[str, Dict] = {}
+        if cache_path is None:
+            return
+        try:
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if (isinstance(data, dict) and data.get('version') == self.VERSION
+                and data.get('schema') == schema_digest):
+            self.entries = data.get('files', {})
+    
+    def lookup(self, file_path: str, st: os.stat_result) -> Optional[Dict]:
+        entry = self.entries.get(file_path)
+        if (entry is not None and entry['size'] == st.st_size and entry['mtime_ns'] == st.st_mtime_ns
+                and entry['mtime_ns'] + self.RACY_WINDOW_NS < entry['checked_ns']):
+            return entry['result']
+        return None
+    
+    def store(self, file_path: str, st: os.stat_result, checked_ns: int, result: Dict):
+        self.entries[file_path] = {'size': st.st_size, 'mtime_ns': st.st_mtime_ns,
+                                   'checked_ns': checked_ns, 'result': result}
+    
+    def save(self, files: List[str]):
+        """Atomically write the cache, keeping only the files of this run"""
+        if self.cache_path is None:
+            return
+        data = {
+            'version': self.VERSION,
+            'schema': self.schema_digest,
+            'files': {path: self.entries[path] for path in files if path in self.entries},
+        }
+        cache_path = Path(self.cache_path)
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_name(cache_path.name + f'.{os.getpid()}.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, separators=(',', ':'))
+        os.replace(tmp_path, cache_path)
@@ -9,33 +9,216 @@ This script synchronizes a repository's governance alignment inventory by:
 4. Generating or updating GOVERNANCE_ALIGNMENT_INVENTORY.json
 5. Reporting compliance status
 
+Delta mode (--delta) compares against the previous inventory, rewrites it only
+when its content changed, and can emit the change set as JSON (--delta-output).
+
+Fleet mode (--fleet) loads the central inventory once and syncs many
+repositories concurrently, writing each repository's inventory plus one
+aggregated coverage report. With --validate-reports it also validates every
+repository's Builder QA and governance compliance reports (.qa/) against the
+central report schemas (see validate_governance_reports.py) in the same pass.
+
 Usage:
     python sync_repo_inventory.py [--repo-root PATH] [--governance-source PATH]
+                                  [--jobs N] [--cache-file PATH | --no-cache]
+                                  [--git-metadata] [--delta] [--delta-output PATH]
+    python sync_repo_inventory.py --fleet REPO_ROOT_OR_GLOB [...]
+                                  [--governance-source PATH] [--fleet-report PATH]
+                                  [--fleet-jobs N] [--validate-reports]
 """
 
 import argparse
+import glob
 import hashlib
 import json
 import os
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
+
+from governance_trace import TRACE
+
+try:
+    import ijson  # Optional: streams large central inventories
+except ImportError:
+    ijson = None
 
 # Constants
 SHA256_TRUNCATE_LENGTH = 12  # Consistent with CANON_INVENTORY.json format
+HASH_CHUNK_SIZE = 1024 * 1024  # hashlib releases the GIL while hashing large buffers
+# Hash caches are kept in the .cache/ of the governance repository holding this
+# script, one file per synced repository, so synced repositories are never written to
+HASH_CACHE_DIR = Path(__file__).resolve().parent.parent / ".cache" / "sync_repo_inventory"
+MANIFEST_RACY_WINDOW_NS = 2_000_000_000  # Same rule as governance_index.py
+INVENTORY_FILENAME = "GOVERNANCE_ALIGNMENT_INVENTORY.json"
+FLEET_MAX_WORKERS = 8  # Default bound on repositories synced at once
+FLEET_REPORT_VIOLATIONS = 5  # Violations listed per invalid report file in the fleet report
+
+
+def default_hash_cache_file(repo_root: Path) -> Path:
+    """Hash cache location for a repository: HASH_CACHE_DIR/<name>-<digest of its resolved path>.json"""
+    resolved = repo_root.resolve()
+    digest = hashlib.sha256(str(resolved).encode("utf-8")).hexdigest()[:SHA256_TRUNCATE_LENGTH]
+    return HASH_CACHE_DIR / f"{resolved.name or 'root'}-{digest}.json"
 
 
 def calculate_sha256(file_path: Path) -> str:
     """Calculate SHA256 hash of a file."""
     sha256_hash = hashlib.sha256()
-    with open(file_path, "rb") as f:
-        for byte_block in iter(lambda: f.read(4096), b""):
-            sha256_hash.update(byte_block)
+    buffer = bytearray(HASH_CHUNK_SIZE)
+    view = memoryview(buffer)
+    total = 0
+    with open(file_path, "rb", buffering=0) as f:
+        while True:
+            size = f.readinto(buffer)
+            if not size:
+                break
+            sha256_hash.update(view[:size])
+            total += size
+    TRACE.count("bytes_read", total)
     return sha256_hash.hexdigest()[:SHA256_TRUNCATE_LENGTH]
 
 
-def load_central_inventory(governance_source_path: Path) -> Dict:
+def hash_files(file_paths: List[Path], jobs: Optional[int] = None) -> Dict[Path, str]:
+    """
+    Hash many files concurrently.
+    
+    File reads and hashlib both release the GIL, so a thread pool overlaps
+    I/O and hashing across files. Results are identical to calling
+    calculate_sha256() on each file in turn.
+    
+    Args:
+        file_paths: Files to hash
+        jobs: Worker threads (default: ThreadPoolExecutor's default; 1 = sequential)
+    
+    Returns:
+        Mapping of each path to its truncated SHA256
+    """
+    if jobs == 1 or len(file_paths) < 2:
+        return {path: calculate_sha256(path) for path in file_paths}
+    
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        return dict(zip(file_paths, pool.map(calculate_sha256, file_paths)))
+
+
+class CanonRecord:
+    """
+    One tracked canon from the central inventory, with its sync-relevant fields.
+    
+    The mandatory flag, classification and priority depend only on
+    layer_down_status, so they are computed once per distinct status and
+    shared by every record with that status.
+    """
+    
+    __slots__ = ("filename", "version", "file_hash", "layer_down_status",
+                 "mandatory", "classification", "priority")
+    
+    _derived_by_status: Dict[str, tuple] = {}
+    
+    def __init__(self, filename: str, version: Optional[str], file_hash: str,
+                 layer_down_status: Optional[str]):
+        self.filename = filename
+        # Inventory values are not guaranteed to be strings (e.g. null); only intern real ones
+        self.version = sys.intern(version) if isinstance(version, str) else version
+        self.file_hash = file_hash
+        self.layer_down_status = (sys.intern(layer_down_status)
+                                  if isinstance(layer_down_status, str) else layer_down_status)
+        self.mandatory, self.classification, self.priority = self._derive(self.layer_down_status)
+    
+    @classmethod
+    def _derive(cls, layer_down_status: str) -> tuple:
+        """Return (mandatory, classification, priority) for a layer_down_status."""
+        derived = cls._derived_by_status.get(layer_down_status)
+        if derived is None:
+            # Determine if this canon is mandatory for this repository
+            # Uses configurable logic based on repository type
+            mandatory = is_mandatory_for_repo(layer_down_status)
+            derived = (
+                mandatory,
+                determine_classification(layer_down_status),
+                determine_priority(layer_down_status, mandatory)
+            )
+            cls._derived_by_status[layer_down_status] = derived
+        return derived
+    
+    @classmethod
+    def from_entry(cls, canon: Dict) -> Optional["CanonRecord"]:
+        """Build a record from a CANON_INVENTORY.json entry, or None if it is not tracked."""
+        # Skip non-canon entries (policy, etc.) or determine if they should be tracked
+        # For now, only track canon type
+        if canon.get("type") != "canon":
+            return None
+        return cls(
+            canon.get("filename", ""),
+            canon.get("version", "unknown"),
+            canon.get("file_hash", ""),
+            canon.get("layer_down_status", "OPTIONAL")
+        )
+
+
+class CentralInventory:
+    """
+    Indexed, read-only view of the central CANON_INVENTORY.json.
+    
+    Holds only tracked canons, in central inventory order, plus a filename
+    index. A single instance can be shared across threads (fleet mode).
+    """
+    
+    def __init__(self, version: Optional[str], records: List[CanonRecord]):
+        self.version = version
+        self.records = records
+        self.by_filename = {record.filename: record for record in records}
+    
+    def __len__(self) -> int:
+        return len(self.records)
+    
+    def __iter__(self):
+        return iter(self.records)
+    
+    def get(self, filename: str) -> Optional[CanonRecord]:
+        """Look up a tracked canon by filename."""
+        return self.by_filename.get(filename)
+    
+    @classmethod
+    def from_dict(cls, central_inventory: Dict) -> "CentralInventory":
+        """Index an already parsed CANON_INVENTORY.json document."""
+        records = []
+        for canon in central_inventory.get("canons", []):
+            record = CanonRecord.from_entry(canon)
+            if record is not None:
+                records.append(record)
+        return cls(central_inventory.get("version", "1.0.0"), records)
+    
+    @classmethod
+    def load(cls, inventory_path: Path) -> "CentralInventory":
+        """
+        Load and index CANON_INVENTORY.json.
+        
+        If ijson is installed, the canons array is streamed one entry at a
+        time, so memory holds only the compact records and never the full
+        document. Otherwise the file is parsed with json.load.
+        """
+        if ijson is None:
+            with open(inventory_path, 'r') as f:
+                return cls.from_dict(json.load(f))
+        
+        with open(inventory_path, 'rb') as f:
+            # "version" precedes "canons", so this stops after the first buffer
+            # use_float keeps numbers as json.load returns them, not as Decimal
+            version = next(ijson.items(f, "version", use_float=True), "1.0.0")
+        records = []
+        with open(inventory_path, 'rb') as f:
+            for canon in ijson.items(f, "canons.item", use_float=True):
+                record = CanonRecord.from_entry(canon)
+                if record is not None:
+                    records.append(record)
+        return cls(version, records)
+
+
+def load_central_inventory(governance_source_path: Path) -> CentralInventory:
     """Load the central CANON_INVENTORY.json from governance repository."""
     inventory_path = governance_source_path / "governance" / "CANON_INVENTORY.json"
     
@@ -43,12 +226,242 @@ def load_central_inventory(governance_source_path: Path) -> Dict:
         print(f"ERROR: Central CANON_INVENTORY.json not found at {inventory_path}")
         sys.exit(1)
     
-    with open(inventory_path, 'r') as f:
-        return json.load(f)
+    TRACE.count("bytes_read", inventory_path.stat().st_size)
+    return CentralInventory.load(inventory_path)
 
 
-def scan_local_canons(repo_root: Path) -> Dict[str, Dict]:
-    """Scan local governance/canon/ directory for present canons."""
+class HashCache:
+    """
+    Sidecar cache of truncated SHA256 digests for a repository's canon files.
+    
+    Entries are keyed by repo-relative path and trusted only while size,
+    mtime_ns and inode all still match. Files modified within
+    RACY_WINDOW_NS of being hashed are re-hashed on the next run, since a
+    same-size edit inside the filesystem timestamp granularity would
+    otherwise go unnoticed. A separate git blob id -> digest map serves
+    --git-metadata runs; blob ids name content, so those never go stale.
+    """
+    
+    VERSION = 1
+    RACY_WINDOW_NS = 2_000_000_000
+    
+    def __init__(self, cache_path: Path):
+        self.cache_path = cache_path
+        self.entries: Dict[str, Dict] = {}
+        self.blobs: Dict[str, str] = {}
+        self.dirty = False
+        self.hits = 0
+        self.misses = 0
+        self._load()
+    
+    def _load(self):
+        """Load the cache, ignoring it if unreadable or written with other settings."""
+        try:
+            with open(self.cache_path, 'r') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if (isinstance(data, dict)
+                and data.get("version") == self.VERSION
+                and data.get("truncate_length") == SHA256_TRUNCATE_LENGTH):
+            self.entries = data.get("files", {})
+            self.blobs = data.get("blobs", {})
+    
+    def lookup(self, rel_path: str, st: os.stat_result) -> Optional[str]:
+        """Return the cached digest if the file is unchanged since it was hashed."""
+        entry = self.entries.get(rel_path)
+        if (entry is not None
+                and entry["size"] == st.st_size
+                and entry["mtime_ns"] == st.st_mtime_ns
+                and entry["inode"] == st.st_ino
+                and entry["mtime_ns"] + self.RACY_WINDOW_NS < entry["hashed_ns"]):
+            self.hits += 1
+            return entry["sha256"]
+        self.misses += 1
+        return None
+    
+    def lookup_blob(self, blob: str) -> Optional[str]:
+        """Return the cached digest for a git blob id."""
+        sha256 = self.blobs.get(blob)
+        if sha256 is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return sha256
+    
+    def store_blob(self, blob: str, sha256: str):
+        """Record the digest of a git blob id."""
+        self.blobs[blob] = sha256
+        self.dirty = True
+    
+    def store(self, rel_path: str, st: os.stat_result, sha256: str, hashed_ns: int):
+        """Record a freshly computed digest."""
+        self.entries[rel_path] = {
+            "size": st.st_size,
+            "mtime_ns": st.st_mtime_ns,
+            "inode": st.st_ino,
+            "hashed_ns": hashed_ns,
+            "sha256": sha256
+        }
+        self.dirty = True
+    
+    def prune(self, live_paths: List[str], live_blobs: Optional[List[str]] = None):
+        """Forget files that no longer exist and, if given, blobs no longer checked out."""
+        live = set(live_paths)
+        for rel_path in [p for p in self.entries if p not in live]:
+            del self.entries[rel_path]
+            self.dirty = True
+        if live_blobs is not None:
+            live = set(live_blobs)
+            for blob in [b for b in self.blobs if b not in live]:
+                del self.blobs[blob]
+                self.dirty = True
+    
+    def save(self):
+        """Atomically write the cache if it changed; failures only warn."""
+        if not self.dirty:
+            return
+        data = {
+            "version": self.VERSION,
+            "truncate_length": SHA256_TRUNCATE_LENGTH,
+            "files": self.entries,
+            "blobs": self.blobs
+        }
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.cache_path.with_name(f"{self.cache_path.name}.{os.getpid()}.tmp")
+            with open(tmp_path, 'w') as f:
+                json.dump(data, f, separators=(",", ":"))
+            os.replace(tmp_path, self.cache_path)
+            self.dirty = False
+        except OSError as e:
+            print(f"WARNING: Could not write hash cache {self.cache_path}: {e}")
+
+
+def read_git_canon_metadata(repo_root: Path) -> Optional[Dict[str, Dict]]:
+    """
+    Read blob ids and last-commit dates for governance/canon/ from git.
+    
+    Uses one `git ls-files -s` call for blob ids, one `git diff` call to find
+    files whose working copy differs from the index, and a single streaming
+    `git log --name-only` pass for dates, which stops as soon as every tracked
+    file has been dated. No canon file is opened or stat'ed.
+    
+    Returns:
+        Mapping of repo-relative path to {"blob", "date", "dirty"}, or None
+        if repo_root is not inside a git work tree
+    """
+    import subprocess
+    canon_rel = "governance/canon"
+    
+    def run_git(*args: str) -> Optional[str]:
+        with TRACE.subprocess(f"git {args[0]}"):
+            result = subprocess.run(
+                ["git", "-c", "core.quotePath=false", *args],
+                cwd=repo_root,
+                capture_output=True,
+                text=True
+            )
+        return result.stdout if result.returncode == 0 else None
+    
+    staged = run_git("ls-files", "-s", "-z", "--", canon_rel)
+    modified = run_git("diff", "--name-only", "-z", "--relative", "--", canon_rel)
+    if staged is None or modified is None:
+        return None
+    
+    git_files = {}
+    unmerged = set()
+    for record in staged.split("\0"):
+        if not record:
+            continue
+        info, path = record.split("\t", 1)
+        _mode, blob, stage = info.split(" ")
+        if stage != "0":
+            unmerged.add(path)
+        else:
+            git_files[path] = {"blob": blob, "date": None, "dirty": False}
+    dirty = unmerged | set(filter(None, modified.split("\0")))
+    for path in dirty:
+        git_files[path] = {"blob": None, "date": None, "dirty": True}
+    
+    undated = {path for path, info in git_files.items() if not info["dirty"]}
+    if not undated:
+        return git_files
+    
+    # Newest commit first, so the first date seen for a path is its last commit
+    with TRACE.subprocess("git log"):
+        process = subprocess.Popen(
+            ["git", "-c", "core.quotePath=false", "log", "--format=%x1e%cs",
+             "--name-only", "--relative", "--", canon_rel],
+            cwd=repo_root,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True
+        )
+        try:
+            date = None
+            for line in process.stdout:
+                line = line.rstrip("\n")
+                if line.startswith("\x1e"):
+                    date = line[1:]
+                elif line in undated:
+                    git_files[line]["date"] = date
+                    undated.discard(line)
+                    if not undated:
+                        break
+        finally:
+            process.kill()
+            process.stdout.close()
+            process.wait()
+    
+    return git_files
+
+
+def load_governance_manifest(manifest_path: Path, repo_root: Path) -> Optional[Dict[str, Dict]]:
+    """
+    Load the file entries of a governance index manifest (.github/scripts/governance_index.py).
+    
+    Only the JSON is read, so this script stays independent of the gate
+    scripts. Returns None if the manifest is unreadable or indexes another tree.
+    """
+    try:
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(data, dict) or data.get("repo_root") != str(repo_root.resolve()):
+        return None
+    return data.get("files")
+
+
+def manifest_hash(manifest: Optional[Dict[str, Dict]], rel_path: str, st: os.stat_result) -> Optional[str]:
+    """Truncated SHA256 for a file from the governance manifest, if its entry is still current."""
+    entry = manifest.get(rel_path) if manifest else None
+    if (entry is None or entry.get("size") != st.st_size or entry.get("mtime_ns") != st.st_mtime_ns
+            or entry["mtime_ns"] + MANIFEST_RACY_WINDOW_NS >= entry.get("checked_ns", 0)):
+        return None
+    return entry["sha256"][:SHA256_TRUNCATE_LENGTH]
+
+
+def scan_local_canons(
+    repo_root: Path,
+    jobs: Optional[int] = None,
+    hash_cache: Optional[HashCache] = None,
+    git_metadata: bool = False,
+    blob_hashes: Optional[Dict[str, str]] = None,
+    manifest: Optional[Dict[str, Dict]] = None
+) -> Dict[str, Dict]:
+    """
+    Scan local governance/canon/ directory for present canons.
+    
+    With git_metadata, clean tracked files take their layered_down_date from
+    their last commit and their hash from the blob id -> sha256 map (the
+    shared blob_hashes dict, then the hash cache), so only files with an
+    unseen blob, local modifications or no git history are read.
+    
+    manifest (from load_governance_manifest) supplies hashes for files whose
+    stat data still matches their governance index entry.
+    """
     local_canon_dir = repo_root / "governance" / "canon"
     local_canons = {}
     
@@ -56,16 +469,77 @@ def scan_local_canons(repo_root: Path) -> Dict[str, Dict]:
         print(f"WARNING: Local canon directory not found at {local_canon_dir}")
         return local_canons
     
-    for canon_file in local_canon_dir.glob("*.md"):
+    canon_files = sorted(local_canon_dir.glob("*.md"))
+    rel_paths = {canon_file: str(canon_file.relative_to(repo_root)) for canon_file in canon_files}
+    
+    TRACE.count("files_scanned", len(canon_files))
+    git_files = {}
+    if git_metadata:
+        with TRACE.span("git-metadata"):
+            git_files = read_git_canon_metadata(repo_root)
+        if git_files is None:
+            print(f"WARNING: Git metadata unavailable for {repo_root}, falling back to file stats")
+            git_files = {}
+    if blob_hashes is None:
+        blob_hashes = {}
+    
+    stats = {}
+    blob_ids = {}
+    commit_dates = {}
+    hashes = {}
+    to_hash = []
+    for canon_file in canon_files:
+        git_file = git_files.get(rel_paths[canon_file])
+        if git_file is not None and not git_file["dirty"]:
+            blob = git_file["blob"]
+            blob_ids[canon_file] = blob
+            if git_file["date"]:
+                commit_dates[canon_file] = git_file["date"]
+            cached = blob_hashes.get(blob)
+            if cached is None and hash_cache is not None:
+                cached = hash_cache.lookup_blob(blob)
+        else:
+            stats[canon_file] = canon_file.stat()
+            cached = manifest_hash(manifest, Path(rel_paths[canon_file]).as_posix(), stats[canon_file])
+            if cached is None and hash_cache is not None:
+                cached = hash_cache.lookup(rel_paths[canon_file], stats[canon_file])
+        if cached is not None:
+            hashes[canon_file] = cached
+        else:
+            to_hash.append(canon_file)
+    
+    TRACE.count("cache_hits", len(canon_files) - len(to_hash))
+    TRACE.count("files_hashed", len(to_hash))
+    
+    # Taken before hashing so edits made while hashing count as racy
+    hashed_ns = time.time_ns()
+    with TRACE.span("hash"):
+        hashes.update(hash_files(to_hash, jobs))
+    
+    for canon_file in to_hash:
+        if canon_file in blob_ids:
+            blob_hashes[blob_ids[canon_file]] = hashes[canon_file]
+            if hash_cache is not None:
+                hash_cache.store_blob(blob_ids[canon_file], hashes[canon_file])
+        elif hash_cache is not None:
+            hash_cache.store(rel_paths[canon_file], stats[canon_file], hashes[canon_file], hashed_ns)
+    if hash_cache is not None:
+        hash_cache.prune(list(rel_paths.values()), list(blob_ids.values()) if git_metadata else None)
+        with TRACE.span("cache-save"):
+            hash_cache.save()
+    
+    for canon_file in canon_files:
         filename = canon_file.name
-        sha256 = calculate_sha256(canon_file)
+        sha256 = hashes[canon_file]
         
-        # Get file modification time for layered_down_date
-        mtime = datetime.fromtimestamp(canon_file.stat().st_mtime)
-        layered_down_date = mtime.strftime("%Y-%m-%d")
+        layered_down_date = commit_dates.get(canon_file)
+        if layered_down_date is None:
+            # Get file modification time for layered_down_date
+            st = stats.get(canon_file) or canon_file.stat()
+            layered_down_date = datetime.fromtimestamp(st.st_mtime).strftime("%Y-%m-%d")
         
         local_canons[filename] = {
-            "path": str(canon_file.relative_to(repo_root)),
+            "path": rel_paths[canon_file],
             "sha256": sha256,
             "layered_down_date": layered_down_date
         }
@@ -153,15 +627,29 @@ def detect_repo_name(repo_root: Path) -> Optional[str]:
 def generate_inventory(
     repo_root: Path,
     governance_source_path: Path,
-    repo_name: Optional[str] = None
+    repo_name: Optional[str] = None,
+    jobs: Optional[int] = None,
+    hash_cache: Optional[HashCache] = None,
+    central_index: Optional[CentralInventory] = None,
+    git_metadata: bool = False,
+    blob_hashes: Optional[Dict[str, str]] = None,
+    manifest: Optional[Dict[str, Dict]] = None
 ) -> Dict:
-    """Generate the governance alignment inventory."""
+    """
+    Generate the governance alignment inventory.
+    
+    Pass central_index (from load_central_inventory) to reuse an already
+    loaded central inventory; governance_source_path is then not read.
+    """
     
     # Load central inventory
-    central_inventory = load_central_inventory(governance_source_path)
+    if central_index is None:
+        with TRACE.span("load-central"):
+            central_index = load_central_inventory(governance_source_path)
     
     # Scan local canons
-    local_canons = scan_local_canons(repo_root)
+    with TRACE.span("scan-local"):
+        local_canons = scan_local_canons(repo_root, jobs, hash_cache, git_metadata, blob_hashes, manifest)
     
     # Determine repository name
     if repo_name is None:
@@ -174,7 +662,7 @@ def generate_inventory(
         "repository": repo_name,
         "last_sync": datetime.now().strftime("%Y-%m-%d"),
         "governance_source": "APGI-cmy/maturion-foreman-governance",
-        "canonical_inventory_version": central_inventory.get("version", "1.0.0"),
+        "canonical_inventory_version": central_index.version,
         "total_canons_required": 0,
         "canons_present": 0,
         "coverage_percentage": 0.0,
@@ -183,19 +671,9 @@ def generate_inventory(
     }
     
     # Process each canon from central inventory
-    for canon in central_inventory.get("canons", []):
-        filename = canon.get("filename", "")
-        
-        # Skip non-canon entries (policy, etc.) or determine if they should be tracked
-        # For now, only track canon type
-        if canon.get("type") != "canon":
-            continue
-        
-        layer_down_status = canon.get("layer_down_status", "OPTIONAL")
-        
-        # Determine if this canon is mandatory for this repository
-        # Uses configurable logic based on repository type
-        mandatory = is_mandatory_for_repo(layer_down_status)
+    for canon in central_index.records:
+        filename = canon.filename
+        mandatory = canon.mandatory
         
         if mandatory:
             inventory["total_canons_required"] += 1
@@ -207,22 +685,22 @@ def generate_inventory(
             inventory["layered_down"].append({
                 "id": filename,
                 "path": local_info["path"],
-                "source_version": canon.get("version", "unknown"),
+                "source_version": canon.version,
                 "layered_down_date": local_info["layered_down_date"],
                 "sha256": local_info["sha256"],
-                "status": determine_status(local_info["sha256"], canon.get("file_hash", ""))
+                "status": determine_status(local_info["sha256"], canon.file_hash)
             })
             
             if mandatory:
                 inventory["canons_present"] += 1
         else:
             # Canon is missing
-            if mandatory or layer_down_status == "PUBLIC_API":
+            if mandatory or canon.layer_down_status == "PUBLIC_API":
                 inventory["missing"].append({
                     "id": filename,
-                    "classification": determine_classification(layer_down_status),
+                    "classification": canon.classification,
                     "mandatory": mandatory,
-                    "priority": determine_priority(layer_down_status, mandatory)
+                    "priority": canon.priority
                 })
     
     # Calculate coverage percentage
@@ -242,6 +720,129 @@ def save_inventory(inventory: Dict, output_path: Path):
     print(f"✓ Inventory saved to {output_path}")
 
 
+def load_previous_inventory(output_path: Path) -> Optional[Dict]:
+    """Load the inventory written by an earlier run, or None if there is no usable one."""
+    try:
+        with open(output_path, 'r') as f:
+            previous = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return previous if isinstance(previous, dict) else None
+
+
+def inventory_content_equal(previous: Optional[Dict], current: Dict) -> bool:
+    """
+    Compare two inventories ignoring last_sync, which changes on every run.
+    
+    A previous inventory without last_sync (hand-edited or from an older
+    version of this script) never compares equal, so it is rewritten in full.
+    """
+    if previous is None or "last_sync" not in previous:
+        return False
+    return (
+        {k: v for k, v in previous.items() if k != "last_sync"}
+        == {k: v for k, v in current.items() if k != "last_sync"}
+    )
+
+
+def compute_inventory_delta(previous: Optional[Dict], current: Dict) -> Dict:
+    """
+    Compute the structured change set between two inventories.
+    
+    Args:
+        previous: Inventory from the last run (None if there was none)
+        current: Freshly generated inventory
+    
+    Returns:
+        Delta with canons added to / removed from layered_down, status changes
+        (MODIFIED <-> UP_TO_DATE), other per-canon field changes, newly missing
+        and resolved missing canons, and coverage before and after
+    """
+    previous = previous or {}
+    # The previous file may be hand-edited or older; entries without an id are ignored
+    old_layered = {c["id"]: c for c in previous.get("layered_down") or [] if isinstance(c, dict) and "id" in c}
+    new_layered = {c["id"]: c for c in current["layered_down"]}
+    old_missing = {c["id"] for c in previous.get("missing") or [] if isinstance(c, dict) and "id" in c}
+    new_missing = {c["id"] for c in current["missing"]}
+    
+    status_changes = []
+    updated = []
+    for canon_id in sorted(old_layered.keys() & new_layered.keys()):
+        old, new = old_layered[canon_id], new_layered[canon_id]
+        if old.get("status") != new["status"]:
+            status_changes.append({"id": canon_id, "from": old.get("status"), "to": new["status"]})
+        fields = sorted(k for k in new.keys() | old.keys() if k != "status" and old.get(k) != new.get(k))
+        if fields:
+            updated.append({"id": canon_id, "fields": fields})
+    
+    old_coverage = previous.get("coverage_percentage")
+    if not isinstance(old_coverage, (int, float)):
+        old_coverage = None
+    delta = {
+        "repository": current["repository"],
+        "previous_sync": previous.get("last_sync"),
+        "current_sync": current["last_sync"],
+        "changed": not inventory_content_equal(previous or None, current),
+        "added": sorted(new_layered.keys() - old_layered.keys()),
+        "removed": sorted(old_layered.keys() - new_layered.keys()),
+        "status_changes": status_changes,
+        "updated": updated,
+        "newly_missing": sorted(new_missing - old_missing),
+        "missing_resolved": sorted(old_missing - new_missing),
+        "coverage": {
+            "previous": old_coverage,
+            "current": current["coverage_percentage"],
+            "change": (round(current["coverage_percentage"] - old_coverage, 2)
+                       if old_coverage is not None else None)
+        },
+        "canons_present": {
+            "previous": previous.get("canons_present"),
+            "current": current["canons_present"]
+        },
+        "total_canons_required": {
+            "previous": previous.get("total_canons_required"),
+            "current": current["total_canons_required"]
+        }
+    }
+    return delta
+
+
+def save_inventory_if_changed(inventory: Dict, output_path: Path, previous: Optional[Dict]) -> bool:
+    """
+    Save the inventory only if it differs from the previous one beyond last_sync.
+    
+    When nothing changed, the previous last_sync is carried over into the
+    inventory so the in-memory result matches the file on disk.
+    
+    Returns:
+        True if the file was written
+    """
+    if inventory_content_equal(previous, inventory):
+        inventory["last_sync"] = previous["last_sync"]
+        print(f"✓ Inventory unchanged, {output_path} left as is")
+        return False
+    save_inventory(inventory, output_path)
+    return True
+
+
+def print_delta_summary(delta: Dict):
+    """Print a short summary of an inventory delta."""
+    if not delta["changed"]:
+        print("DELTA: no changes since last sync")
+        return
+    print("DELTA SINCE LAST SYNC:")
+    print(f"  - Added:           {len(delta['added'])}")
+    print(f"  - Removed:         {len(delta['removed'])}")
+    print(f"  - Status Changes:  {len(delta['status_changes'])}")
+    for change in delta["status_changes"]:
+        print(f"      {change['id']}: {change['from']} -> {change['to']}")
+    print(f"  - Updated:         {len(delta['updated'])}")
+    print(f"  - Newly Missing:   {len(delta['newly_missing'])}")
+    print(f"  - Resolved:        {len(delta['missing_resolved'])}")
+    coverage = delta["coverage"]
+    print(f"  - Coverage:        {coverage['previous']}% -> {coverage['current']}%")
+
+
 def print_compliance_report(inventory: Dict):
     """Print a compliance status report."""
     print("\n" + "="*60)
@@ -276,6 +877,315 @@ def print_compliance_report(inventory: Dict):
     print("="*60 + "\n")
 
 
+def expand_fleet_roots(patterns: List[str]) -> List[Path]:
+    """
+    Expand --fleet arguments into a sorted, de-duplicated list of repo roots.
+    
+    Each argument is either a directory or a glob pattern; glob matches that
+    are not directories are ignored. A literal path that does not exist is
+    kept so it is reported as a failed repository rather than silently dropped.
+    """
+    roots = {}
+    for pattern in patterns:
+        if glob.has_magic(pattern):
+            matches = [Path(m) for m in glob.glob(pattern) if os.path.isdir(m)]
+        else:
+            matches = [Path(pattern)]
+        for match in matches:
+            roots.setdefault(match.resolve(), match)
+    return [roots[key] for key in sorted(roots)]
+
+
+def sync_fleet_repo(
+    repo_root: Path,
+    central_index: CentralInventory,
+    jobs: Optional[int],
+    use_cache: bool,
+    git_metadata: bool,
+    blob_hashes: Dict[str, str],
+    delta: bool = False
+) -> Tuple[Dict, Optional[Dict]]:
+    """
+    Generate and save one repository's inventory for fleet mode.
+    
+    Returns:
+        Tuple of (inventory, delta); delta is None unless requested
+    """
+    if not repo_root.is_dir():
+        raise FileNotFoundError(f"Repository root not found: {repo_root}")
+    
+    hash_cache = HashCache(default_hash_cache_file(repo_root)) if use_cache else None
+    inventory = generate_inventory(
+        repo_root=repo_root,
+        governance_source_path=repo_root,
+        jobs=jobs,
+        hash_cache=hash_cache,
+        central_index=central_index,
+        git_metadata=git_metadata,
+        blob_hashes=blob_hashes
+    )
+    
+    output_path = repo_root / INVENTORY_FILENAME
+    if not delta:
+        with open(output_path, 'w') as f:
+            json.dump(inventory, f, indent=2)
+        return inventory, None
+    
+    previous = load_previous_inventory(output_path)
+    inventory_delta = compute_inventory_delta(previous, inventory)
+    if inventory_delta["changed"]:
+        with open(output_path, 'w') as f:
+            json.dump(inventory, f, indent=2)
+    else:
+        inventory["last_sync"] = previous["last_sync"]
+        inventory_delta["current_sync"] = previous["last_sync"]
+    return inventory, inventory_delta
+
+
+def validate_fleet_reports(
+    repo_roots: List[Path],
+    governance_source: Path,
+    jobs: Optional[int],
+    use_cache: bool
+) -> Dict:
+    """
+    Validate the governance reports of every repository in one parallel pass.
+    
+    The central report schemas are compiled once per worker process and
+    results are cached across runs in the working directory.
+    
+    Returns:
+        Dict with "schemas", "summary" (whole fleet) and "repositories"
+        (repo_root -> summary plus its invalid report files)
+    """
+    import validate_governance_reports as reports
+    from schema_validation import ResultCache, SchemaError
+    
+    try:
+        schemas, schema_digest = reports.load_report_schemas(governance_source)
+    except (SchemaError, OSError) as e:
+        print(f"ERROR: {e}")
+        sys.exit(1)
+    
+    owners: Dict[str, Path] = {}
+    files = []
+    for repo_root in repo_roots:
+        for file_path, kind in reports.iter_report_files([str(repo_root / d) for d in reports.DEFAULT_PATHS]):
+            owners[file_path] = repo_root
+            files.append((file_path, kind))
+    
+    cache = ResultCache(reports.CACHE_FILENAME if use_cache else None, schema_digest)
+    results, cached = reports.validate_reports(files, schemas, jobs or os.cpu_count() or 1, cache)
+    try:
+        cache.save([file_path for file_path, _ in files])
+    except OSError as e:
+        print(f"Warning: could not write report result cache {reports.CACHE_FILENAME}: {e}")
+    TRACE.count("reports_validated", len(files) - cached)
+    
+    by_repo: Dict[Path, Dict[str, Dict]] = {repo_root: {} for repo_root in repo_roots}
+    for file_path, result in results.items():
+        by_repo[owners[file_path]][file_path] = result
+    repositories = {}
+    for repo_root, repo_results in by_repo.items():
+        summary = reports.summarize(repo_results)
+        summary["invalid_files"] = [
+            {"file": file_path, "invalid_reports": result["invalid"], "violations": result["violations"],
+             "error": result.get("error"), "first_violations": result["violations_list"][:FLEET_REPORT_VIOLATIONS]}
+            for file_path, result in repo_results.items() if result["invalid"] or "error" in result
+        ]
+        repositories[repo_root] = summary
+    
+    return {
+        "schemas": {kind: schema.name for kind, schema in schemas.items()},
+        "summary": dict(reports.summarize(results), cached_files=cached),
+        "repositories": repositories
+    }
+
+
+def build_fleet_report(
+    central_index: CentralInventory,
+    results: List[Dict],
+    report_validation: Optional[Dict] = None
+) -> Dict:
+    """
+    Aggregate per-repository inventories into one fleet coverage report.
+    
+    Args:
+        central_index: Central inventory from load_central_inventory()
+        results: One dict per repository with "repo_root" and either
+            "inventory" or "error"
+        report_validation: Result of validate_fleet_reports(), if requested
+    """
+    repositories = []
+    missing_by_canon: Dict[str, List[str]] = {}
+    coverages = []
+    
+    for result in results:
+        entry = {"repo_root": str(result["repo_root"])}
+        if report_validation is not None:
+            entry["reports"] = report_validation["repositories"][result["repo_root"]]
+        inventory = result.get("inventory")
+        if inventory is None:
+            entry["error"] = result["error"]
+            repositories.append(entry)
+            continue
+        
+        if result.get("delta") is not None:
+            entry["changed"] = result["delta"]["changed"]
+        entry.update({
+            "repository": inventory["repository"],
+            "output": str(result["repo_root"] / INVENTORY_FILENAME),
+            "total_canons_required": inventory["total_canons_required"],
+            "canons_present": inventory["canons_present"],
+            "coverage_percentage": inventory["coverage_percentage"],
+            "layered_down": len(inventory["layered_down"]),
+            "modified": sum(1 for c in inventory["layered_down"] if c["status"] == "MODIFIED"),
+            "missing": len(inventory["missing"])
+        })
+        repositories.append(entry)
+        coverages.append(inventory["coverage_percentage"])
+        
+        for missing in inventory["missing"]:
+            missing_by_canon.setdefault(missing["id"], []).append(str(result["repo_root"]))
+    
+    report = {
+        "generated": datetime.now().strftime("%Y-%m-%d"),
+        "governance_source": "APGI-cmy/maturion-foreman-governance",
+        "canonical_inventory_version": central_index.version,
+        "total_repositories": len(results),
+        "repositories_synced": len(coverages),
+        "repositories_failed": len(results) - len(coverages),
+        "fully_aligned": sum(1 for c in coverages if c >= 100),
+        "average_coverage_percentage": round(sum(coverages) / len(coverages), 2) if coverages else 0.0,
+        "repositories": repositories,
+        "missing_by_canon": {canon: sorted(repos) for canon, repos in sorted(missing_by_canon.items())}
+    }
+    if report_validation is not None:
+        report["report_validation"] = {
+            "schemas": report_validation["schemas"],
+            "summary": report_validation["summary"]
+        }
+    return report
+
+
+def print_fleet_report(report: Dict):
+    """Print a one-line-per-repository fleet coverage summary."""
+    print("\n" + "="*60)
+    print("GOVERNANCE ALIGNMENT INVENTORY - FLEET REPORT")
+    print("="*60)
+    print(f"Central Version:   {report['canonical_inventory_version']}")
+    print(f"Repositories:      {report['total_repositories']} "
+          f"({report['repositories_synced']} synced, {report['repositories_failed']} failed)")
+    print(f"Fully Aligned:     {report['fully_aligned']}")
+    print(f"Average Coverage:  {report['average_coverage_percentage']}%")
+    print("-"*60)
+    for entry in report["repositories"]:
+        if "error" in entry:
+            print(f"  ✗ {entry['repo_root']}: ERROR {entry['error']}")
+        else:
+            marker = "✓" if entry["coverage_percentage"] >= 100 else "⚠"
+            print(f"  {marker} {entry['repository']} ({entry['repo_root']}): "
+                  f"{entry['coverage_percentage']}% coverage, "
+                  f"{entry['missing']} missing, {entry['modified']} modified")
+        if "reports" in entry:
+            reports = entry["reports"]
+            marker = "✗" if reports["invalid_reports"] or reports["file_errors"] else " "
+            print(f"    {marker} reports: {reports['reports']} in {reports['files']} files, "
+                  f"{reports['invalid_reports']} invalid")
+            for invalid in reports["invalid_files"]:
+                print(f"      - {invalid['file']}: {invalid['error'] or str(invalid['violations']) + ' violations'}")
+    if "report_validation" in report:
+        summary = report["report_validation"]["summary"]
+        print("-"*60)
+        print(f"Reports:           {summary['reports']} in {summary['files']} files "
+              f"({summary['cached_files']} unchanged, from cache)")
+        print(f"Invalid Reports:   {summary['invalid_reports']}")
+        for kind, counts in summary["by_kind"].items():
+            statuses = ", ".join(f"{status} {count}" for status, count in counts["statuses"].items()) or "-"
+            print(f"  {kind}: {counts['reports']} reports, {counts['invalid_reports']} invalid ({statuses})")
+    print("="*60 + "\n")
+
+
+def run_fleet(args: argparse.Namespace):
+    """Sync every repository in --fleet against one loaded central inventory."""
+    repo_roots = expand_fleet_roots(args.fleet)
+    if not repo_roots:
+        print("ERROR: --fleet did not match any repository roots")
+        sys.exit(1)
+    
+    central_index = load_central_inventory(args.governance_source)
+    fleet_jobs = args.fleet_jobs or min(FLEET_MAX_WORKERS, len(repo_roots))
+    # Parallelism comes from the fleet pool; hash each repo's files sequentially
+    # unless --jobs asks for more, so worker count stays bounded by fleet_jobs
+    hash_jobs = args.jobs or 1
+    
+    print(f"Governance Source: {args.governance_source}")
+    print(f"Repositories:      {len(repo_roots)}")
+    print(f"Fleet Workers:     {fleet_jobs}")
+    print(f"Fleet Report:      {args.fleet_report}")
+    print()
+    
+    # Repositories usually share most canon blobs, so each is hashed once per run
+    blob_hashes: Dict[str, str] = {}
+    results = {}
+    with ThreadPoolExecutor(max_workers=fleet_jobs) as pool:
+        futures = {
+            pool.submit(sync_fleet_repo, repo_root, central_index, hash_jobs,
+                        not args.no_cache, args.git_metadata, blob_hashes, args.delta): repo_root
+            for repo_root in repo_roots
+        }
+        for future in as_completed(futures):
+            repo_root = futures[future]
+            try:
+                inventory, delta = future.result()
+                results[repo_root] = {"repo_root": repo_root, "inventory": inventory, "delta": delta}
+            except (OSError, ValueError) as e:
+                results[repo_root] = {"repo_root": repo_root, "error": str(e)}
+    
+    report_validation = None
+    if args.validate_reports:
+        with TRACE.span("report-validation"):
+            report_validation = validate_fleet_reports(repo_roots, args.governance_source, args.jobs,
+                                                       not args.no_cache)
+    
+    ordered = [results[repo_root] for repo_root in repo_roots]
+    report = build_fleet_report(central_index, ordered, report_validation)
+    with open(args.fleet_report, 'w') as f:
+        json.dump(report, f, indent=2)
+    print(f"✓ Fleet report saved to {args.fleet_report}")
+    
+    if args.delta_output:
+        # Only changed repositories are listed, so the file stays small for dashboards
+        deltas = [r["delta"] for r in ordered if r.get("delta") and r["delta"]["changed"]]
+        with open(args.delta_output, 'w') as f:
+            json.dump({
+                "generated": datetime.now().strftime("%Y-%m-%d"),
+                "repositories_checked": report["repositories_synced"],
+                "repositories_changed": len(deltas),
+                "deltas": deltas
+            }, f, indent=2)
+        print(f"✓ Fleet delta saved to {args.delta_output} ({len(deltas)} changed)")
+    
+    print_fleet_report(report)
+    
+    if report["repositories_failed"]:
+        print("ERROR: One or more repositories could not be synced")
+        sys.exit(1)
+    if report_validation is not None:
+        summary = report_validation["summary"]
+        if summary["invalid_reports"] or summary["file_errors"]:
+            print("ERROR: One or more governance reports failed schema validation")
+            sys.exit(1)
+    if report["fully_aligned"] < report["repositories_synced"]:
+        print("⚠ WARNING: Governance alignment is incomplete for one or more repositories")
+        if args.strict:
+            print("ERROR: --strict mode enabled, failing due to incomplete coverage")
+            sys.exit(1)
+        sys.exit(0)
+    print("✓ SUCCESS: Full governance alignment achieved across the fleet")
+    sys.exit(0)
+
+
 def main():
     """Main entry point."""
     parser = argparse.ArgumentParser(
@@ -307,17 +1217,118 @@ def main():
         action="store_true",
         help="Fail with exit code 1 if coverage is below 100% (useful for CI enforcement)"
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        help="Worker threads for hashing canon files (default: automatic, 1 = sequential)"
+    )
+    parser.add_argument(
+        "--cache-file",
+        type=Path,
+        help=f"Hash cache sidecar location (default: a per-repository file in {HASH_CACHE_DIR})"
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Hash every canon file without reading or writing the hash cache"
+    )
+    parser.add_argument(
+        "--git-metadata",
+        action="store_true",
+        help="Take blob ids and last-commit dates from git instead of reading and stat'ing every canon file"
+    )
+    parser.add_argument(
+        "--manifest",
+        type=Path,
+        help="Governance index manifest (.github/scripts/governance_index.py) to take canon hashes from"
+    )
+    parser.add_argument(
+        "--timings",
+        action="store_true",
+        help="Print per-phase timings and counters to stderr on exit"
+    )
+    parser.add_argument(
+        "--trace",
+        type=Path,
+        metavar="FILE",
+        help="Append this run's phase spans and counters to FILE as one JSON line"
+    )
+    parser.add_argument(
+        "--profile",
+        type=Path,
+        metavar="FILE",
+        help="Write cProfile statistics of the run to FILE (view with python -m pstats)"
+    )
+    parser.add_argument(
+        "--delta",
+        action="store_true",
+        help="Compare with the previous inventory and rewrite it only if its content changed"
+    )
+    parser.add_argument(
+        "--delta-output",
+        type=Path,
+        help="Write the change set since the previous inventory as JSON (implies --delta)"
+    )
+    parser.add_argument(
+        "--fleet",
+        nargs="+",
+        metavar="REPO_ROOT_OR_GLOB",
+        help="Sync many repositories in one run; each gets <root>/GOVERNANCE_ALIGNMENT_INVENTORY.json"
+    )
+    parser.add_argument(
+        "--fleet-report",
+        type=Path,
+        default=Path("FLEET_ALIGNMENT_REPORT.json"),
+        help="Output path for the aggregated fleet coverage report (default: FLEET_ALIGNMENT_REPORT.json)"
+    )
+    parser.add_argument(
+        "--fleet-jobs",
+        type=int,
+        help=f"Repositories synced concurrently in fleet mode (default: up to {FLEET_MAX_WORKERS})"
+    )
+    parser.add_argument(
+        "--validate-reports",
+        action="store_true",
+        help="In fleet mode, also validate each repository's .qa/ QA and compliance reports against the central schemas"
+    )
     
     args = parser.parse_args()
     
+    if args.timings or args.trace or args.profile:
+        TRACE.enable("sync_repo_inventory", args.timings, args.trace, args.profile)
+    
+    if args.delta_output:
+        args.delta = True
+    
     # Set governance source path
     if args.governance_source is None:
         # Assume we're in the governance repo itself or it's the same as repo-root
         args.governance_source = args.repo_root
     
+    if args.validate_reports and not args.fleet:
+        parser.error("--validate-reports requires --fleet; use validate_governance_reports.py for one repository")
+    
+    if args.fleet:
+        if args.repo_name or args.output or args.cache_file or args.manifest:
+            parser.error("--repo-name, --output, --cache-file and --manifest apply to a single repository and cannot be used with --fleet")
+        with TRACE.span("fleet"):
+            run_fleet(args)
+    
     # Set output path
     if args.output is None:
-        args.output = args.repo_root / "GOVERNANCE_ALIGNMENT_INVENTORY.json"
+        args.output = args.repo_root / INVENTORY_FILENAME
+    
+    hash_cache = None
+    if not args.no_cache:
+        with TRACE.span("cache-load"):
+            hash_cache = HashCache(args.cache_file or default_hash_cache_file(args.repo_root))
+    
+    manifest = None
+    if args.manifest:
+        with TRACE.span("manifest-load"):
+            manifest = load_governance_manifest(args.manifest, args.repo_root)
+        if manifest is None:
+            print(f"WARNING: Governance index {args.manifest} is unreadable or for another tree, hashing files directly")
     
     print(f"Repo Root:         {args.repo_root}")
     print(f"Governance Source: {args.governance_source}")
@@ -325,17 +1336,36 @@ def main():
     print()
     
     # Generate inventory
-    inventory = generate_inventory(
-        repo_root=args.repo_root,
-        governance_source_path=args.governance_source,
-        repo_name=args.repo_name
-    )
+    with TRACE.span("generate"):
+        inventory = generate_inventory(
+            repo_root=args.repo_root,
+            governance_source_path=args.governance_source,
+            repo_name=args.repo_name,
+            jobs=args.jobs,
+            hash_cache=hash_cache,
+            git_metadata=args.git_metadata,
+            manifest=manifest
+        )
     
     # Save inventory
-    save_inventory(inventory, args.output)
+    with TRACE.span("write"):
+        if args.delta:
+            previous = load_previous_inventory(args.output)
+            delta = compute_inventory_delta(previous, inventory)
+            save_inventory_if_changed(inventory, args.output, previous)
+            delta["current_sync"] = inventory["last_sync"]
+            if args.delta_output:
+                with open(args.delta_output, 'w') as f:
+                    json.dump(delta, f, indent=2)
+                print(f"✓ Delta saved to {args.delta_output}")
+        else:
+            save_inventory(inventory, args.output)
     
     # Print compliance report
     print_compliance_report(inventory)
+    if args.delta:
+        print_delta_summary(delta)
+        print()
     
     # Exit with appropriate code
     if inventory['coverage_percentage'] < 100:
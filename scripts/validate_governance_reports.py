@@ -0,0 +1,336 @@
+#!/usr/bin/env python3
+"""
+Governance Report Validator
+
+Validates Builder QA reports and governance compliance reports in bulk against
+governance/schemas/BUILD_QA_REPORT.schema.json and
+GOVERNANCE_COMPLIANCE_REPORT.schema.json. The schema for a file is chosen by
+its name: BUILD_QA_REPORT*.json(l) and GOVERNANCE_COMPLIANCE_REPORT*.json(l),
+e.g. .qa/builder/BUILD_QA_REPORT.json or an archive BUILD_QA_REPORT-2026.jsonl.
+
+Both schemas are compiled once per worker process (see schema_validation.py).
+Report files are streamed: a .json file holds one report or a top-level array
+of reports, a .jsonl archive one report per line. Files are validated in
+worker processes and per-file results are cached in
+.cache/validate_governance_reports.json, so unchanged reports are not read
+again; editing either schema invalidates the cache.
+
+The summary aggregates report counts, invalid reports and the reported
+build_status / compliance_status values per report kind. Fleet runs of
+sync_repo_inventory.py use the same pipeline (--validate-reports).
+
+Usage:
+    python scripts/validate_governance_reports.py [PATH ...] [--governance-source PATH]
+                                                  [--jobs N] [--cache-file PATH | --no-cache]
+                                                  [--json PATH|-]
+
+Exit Codes:
+  0 = every report valid (or no reports found)
+  1 = at least one report is invalid or a file could not be read
+  2 = schema missing, invalid or not supported by what is installed
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from schema_validation import CompiledSchema, ResultCache, SchemaError, iter_json_entries
+
+SCHEMAS_DIR = 'governance/schemas'
+
+# Report kind (file name prefix) -> (schema file, field summarized per kind)
+REPORT_KINDS = {
+    'BUILD_QA_REPORT': ('BUILD_QA_REPORT.schema.json', 'build_status'),
+    'GOVERNANCE_COMPLIANCE_REPORT': ('GOVERNANCE_COMPLIANCE_REPORT.schema.json', 'compliance_status'),
+}
+
+DEFAULT_PATHS = ['.qa']
+CACHE_FILENAME = '.cache/validate_governance_reports.json'
+REPORT_SUFFIXES = ('.json', '.jsonl')
+
+# Stored per file; the count of violations beyond this is still reported
+MAX_VIOLATIONS_PER_FILE = 1000
+
+# Below this many files, worker startup costs more than it saves
+PARALLEL_MIN_FILES = 8
+
+# Compiled in each worker process by _init_worker
+_SCHEMAS: Dict[str, CompiledSchema] = {}
+
+
+def _init_worker(schemas: Dict[str, Tuple[Dict, str]]):
+    global _SCHEMAS
+    _SCHEMAS = {kind: CompiledSchema(schema, name) for kind, (schema, name) in schemas.items()}
+
+
+def report_kind(file_name: str) -> Optional[str]:
+    """Report kind of a file name, or None if it is not a report (schemas included)"""
+    if not file_name.endswith(REPORT_SUFFIXES) or file_name.endswith('.schema.json'):
+        return None
+    for kind in REPORT_KINDS:
+        if file_name.startswith(kind):
+            return kind
+    return None
+
+
+def iter_report_files(paths: List[str]) -> Iterator[Tuple[str, str]]:
+    """(path, kind) of every report under the given files/directories, sorted"""
+    found = {}
+    for path in paths:
+        if os.path.isfile(path):
+            kind = report_kind(os.path.basename(path))
+            if kind:
+                found[path] = kind
+            continue
+        for dirpath, dirs, files in os.walk(path):
+            dirs[:] = [d for d in dirs if d not in ('.git', 'node_modules')]
+            for name in files:
+                kind = report_kind(name)
+                if kind:
+                    found[os.path.join(dirpath, name)] = kind
+    for file_path in sorted(found):
+        yield file_path, found[file_path]
+
+
+def load_report_schemas(governance_source: Path) -> Tuple[Dict[str, CompiledSchema], str]:
+    """
+    Compile the report schemas of a governance repository.
+    
+    Returns ({kind: schema}, digest of all schema files) - the digest keys the
+    result cache. Raises SchemaError if a schema is missing or unusable.
+    """
+    schemas = {}
+    digest = hashlib.sha256()
+    for kind, (file_name, _) in sorted(REPORT_KINDS.items()):
+        schema_path = Path(governance_source) / SCHEMAS_DIR / file_name
+        schemas[kind] = CompiledSchema.load(str(schema_path))
+        with open(schema_path, 'rb') as f:
+            digest.update(hashlib.sha256(f.read()).digest())
+    return schemas, digest.hexdigest()
+
+
+def validate_report_file(job: Tuple[str, str]) -> Dict:
+    """Validate every report in one file (runs in worker processes)"""
+    file_path, kind = job
+    schema = _SCHEMAS[kind]
+    status_field = REPORT_KINDS[kind][1]
+    result = {'kind': kind, 'entries': 0, 'invalid': 0, 'violations': 0, 'statuses': {}}
+    violations: List[Dict] = []
+    
+    def record(offset, path, message):
+        result['violations'] += 1
+        if len(violations) < MAX_VIOLATIONS_PER_FILE:
+            violations.append({'offset': offset, 'path': path, 'message': message})
+    
+    try:
+        for offset, report, error in iter_json_entries(file_path):
+            result['entries'] += 1
+            if error is not None:
+                result['invalid'] += 1
+                record(offset, '$', error)
+                continue
+            problems = schema.violations(report)
+            if problems:
+                result['invalid'] += 1
+                for path, message in problems:
+                    record(offset, path, message)
+                continue
+            status = str(report.get(status_field))
+            result['statuses'][status] = result['statuses'].get(status, 0) + 1
+    except (OSError, ValueError) as e:
+        result['error'] = f"Error reading {file_path}: {e}"
+    result['violations_list'] = violations
+    return result
+
+
+def validate_reports(files: List[Tuple[str, str]], schemas: Dict[str, CompiledSchema], jobs: int,
+                     cache: ResultCache) -> Tuple[Dict[str, Dict], int]:
+    """
+    Validate report files, reusing cached results for unchanged ones.
+    
+    Returns ({path: result}, number of files served from the cache).
+    """
+    results: Dict[str, Dict] = {}
+    work: List[Tuple[str, str]] = []
+    stats: Dict[str, Tuple[os.stat_result, int]] = {}
+    cached = 0
+    
+    for file_path, kind in files:
+        try:
+            st = os.stat(file_path)
+        except OSError as e:
+            results[file_path] = {'kind': kind, 'entries': 0, 'invalid': 0, 'violations': 0, 'statuses': {},
+                                  'error': f"Error reading {file_path}: {e}", 'violations_list': []}
+            continue
+        hit = cache.lookup(file_path, st)
+        if hit is not None:
+            results[file_path] = hit
+            cached += 1
+            continue
+        stats[file_path] = (st, time.time_ns())
+        work.append((file_path, kind))
+    
+    initargs = ({kind: (schema.schema, schema.name) for kind, schema in schemas.items()},)
+    if jobs <= 1 or len(work) < PARALLEL_MIN_FILES:
+        _init_worker(*initargs)
+        outputs = list(map(validate_report_file, work))
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker, initargs=initargs) as pool:
+            outputs = list(pool.map(validate_report_file, work, chunksize=max(1, len(work) // (jobs * 4))))
+    
+    for (file_path, _), result in zip(work, outputs):
+        results[file_path] = result
+        if 'error' not in result:
+            st, checked_ns = stats[file_path]
+            cache.store(file_path, st, checked_ns, result)
+    
+    return {path: results[path] for path, _ in files if path in results}, cached
+
+
+def summarize(results: Dict[str, Dict]) -> Dict:
+    """Aggregate per-file results: totals plus report counts and statuses per kind"""
+    summary = {'files': len(results), 'reports': 0, 'invalid_reports': 0, 'violations': 0,
+               'file_errors': 0, 'by_kind': {}}
+    for result in results.values():
+        summary['reports'] += result['entries']
+        summary['invalid_reports'] += result['invalid']
+        summary['violations'] += result['violations']
+        summary['file_errors'] += 'error' in result
+        kind = summary['by_kind'].setdefault(result['kind'], {'files': 0, 'reports': 0, 'invalid_reports': 0,
+                                                              'statuses': {}})
+        kind['files'] += 1
+        kind['reports'] += result['entries']
+        kind['invalid_reports'] += result['invalid']
+        for status, count in result['statuses'].items():
+            kind['statuses'][status] = kind['statuses'].get(status, 0) + count
+    for kind in summary['by_kind'].values():
+        kind['statuses'] = dict(sorted(kind['statuses'].items()))
+    summary['by_kind'] = dict(sorted(summary['by_kind'].items()))
+    return summary
+
+
+def print_violations(results: Dict[str, Dict]):
+    """Print the violations of every invalid or unreadable report file"""
+    for file_path, result in results.items():
+        if 'error' in result:
+            print(f"❌ {result['error']}")
+        if result['violations_list']:
+            print(f"\n❌ {file_path}: {result['invalid']} invalid of {result['entries']} reports")
+            for violation in result['violations_list']:
+                print(f"  {violation['offset']}: {violation['path']}: {violation['message']}")
+            hidden = result['violations'] - len(result['violations_list'])
+            if hidden > 0:
+                print(f"  ... {hidden} more violations not shown")
+
+
+def print_summary(summary: Dict, cached: int, elapsed: float):
+    print(f"\n{'=' * 60}")
+    print("GOVERNANCE REPORT VALIDATION SUMMARY")
+    print('=' * 60)
+    print(f"Files: {summary['files']} ({cached} unchanged, from cache)")
+    print(f"Reports: {summary['reports']}  Invalid: {summary['invalid_reports']}  "
+          f"Violations: {summary['violations']}")
+    for kind, counts in summary['by_kind'].items():
+        statuses = ', '.join(f"{status} {count}" for status, count in counts['statuses'].items()) or '-'
+        print(f"  {kind}: {counts['reports']} reports in {counts['files']} files, "
+              f"{counts['invalid_reports']} invalid ({statuses})")
+    print(f"Time: {elapsed:.2f}s")
+    print('=' * 60)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Validate Builder QA and governance compliance reports against the governance schemas'
+    )
+    parser.add_argument(
+        'paths',
+        nargs='*',
+        metavar='PATH',
+        help=f'Report files or directories to scan (default: {", ".join(DEFAULT_PATHS)})'
+    )
+    parser.add_argument(
+        '--governance-source',
+        type=Path,
+        default=Path('.'),
+        help=f'Governance repository holding {SCHEMAS_DIR}/ (default: current directory)'
+    )
+    parser.add_argument(
+        '--jobs',
+        type=int,
+        default=None,
+        help='Worker processes (default: CPU count; 1 validates in-process)'
+    )
+    cache_group = parser.add_mutually_exclusive_group()
+    cache_group.add_argument(
+        '--cache-file',
+        default=CACHE_FILENAME,
+        help=f'Result cache location (default: {CACHE_FILENAME})'
+    )
+    cache_group.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Validate every file without reading or writing the result cache'
+    )
+    parser.add_argument(
+        '--json',
+        metavar='PATH',
+        help="Write the summary and violations as JSON to PATH ('-' for stdout)"
+    )
+    
+    args = parser.parse_args()
+    
+    try:
+        schemas, schema_digest = load_report_schemas(args.governance_source)
+    except (SchemaError, OSError) as e:
+        print(f"❌ {e}")
+        sys.exit(2)
+    
+    start = time.perf_counter()
+    files = list(iter_report_files(args.paths or DEFAULT_PATHS))
+    if not files:
+        print(f"No governance reports found under {', '.join(args.paths or DEFAULT_PATHS)}")
+        sys.exit(0)
+    
+    cache = ResultCache(None if args.no_cache else args.cache_file, schema_digest)
+    results, cached = validate_reports(files, schemas, args.jobs or os.cpu_count() or 1, cache)
+    try:
+        cache.save([path for path, _ in files])
+    except OSError as e:
+        print(f"Warning: could not write result cache {args.cache_file}: {e}", file=sys.stderr)
+    summary = summarize(results)
+    elapsed = time.perf_counter() - start
+    
+    stdout = sys.stdout
+    if args.json == '-':
+        # Keep stdout pure JSON; the readable report goes to stderr
+        sys.stdout = sys.stderr
+    print_violations(results)
+    print_summary(summary, cached, elapsed)
+    sys.stdout = stdout
+    
+    if args.json:
+        report = {
+            'schemas': {kind: schema.name for kind, schema in schemas.items()},
+            'summary': summary,
+            'files': results,
+        }
+        if args.json == '-':
+            print(json.dumps(report, indent=2))
+        else:
+            with open(args.json, 'w', encoding='utf-8') as f:
+                json.dump(report, f, indent=2)
+                f.write('\n')
+    
+    failed = summary['invalid_reports'] or summary['file_errors']
+    print(f"\n{'❌ FAIL' if failed else '✅ PASS'}", file=sys.stderr if args.json == '-' else sys.stdout)
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,365 @@
+#!/usr/bin/env python3
+"""
+Tenant Memory Validator
+
+Validates tenant memory entries against memory/TENANT/_SCHEMA/tenant-memory.schema.json
+in bulk. The schema is compiled once per process (see schema_validation.py) and
+entries are streamed from .json files (one entry or a top-level array of entries)
+and .jsonl files (one entry per line), so files of any size are validated without
+loading them whole. Files are validated in worker processes; large JSON Lines
+files are split into byte ranges so a single bulk-ingest file uses every worker.
+
+Results are cached per file in .cache/validate_tenant_memory.json: files whose
+size and mtime are unchanged since the last run (and outside the 2 second racy
+window) are not read again. Editing the schema invalidates the whole cache.
+
+Usage:
+    python scripts/validate_tenant_memory.py [PATH ...] [--schema PATH]
+                                             [--jobs N] [--cache-file PATH | --no-cache]
+                                             [--json PATH|-]
+
+Exit Codes:
+  0 = every entry valid (or no memory files found)
+  1 = at least one entry is invalid or a file could not be read
+  2 = schema missing, invalid or not supported by what is installed
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import time
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from schema_validation import CompiledSchema, ResultCache, SchemaError, iter_json_entries
+
+DEFAULT_SCHEMA = 'memory/TENANT/_SCHEMA/tenant-memory.schema.json'
+DEFAULT_PATHS = ['memory/TENANT']
+CACHE_FILENAME = '.cache/validate_tenant_memory.json'
+ENTRY_SUFFIXES = ('.json', '.jsonl')
+
+# Stored per file; the count of violations beyond this is still reported
+MAX_VIOLATIONS_PER_FILE = 1000
+
+# JSON Lines files above this size are validated as several byte ranges
+SPLIT_MIN_BYTES = 8 * 1024 * 1024
+
+# Below this many jobs, worker startup costs more than it saves
+PARALLEL_MIN_JOBS = 4
+
+# Compiled in each worker process by _init_worker
+_SCHEMA: Optional[CompiledSchema] = None
+
+
+def _init_worker(schema: Dict, name: str):
+    global _SCHEMA
+    _SCHEMA = CompiledSchema(schema, name)
+
+
+def iter_memory_files(paths: List[str], exclude: List[str]) -> Iterator[str]:
+    """Entry files under the given files/directories, sorted, skipping _SCHEMA directories and exclude"""
+    excluded = {os.path.realpath(path) for path in exclude if path}
+    found = set()
+    for path in paths:
+        if os.path.isfile(path):
+            found.add(path)
+            continue
+        for dirpath, dirs, files in os.walk(path):
+            dirs[:] = [d for d in dirs if d != '_SCHEMA']
+            for name in files:
+                if name.endswith(ENTRY_SUFFIXES):
+                    found.add(os.path.join(dirpath, name))
+    for file_path in sorted(found):
+        if os.path.realpath(file_path) not in excluded:
+            yield file_path
+
+
+def split_jsonl(file_path: str, size: int, parts: int) -> List[Tuple[int, int]]:
+    """Byte ranges of roughly size/parts, each ending just after a newline"""
+    ranges = []
+    start = 0
+    step = max(SPLIT_MIN_BYTES // 2, size // parts)
+    with open(file_path, 'rb') as f:
+        while start < size:
+            end = start + step
+            if end >= size:
+                end = size
+            else:
+                f.seek(end)
+                f.readline()
+                end = min(f.tell(), size)
+            ranges.append((start, end))
+            start = end
+    return ranges
+
+
+def _violation(violations: List[Dict], counts: Dict, offset: str, path: str, message: str):
+    counts['violations'] += 1
+    if len(violations) < MAX_VIOLATIONS_PER_FILE:
+        violations.append({'offset': offset, 'path': path, 'message': message})
+
+
+def validate_range(job: Tuple[str, int, int]) -> Dict:
+    """
+    Validate the JSON Lines entries in bytes [start, end) of a file (runs in worker processes).
+    
+    Line numbers in the result are relative to the range; 'lines' is the
+    number of lines it spans, so ranges can be stitched back together.
+    """
+    file_path, start, end = job
+    counts = {'entries': 0, 'invalid': 0, 'violations': 0}
+    violations: List[Dict] = []
+    lines = 0
+    try:
+        with open(file_path, 'rb') as f:
+            f.seek(start)
+            remaining = end - start
+            while remaining > 0:
+                raw = f.readline(remaining)
+                if not raw:
+                    break
+                remaining -= len(raw)
+                lines += 1
+                text = raw.decode('utf-8', errors='replace')
+                if not text.strip():
+                    continue
+                counts['entries'] += 1
+                try:
+                    entry = json.loads(text)
+                except ValueError as e:
+                    counts['invalid'] += 1
+                    _violation(violations, counts, f"line {lines}", '$', f"Invalid JSON: {e}")
+                    continue
+                problems = _SCHEMA.violations(entry)
+                if problems:
+                    counts['invalid'] += 1
+                    for path, message in problems:
+                        _violation(violations, counts, f"line {lines}", path, message)
+    except OSError as e:
+        return dict(counts, lines=lines, error=f"Error reading {file_path}: {e}", violations_list=violations)
+    return dict(counts, lines=lines, violations_list=violations)
+
+
+def validate_file(file_path: str) -> Dict:
+    """Validate every entry of one .json or .jsonl file (runs in worker processes)"""
+    counts = {'entries': 0, 'invalid': 0, 'violations': 0}
+    violations: List[Dict] = []
+    try:
+        for offset, entry, error in iter_json_entries(file_path):
+            counts['entries'] += 1
+            if error is not None:
+                counts['invalid'] += 1
+                _violation(violations, counts, offset, '$', error)
+                continue
+            problems = _SCHEMA.violations(entry)
+            if problems:
+                counts['invalid'] += 1
+                for path, message in problems:
+                    _violation(violations, counts, offset, path, message)
+    except (OSError, ValueError) as e:
+        return dict(counts, error=f"Error reading {file_path}: {e}", violations_list=violations)
+    return dict(counts, violations_list=violations)
+
+
+def _run_job(job: Tuple) -> Dict:
+    return validate_file(job[0]) if job[1] is None else validate_range(job)
+
+
+def merge_ranges(results: List[Dict]) -> Dict:
+    """Stitch the results of consecutive byte ranges of one file, making line offsets absolute"""
+    merged = {'entries': 0, 'invalid': 0, 'violations': 0}
+    violations: List[Dict] = []
+    base = 0
+    for result in results:
+        for key in merged:
+            merged[key] += result[key]
+        if 'error' in result:
+            merged.setdefault('error', result['error'])
+        for violation in result['violations_list']:
+            if len(violations) < MAX_VIOLATIONS_PER_FILE:
+                line = int(violation['offset'].split()[1]) + base
+                violations.append(dict(violation, offset=f"line {line}"))
+        base += result['lines']
+    return dict(merged, violations_list=violations)
+
+
+def validate_paths(files: List[str], schema: CompiledSchema, jobs: int,
+                   cache: ResultCache) -> Tuple[Dict[str, Dict], int]:
+    """
+    Validate files, reusing cached results for unchanged ones.
+    
+    Returns ({path: result}, number of files served from the cache).
+    """
+    results: Dict[str, Dict] = {}
+    work: List[Tuple] = []
+    owners: List[str] = []
+    stats: Dict[str, Tuple[os.stat_result, int]] = {}
+    cached = 0
+    
+    for file_path in files:
+        try:
+            st = os.stat(file_path)
+        except OSError as e:
+            results[file_path] = {'entries': 0, 'invalid': 0, 'violations': 0,
+                                  'error': f"Error reading {file_path}: {e}", 'violations_list': []}
+            continue
+        hit = cache.lookup(file_path, st)
+        if hit is not None:
+            results[file_path] = hit
+            cached += 1
+            continue
+        stats[file_path] = (st, time.time_ns())
+        if file_path.endswith('.jsonl') and st.st_size >= SPLIT_MIN_BYTES:
+            for start, end in split_jsonl(file_path, st.st_size, jobs * 4):
+                work.append((file_path, start, end))
+                owners.append(file_path)
+        else:
+            work.append((file_path, None, None))
+            owners.append(file_path)
+    
+    if jobs <= 1 or len(work) < PARALLEL_MIN_JOBS:
+        _init_worker(schema.schema, schema.name)
+        outputs = list(map(_run_job, work))
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker,
+                                 initargs=(schema.schema, schema.name)) as pool:
+            outputs = list(pool.map(_run_job, work))
+    
+    by_file: Dict[str, List[Dict]] = {}
+    for owner, output in zip(owners, outputs):
+        by_file.setdefault(owner, []).append(output)
+    for file_path, parts in by_file.items():
+        result = merge_ranges(parts) if 'lines' in parts[0] else parts[0]
+        results[file_path] = result
+        if 'error' not in result:
+            st, checked_ns = stats[file_path]
+            cache.store(file_path, st, checked_ns, result)
+    
+    return {path: results[path] for path in files if path in results}, cached
+
+
+def print_report(results: Dict[str, Dict], cached: int, elapsed: float, schema: CompiledSchema) -> Dict:
+    """Print violations per file and the summary; returns the summary counts"""
+    summary = {'files': len(results), 'cached_files': cached, 'entries': 0, 'invalid_entries': 0,
+               'violations': 0, 'file_errors': 0}
+    for file_path, result in results.items():
+        summary['entries'] += result['entries']
+        summary['invalid_entries'] += result['invalid']
+        summary['violations'] += result['violations']
+        if 'error' in result:
+            summary['file_errors'] += 1
+            print(f"❌ {result['error']}")
+        if result['violations_list']:
+            print(f"\n❌ {file_path}: {result['invalid']} invalid of {result['entries']} entries")
+            for violation in result['violations_list']:
+                print(f"  {violation['offset']}: {violation['path']}: {violation['message']}")
+            hidden = result['violations'] - len(result['violations_list'])
+            if hidden > 0:
+                print(f"  ... {hidden} more violations not shown")
+    
+    print(f"\n{'=' * 60}")
+    print("TENANT MEMORY VALIDATION SUMMARY")
+    print('=' * 60)
+    print(f"Schema: {schema.name} ({schema.engine})")
+    print(f"Files: {summary['files']} ({summary['cached_files']} unchanged, from cache)")
+    print(f"Entries: {summary['entries']}  Invalid: {summary['invalid_entries']}  "
+          f"Violations: {summary['violations']}")
+    print(f"Time: {elapsed:.2f}s")
+    print('=' * 60)
+    return summary
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Validate tenant memory entries (JSON / JSON Lines) against the tenant memory schema'
+    )
+    parser.add_argument(
+        'paths',
+        nargs='*',
+        metavar='PATH',
+        help=f'Entry files or directories to scan for .json/.jsonl files (default: {", ".join(DEFAULT_PATHS)})'
+    )
+    parser.add_argument(
+        '--schema',
+        default=DEFAULT_SCHEMA,
+        help=f'Tenant memory schema (default: {DEFAULT_SCHEMA})'
+    )
+    parser.add_argument(
+        '--jobs',
+        type=int,
+        default=None,
+        help='Worker processes (default: CPU count; 1 validates in-process)'
+    )
+    cache_group = parser.add_mutually_exclusive_group()
+    cache_group.add_argument(
+        '--cache-file',
+        default=CACHE_FILENAME,
+        help=f'Result cache location (default: {CACHE_FILENAME})'
+    )
+    cache_group.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Validate every file without reading or writing the result cache'
+    )
+    parser.add_argument(
+        '--json',
+        metavar='PATH',
+        help="Write the summary and violations as JSON to PATH ('-' for stdout)"
+    )
+    
+    args = parser.parse_args()
+    
+    try:
+        schema = CompiledSchema.load(args.schema)
+        with open(args.schema, 'rb') as f:
+            schema_digest = hashlib.sha256(f.read()).hexdigest()
+    except (SchemaError, OSError) as e:
+        print(f"❌ {e}")
+        sys.exit(2)
+    
+    start = time.perf_counter()
+    cache_file = None if args.no_cache else args.cache_file
+    files = list(iter_memory_files(args.paths or DEFAULT_PATHS, [args.schema, cache_file]))
+    if not files:
+        print(f"No tenant memory files (.json/.jsonl) found under {', '.join(args.paths or DEFAULT_PATHS)}")
+        sys.exit(0)
+    
+    cache = ResultCache(cache_file, schema_digest)
+    jobs = args.jobs or os.cpu_count() or 1
+    results, cached = validate_paths(files, schema, jobs, cache)
+    try:
+        cache.save(files)
+    except OSError as e:
+        print(f"Warning: could not write result cache {args.cache_file}: {e}", file=sys.stderr)
+    elapsed = time.perf_counter() - start
+    
+    stdout = sys.stdout
+    if args.json == '-':
+        # Keep stdout pure JSON; the readable report goes to stderr
+        sys.stdout = sys.stderr
+    summary = print_report(results, cached, elapsed, schema)
+    sys.stdout = stdout
+    
+    if args.json:
+        report = {
+            'schema': args.schema,
+            'engine': schema.engine,
+            'summary': summary,
+            'files': results,
+        }
+        if args.json == '-':
+            print(json.dumps(report, indent=2))
+        else:
+            with open(args.json, 'w', encoding='utf-8') as f:
+                json.dump(report, f, indent=2)
+                f.write('\n')
+    
+    failed = summary['invalid_entries'] or summary['file_errors']
+    print(f"\n{'❌ FAIL' if failed else '✅ PASS'}", file=sys.stderr if args.json == '-' else sys.stdout)
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main()